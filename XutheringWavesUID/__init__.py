@@ -43,16 +43,28 @@ async def _flush_activity_buffer():
     pending = dict(_activity_buffer)
     _activity_buffer.clear()
 
-    for key, (user_id, bot_id, bot_self_id, sender_avatar) in pending.items():
-        try:
-            await WavesUserActivity.update_user_activity(user_id, bot_id, bot_self_id)
-        except Exception as e:
-            logger.warning(f"[鸣潮·插件] 批量活跃度写入失败: {e}")
-        if sender_avatar:
+    entries = [(user_id, bot_id, bot_self_id) for user_id, bot_id, bot_self_id, _ in pending.values()]
+    try:
+        await WavesUserActivity.bulk_update_user_activity(entries)
+    except Exception as e:
+        # 批量写入失败 (如唯一索引尚未建立) 时退回逐条写入
+        logger.warning(f"[鸣潮·插件] 批量活跃度写入失败, 改为逐条写入: {e}")
+        for user_id, bot_id, bot_self_id in entries:
             try:
-                await WavesUser.update_avatar_url(user_id, bot_id, sender_avatar)
+                await WavesUserActivity.update_user_activity(user_id, bot_id, bot_self_id)
             except Exception as e:
-                logger.warning(f"[鸣潮·插件] 头像更新失败: {e}")
+                logger.warning(f"[鸣潮·插件] 活跃度写入失败: {e}")
+
+    avatars = [
+        (user_id, bot_id, sender_avatar)
+        for user_id, bot_id, _, sender_avatar in pending.values()
+        if sender_avatar
+    ]
+    if avatars:
+        try:
+            await WavesUser.update_avatar_urls(avatars)
+        except Exception as e:
+            logger.warning(f"[鸣潮·插件] 头像更新失败: {e}")
 
 
 _shutdown_event = asyncio.Event()
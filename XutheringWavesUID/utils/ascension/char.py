@@ -1,6 +1,5 @@
-import copy
 import re
-from typing import Union, Optional
+from typing import Any, Dict, Union, Optional
 
 from msgspec import json as msgjson
 
@@ -8,38 +7,47 @@ from gsuid_core.logger import logger
 
 from .model import CharacterModel
 from .constant import fixed_name, sum_percentages
+from .snapshot import VersionedCache, reload_snapshot, current_snapshot
 from ..resource.RESOURCE_PATH import MAP_DETAIL_PATH
 
 MAP_PATH = MAP_DETAIL_PATH / "char"
-char_id_data = {}
-_data_loaded = False
 
+# 固有技能汇总只取决于角色和是否已过三突, 按 (char_id, breach >= 3) 缓存, 快照换版本时清空
+_fixed_skill_cache = VersionedCache()
 
-def read_char_json_files(directory):
-    global char_id_data
+
+def read_char_json_files(directory) -> Dict[str, Any]:
+    """读取目录下全部角色 json 为新表, 不改动当前快照, 可在线程中执行"""
+    data = {}
     files = directory.rglob("*.json")
 
     for file in files:
         try:
             with open(file, "r", encoding="utf-8") as f:
-                data = msgjson.decode(f.read())
                 file_name = file.name.split(".")[0]
-                char_id_data[file_name] = data
+                data[file_name] = msgjson.decode(f.read())
         except Exception as e:
             logger.exception(f"[鸣潮·角色升级] read_char_json_files load fail decoding {file}", e)
+    return data
+
+
+def load_table() -> Optional[Dict[str, Any]]:
+    """读取当前资源目录的角色数据, 目录不存在时返回 None"""
+    if not MAP_PATH.exists():
+        return None
+    return read_char_json_files(MAP_PATH)
 
 
 def ensure_data_loaded(force: bool = False):
     """确保角色数据已加载
 
     Args:
-        force: 如果为 True，强制重新加载所有数据，即使已经加载过
+        force: 如果为 True，强制重新读取并发布新的升级数据快照
     """
-    global _data_loaded
-    if (_data_loaded and not force) or not MAP_PATH.exists():
-        return
-    read_char_json_files(MAP_PATH)
-    _data_loaded = True
+    if force:
+        reload_snapshot()
+    else:
+        current_snapshot()
 
 
 class WavesCharResult:
@@ -114,37 +122,18 @@ def extract_param_index(skill_desc: str, search_pattern: str) -> Optional[int]:
     return None
 
 
-def get_char_detail(char_id: Union[str, int], level: int, breach: Union[int, None] = None) -> WavesCharResult:
-    """
-    breach 突破
-    resonLevel 谐振
-    """
-    ensure_data_loaded()
-    result = WavesCharResult()
-    if str(char_id) not in char_id_data:
-        logger.exception(f"[鸣潮·角色升级] get_char_detail char_id: {char_id} not found")
-        return result
-
-    breach = get_breach(breach, level)
-
-    char_data = char_id_data[str(char_id)]
-    result.name = char_data["name"]
-    result.starLevel = char_data["starLevel"]
-    result.stats = copy.deepcopy(char_data["stats"][str(breach)][str(level)])
-    result.statsWeakness = copy.deepcopy(char_data["statsWeakness"])
-    result.skillTrees = char_data["skillTree"]
-
-    char_data["skillTree"].items()
+def _build_fixed_skill(char_id: str, char_data: Dict, breach: int) -> Dict[str, str]:
+    fixed_skill = {}
     for key, value in char_data["skillTree"].items():
         skill_info = value.get("skill", {})
         name = skill_info.get("name", "")
         if name in fixed_name and breach >= 3:
             name = name.replace("提升", "").replace("全", "")
-            if name not in result.fixed_skill:
-                result.fixed_skill[name] = "0%"
+            if name not in fixed_skill:
+                fixed_skill[name] = "0%"
 
             try:
-                result.fixed_skill[name] = sum_percentages(skill_info["param"][0], result.fixed_skill[name])
+                fixed_skill[name] = sum_percentages(skill_info["param"][0], fixed_skill[name])
             except (IndexError, KeyError, TypeError) as e:
                 logger.warning(f"[鸣潮·角色升级] get_char_detail param[0] failed for char_id {char_id}, skill {name}: {e}")
 
@@ -152,8 +141,8 @@ def get_char_detail(char_id: Union[str, int], level: int, breach: Union[int, Non
             for i, orig_name in enumerate(fixed_name):
                 if skill_info["desc"].startswith(orig_name) or skill_info["desc"].startswith(f"{char_data['name']}的{orig_name}"):
                     name = orig_name.replace("提升", "").replace("全", "")
-                    if name not in result.fixed_skill:
-                        result.fixed_skill[name] = "0%"
+                    if name not in fixed_skill:
+                        fixed_skill[name] = "0%"
 
                     # Use original name (with 提升) for pattern matching in desc
                     search_pattern = orig_name if skill_info["desc"].startswith(orig_name) else f"{char_data['name']}的{orig_name}"
@@ -163,15 +152,47 @@ def get_char_detail(char_id: Union[str, int], level: int, breach: Union[int, Non
                         desc_text = re.sub(r'<[^>]+>', '', skill_info.get("desc", ""))
                         match = re.search(re.escape(search_pattern) + r'(\d+(?:\.\d+)?%?)', desc_text)
                         if match:
-                            result.fixed_skill[name] = sum_percentages(match.group(1), result.fixed_skill[name])
+                            fixed_skill[name] = sum_percentages(match.group(1), fixed_skill[name])
                         else:
                             logger.warning(f"[鸣潮·角色升级] get_char_detail extract_param failed for char_id {char_id}, skill {name}")
                     else:
                         try:
                             param_value = skill_info["param"][param_index]
-                            result.fixed_skill[name] = sum_percentages(param_value, result.fixed_skill[name])
+                            fixed_skill[name] = sum_percentages(param_value, fixed_skill[name])
                         except (IndexError, KeyError, TypeError) as e:
                             logger.warning(f"[鸣潮·角色升级] get_char_detail param[{param_index}] failed for char_id {char_id}, skill {name}: {e}")
+    return fixed_skill
+
+
+def get_char_detail(char_id: Union[str, int], level: int, breach: Union[int, None] = None) -> WavesCharResult:
+    """
+    breach 突破
+    resonLevel 谐振
+
+    面板数值表与固有技能汇总都是扁平 dict, 返回浅拷贝即可, 调用方修改不会污染缓存
+    """
+    snapshot = current_snapshot()
+    char_id_data = snapshot.char
+    result = WavesCharResult()
+    if str(char_id) not in char_id_data:
+        logger.exception(f"[鸣潮·角色升级] get_char_detail char_id: {char_id} not found")
+        return result
+
+    breach = get_breach(breach, level)
+
+    char_data = char_id_data[str(char_id)]
+    result.name = char_data["name"]
+    result.starLevel = char_data["starLevel"]
+    result.stats = dict(char_data["stats"][str(breach)][str(level)])
+    result.statsWeakness = dict(char_data["statsWeakness"])
+    result.skillTrees = char_data["skillTree"]
+
+    cache_key = (str(char_id), breach >= 3)
+    fixed_skill_cache = _fixed_skill_cache.sync(snapshot.version)
+    fixed_skill = fixed_skill_cache.get(cache_key)
+    if fixed_skill is None:
+        fixed_skill = fixed_skill_cache[cache_key] = _build_fixed_skill(str(char_id), char_data, breach)
+    result.fixed_skill = dict(fixed_skill)
 
     return result
 
@@ -184,7 +205,7 @@ def get_char_detail2(role) -> WavesCharResult:
 
 
 def get_char_id(char_name, loose: bool = False) -> Optional[str]:
-    ensure_data_loaded()
+    char_id_data = current_snapshot().char
     exact = next((_id for _id, value in char_id_data.items() if value["name"] == char_name), None)
     if exact is not None or not loose:
         return exact
@@ -204,7 +225,7 @@ def get_char_id(char_name, loose: bool = False) -> Optional[str]:
 
 
 def get_char_model(char_id: Union[str, int]) -> Optional[CharacterModel]:
-    ensure_data_loaded()
+    char_id_data = current_snapshot().char
     if str(char_id) not in char_id_data:
         return None
     model = CharacterModel(**char_id_data[str(char_id)])
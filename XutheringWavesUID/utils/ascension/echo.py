@@ -1,46 +1,52 @@
-from typing import Union, Optional
+from typing import Any, Dict, Union, Optional
 
 from msgspec import json as msgjson
 
 from gsuid_core.logger import logger
 
 from .model import EchoModel
+from .snapshot import reload_snapshot, current_snapshot
 from ..resource.RESOURCE_PATH import MAP_DETAIL_PATH
 
 MAP_PATH = MAP_DETAIL_PATH / "echo"
-echo_id_data = {}
-_data_loaded = False
 
 
-def read_echo_json_files(directory):
-    global echo_id_data
+def read_echo_json_files(directory) -> Dict[str, Any]:
+    """读取目录下全部声骸 json 为新表, 不改动当前快照, 可在线程中执行"""
+    data = {}
     files = directory.rglob("*.json")
 
     for file in files:
         try:
             with open(file, "r", encoding="utf-8") as f:
-                data = msgjson.decode(f.read())
                 file_name = file.name.split(".")[0]
-                echo_id_data[file_name] = data
+                data[file_name] = msgjson.decode(f.read())
         except Exception as e:
             logger.exception(f"[鸣潮·声骸升级] read_echo_json_files load fail decoding {file}", e)
+    return data
+
+
+def load_table() -> Optional[Dict[str, Any]]:
+    """读取当前资源目录的声骸数据, 目录不存在时返回 None"""
+    if not MAP_PATH.exists():
+        return None
+    return read_echo_json_files(MAP_PATH)
 
 
 def ensure_data_loaded(force: bool = False):
     """确保声骸数据已加载
 
     Args:
-        force: 如果为 True，强制重新加载所有数据，即使已经加载过
+        force: 如果为 True，强制重新读取并发布新的升级数据快照
     """
-    global _data_loaded
-    if (_data_loaded and not force) or not MAP_PATH.exists():
-        return
-    read_echo_json_files(MAP_PATH)
-    _data_loaded = True
+    if force:
+        reload_snapshot()
+    else:
+        current_snapshot()
 
 
 def get_echo_model(echo_id: Union[int, str]) -> Optional[EchoModel]:
-    ensure_data_loaded()
+    echo_id_data = current_snapshot().echo
     if str(echo_id) not in echo_id_data:
         return None
     return EchoModel(**echo_id_data[str(echo_id)])
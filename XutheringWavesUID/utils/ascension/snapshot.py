@@ -0,0 +1,84 @@
+"""升级数据 (角色/武器/声骸/合鸣) 的不可变快照。
+
+load_tables 只读文件、不碰全局状态, 可放在线程中执行; publish_snapshot 以一次
+引用替换发布整份快照。读者先取 current_snapshot() 再取表, 同一次读取内看到的
+必然是同一版本的全部数据。version 每次发布递增, 下游 memo 据此判断失效。
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+from dataclasses import dataclass
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class DataSnapshot:
+    version: int
+    char: Mapping[str, Any]
+    weapon: Mapping[str, Any]
+    echo: Mapping[str, Any]
+    sonata: Mapping[str, Any]
+    sonata_name_to_id: Mapping[str, str]
+
+
+_current: Optional[DataSnapshot] = None
+_publish_lock = threading.Lock()
+
+
+def load_tables() -> Dict[str, Optional[Dict[str, Any]]]:
+    """读取全部升级数据。目录或文件缺失的表为 None, 发布时沿用上一版本"""
+    from . import char, echo, sonata, weapon
+
+    return {
+        "char": char.load_table(),
+        "weapon": weapon.load_table(),
+        "echo": echo.load_table(),
+        "sonata": sonata.load_table(),
+        "sonata_name_to_id": sonata.read_sonata_name_mapping(),
+    }
+
+
+def publish_snapshot(tables: Dict[str, Optional[Dict[str, Any]]]) -> DataSnapshot:
+    global _current
+    with _publish_lock:
+        prev = _current
+        fields: Dict[str, Mapping[str, Any]] = {}
+        for name in ("char", "weapon", "echo", "sonata", "sonata_name_to_id"):
+            table = tables.get(name)
+            if table is not None:
+                fields[name] = MappingProxyType(table)
+            else:
+                fields[name] = getattr(prev, name) if prev is not None else _EMPTY
+        snapshot = DataSnapshot(version=prev.version + 1 if prev else 1, **fields)
+        _current = snapshot
+    return snapshot
+
+
+def reload_snapshot() -> DataSnapshot:
+    return publish_snapshot(load_tables())
+
+
+def current_snapshot() -> DataSnapshot:
+    """当前快照, 尚未发布过时就地加载一次"""
+    snapshot = _current
+    if snapshot is None:
+        snapshot = reload_snapshot()
+    return snapshot
+
+
+def data_version() -> int:
+    return current_snapshot().version
+
+
+class VersionedCache(dict):
+    """跟随快照版本失效的 memo 表, 取用前调用 sync(version), 版本变化即清空"""
+
+    version = 0
+
+    def sync(self, version: int) -> "VersionedCache":
+        if self.version != version:
+            self.clear()
+            self.version = version
+        return self
@@ -1,61 +1,64 @@
-from typing import Dict, List, Union, Optional
+from typing import Any, Dict, List, Union, Optional
 
 from msgspec import json as msgjson
 from pydantic import Field, BaseModel
 
 from gsuid_core.logger import logger
 
+from .snapshot import reload_snapshot, current_snapshot
 from ..resource.RESOURCE_PATH import MAP_PATH, MAP_DETAIL_PATH
 
 MAP_PATH_SONATA = MAP_DETAIL_PATH / "sonata"
 SONATA_ID_MAP_PATH = MAP_PATH / "sonata_id.json"
 
-sonata_id_data = {}
-sonata_name_to_id = {}  # 中文名称 -> ID 映射
-_data_loaded = False
 
-
-def read_sonata_json_files(directory):
-    global sonata_id_data
+def read_sonata_json_files(directory) -> Dict[str, Any]:
+    """读取目录下全部合鸣 json 为新表, 不改动当前快照, 可在线程中执行"""
+    data = {}
     files = directory.rglob("*.json")
 
     for file in files:
         try:
             with open(file, "r", encoding="utf-8") as f:
-                data = msgjson.decode(f.read())
                 file_name = file.name.split(".")[0]
-                sonata_id_data[file_name] = data
+                data[file_name] = msgjson.decode(f.read())
         except Exception as e:
             logger.exception(f"[鸣潮·合鸣] read_char_json_files load fail decoding {file}", e)
+    return data
 
 
-def load_sonata_name_mapping():
-    """加载 sonata_id.json 映射文件"""
-    global sonata_name_to_id
+def read_sonata_name_mapping() -> Optional[Dict[str, str]]:
+    """读取 sonata_id.json 并返回 名称 -> ID 映射, 读取失败返回 None"""
     try:
         if SONATA_ID_MAP_PATH.exists():
             with open(SONATA_ID_MAP_PATH, "r", encoding="utf-8") as f:
                 id_to_name = msgjson.decode(f.read())
                 # 反向映射：名称 -> ID
-                sonata_name_to_id = {v: k for k, v in id_to_name.items()}
+                return {v: k for k, v in id_to_name.items()}
         else:
             logger.warning(f"[鸣潮·合鸣] sonata_id.json not found at {SONATA_ID_MAP_PATH}")
     except Exception as e:
         logger.exception("[鸣潮·合鸣] Failed to load sonata_id.json mapping", e)
+    return None
+
+
+def load_table() -> Optional[Dict[str, Any]]:
+    """读取当前资源目录的合鸣数据, 目录不存在时返回 None"""
+    if not MAP_PATH_SONATA.exists():
+        return None
+    return read_sonata_json_files(MAP_PATH_SONATA)
 
 
 def ensure_data_loaded(force: bool = False):
     """确保合鸣数据已加载
 
     Args:
-        force: 如果为 True，强制重新加载所有数据，即使已经加载过
+        force: 如果为 True，强制重新读取并发布新的升级数据快照
     """
-    global _data_loaded
-    if (_data_loaded and not force) or not MAP_PATH_SONATA.exists():
-        return
-    read_sonata_json_files(MAP_PATH_SONATA)
-    load_sonata_name_mapping()
-    _data_loaded = True
+    if force:
+        reload_snapshot()
+    else:
+        current_snapshot()
 
 
 class SonataSet(BaseModel):
@@ -78,7 +81,9 @@ class WavesSonataResult(BaseModel):
 
 
 def get_sonata_detail(sonata_name: Optional[str]) -> WavesSonataResult:
-    ensure_data_loaded()
+    snapshot = current_snapshot()
+    sonata_id_data = snapshot.sonata
+    sonata_name_to_id = snapshot.sonata_name_to_id
     result = WavesSonataResult()
     if sonata_name is None:
         logger.exception(f"[鸣潮·合鸣] get_sonata_detail sonata_name: {sonata_name} not found")
@@ -108,7 +113,7 @@ COMBO_SONATA_RULES: Dict[int, Dict] = {
 
 def get_2pc_sonata_names(keywords: List[str]) -> List[str]:
     """返回具备 2 件效果、且 2 件 effect/desc 命中任一关键字的套装名 (排除 3 件/1 件套)。"""
-    ensure_data_loaded()
+    sonata_id_data = current_snapshot().sonata
     names = []
     for data in sonata_id_data.values():
         two = (data.get("set") or {}).get("2")
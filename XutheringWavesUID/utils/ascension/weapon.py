@@ -1,5 +1,4 @@
-import copy
-from typing import Union, Optional
+from typing import Any, Dict, List, Tuple, Union, Optional
 
 from msgspec import json as msgjson
 
@@ -7,38 +6,48 @@ from gsuid_core.logger import logger
 
 from .model import WeaponModel
 from .constant import fixed_name
+from .snapshot import VersionedCache, reload_snapshot, current_snapshot
 from ..resource.RESOURCE_PATH import MAP_DETAIL_PATH
 
 MAP_PATH = MAP_DETAIL_PATH / "weapon"
-weapon_id_data = {}
-_data_loaded = False
 
+# 格式化后的面板数值 (按 id/突破/等级) 与效果描述 (按 id/谐振) 缓存, 快照换版本时清空
+_stats_cache = VersionedCache()
+_effect_cache = VersionedCache()
 
-def read_weapon_json_files(directory):
-    global weapon_id_data
+
+def read_weapon_json_files(directory) -> Dict[str, Any]:
+    """读取目录下全部武器 json 为新表, 不改动当前快照, 可在线程中执行"""
+    data = {}
     files = directory.rglob("*.json")
 
     for file in files:
         try:
             with open(file, "r", encoding="utf-8") as f:
-                data = msgjson.decode(f.read())
                 file_name = file.name.split(".")[0]
-                weapon_id_data[file_name] = data
+                data[file_name] = msgjson.decode(f.read())
         except Exception as e:
             logger.exception(f"[鸣潮·武器升级] read_weapon_json_files load fail decoding {file}", e)
+    return data
+
+
+def load_table() -> Optional[Dict[str, Any]]:
+    """读取当前资源目录的武器数据, 目录不存在时返回 None"""
+    if not MAP_PATH.exists():
+        return None
+    return read_weapon_json_files(MAP_PATH)
 
 
 def ensure_data_loaded(force: bool = False):
     """确保武器数据已加载
 
     Args:
-        force: 如果为 True，强制重新加载所有数据，即使已经加载过
+        force: 如果为 True，强制重新读取并发布新的升级数据快照
     """
-    global _data_loaded
-    if (_data_loaded and not force) or not MAP_PATH.exists():
-        return
-    read_weapon_json_files(MAP_PATH)
-    _data_loaded = True
+    if force:
+        reload_snapshot()
+    else:
+        current_snapshot()
 
 
 class WavesWeaponResult:
@@ -76,6 +85,33 @@ def get_breach(breach: Union[int, None], level: int):
     return breach
 
 
+def _format_stats(weapon_data: Dict, breach: Optional[int], level: int) -> List[Dict]:
+    stats = [dict(stat) for stat in weapon_data["stats"][str(breach)][str(level)]]
+    for stat in stats:
+        if stat["isPercent"]:
+            stat["value"] = f"{stat['value'] / 100:.1f}%"
+        elif stat["isRatio"]:
+            stat["value"] = f"{stat['value'] * 100:.1f}%"
+        else:
+            stat["value"] = f"{int(stat['value'])}"
+    return stats
+
+
+def _format_effect(weapon_data: Dict, resonLevel: int) -> Tuple[str, Dict]:
+    effect = weapon_data["effect"]
+    for i, p in enumerate(weapon_data["param"]):
+        _temp = "{" + str(i) + "}"
+        effect = effect.replace(f"{_temp}", str(p[min(resonLevel, len(p)) - 1]))
+
+    sub_effect = {}
+    for i, v in enumerate(fixed_name):
+        if effect.startswith(v):
+            value = weapon_data["param"][0][resonLevel - 1]
+            name = v.replace("提升", "").replace("全", "")
+            sub_effect = {"name": name, "value": f"{value}"}
+    return effect, sub_effect
+
+
 def get_weapon_detail(
     weapon_id: Union[str, int],
     level: int,
@@ -85,8 +121,11 @@ def get_weapon_detail(
     """
     breach 突破
     resonLevel 谐振
+
+    数值与效果描述格式化后缓存, 返回时只做扁平拷贝, 调用方修改不会污染缓存
     """
-    ensure_data_loaded()
+    snapshot = current_snapshot()
+    weapon_id_data = snapshot.weapon
     result = WavesWeaponResult()
     if str(weapon_id) not in weapon_id_data:
         return result
@@ -98,37 +137,32 @@ def get_weapon_detail(
     result.starLevel = weapon_data["starLevel"]
     result.type = weapon_data["type"]
     result.effectName = weapon_data["effectName"]
-    result.stats = copy.deepcopy(weapon_data["stats"][str(breach)][str(level)])
+
+    stats_key = (str(weapon_id), breach, level)
+    stats_cache = _stats_cache.sync(snapshot.version)
+    stats = stats_cache.get(stats_key)
+    if stats is None:
+        stats = stats_cache[stats_key] = _format_stats(weapon_data, breach, level)
+    result.stats = [dict(stat) for stat in stats]
+
     result.param = weapon_data["param"]
-    effect = weapon_data["effect"]
     if resonLevel is None:
         resonLevel = 1
     result.resonLevel = resonLevel
-    for i, p in enumerate(weapon_data["param"]):
-        _temp = "{" + str(i) + "}"
-        effect = effect.replace(f"{_temp}", str(p[min(resonLevel, len(p)) - 1]))
-    result.effect = effect
 
-    for stat in result.stats:
-        if stat["isPercent"]:
-            stat["value"] = f"{stat['value'] / 100:.1f}%"
-        elif stat["isRatio"]:
-            stat["value"] = f"{stat['value'] * 100:.1f}%"
-        else:
-            stat["value"] = f"{int(stat['value'])}"
-
-    result.sub_effect = {}
-    for i, v in enumerate(fixed_name):
-        if result.effect.startswith(v):
-            value = weapon_data["param"][0][resonLevel - 1]
-            name = v.replace("提升", "").replace("全", "")
-            result.sub_effect = {"name": name, "value": f"{value}"}
+    effect_key = (str(weapon_id), resonLevel)
+    effect_cache = _effect_cache.sync(snapshot.version)
+    cached = effect_cache.get(effect_key)
+    if cached is None:
+        cached = effect_cache[effect_key] = _format_effect(weapon_data, resonLevel)
+    result.effect = cached[0]
+    result.sub_effect = dict(cached[1])
 
     return result
 
 
 def get_weapon_id(weapon_name, loose: bool = False) -> Optional[str]:
-    ensure_data_loaded()
+    weapon_id_data = current_snapshot().weapon
     if not loose:
         return next(
             (_id for _id, value in weapon_id_data.items() if value["name"] == weapon_name),
@@ -146,7 +180,6 @@ def get_weapon_id(weapon_name, loose: bool = False) -> Optional[str]:
 
 
 def get_weapon_star(weapon_name) -> int:
-    ensure_data_loaded()
     weapon_id = get_weapon_id(weapon_name)
     if weapon_id is None:
         return 4
@@ -158,7 +191,7 @@ def get_weapon_star(weapon_name) -> int:
 
 
 def get_weapon_model(weapon_id: Union[int, str]) -> Optional[WeaponModel]:
-    ensure_data_loaded()
+    weapon_id_data = current_snapshot().weapon
     if str(weapon_id) not in weapon_id_data:
         return None
     return WeaponModel(**weapon_id_data[str(weapon_id)])
@@ -0,0 +1,246 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Dict, List, Tuple, Union, Optional
+from pathlib import Path
+from contextlib import closing
+
+from gsuid_core.logger import logger
+
+from .resource.RESOURCE_PATH import (
+    BAKE_PATH,
+    CACHE_PATH,
+    ANN_CARD_PATH,
+    CALENDAR_PATH,
+)
+
+CACHE_INDEX_PATH = CACHE_PATH / "cache_index.db"
+
+# 受管缓存目录: 名称 → (目录, 是否递归)
+CACHE_ROOTS: Dict[str, Tuple[Path, bool]] = {
+    "ann": (ANN_CARD_PATH, False),
+    "calendar": (CALENDAR_PATH, False),
+    "bake": (BAKE_PATH, True),
+}
+
+# 内存缓冲超过该条数就落盘, 否则等下一次清理切片
+FLUSH_THRESHOLD = 500
+
+
+class CacheJanitor:
+    """缓存目录清理器。
+
+    写缓存文件时登记 (path, size, created), 命中时更新 atime, 先在内存缓冲,
+    清理时批量写入 sqlite 索引。清理按索引查询过期 / 超预算的文件,
+    不再遍历目录; 每个目录仅首次使用 (或手动 reset_roots) 时全量扫描一次建立索引。
+    缓冲满时在后台线程落盘, record 可在事件循环中直接调用。
+    """
+
+    def __init__(self, db_path: Path = CACHE_INDEX_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[str, int, float]] = {}
+        self._touched: Dict[str, float] = {}
+        self._roots = {name: str(path.resolve()) for name, (path, _) in CACHE_ROOTS.items()}
+        self._ready = False
+        self._flushing = False
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=5.0)
+
+    def _init_db(self):
+        if self._ready:
+            return
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache_files ("
+                    "path TEXT PRIMARY KEY, root TEXT NOT NULL, size INTEGER NOT NULL, "
+                    "created REAL NOT NULL, atime REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_files_created ON cache_files (root, created)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_files_atime ON cache_files (atime)")
+                conn.execute("CREATE TABLE IF NOT EXISTS cache_roots (root TEXT PRIMARY KEY, scanned REAL NOT NULL)")
+        self._ready = True
+
+    def _root_of(self, path: Path) -> Optional[str]:
+        parent = str(path.parent.resolve())
+        for name, root in self._roots.items():
+            if parent == root or (CACHE_ROOTS[name][1] and parent.startswith(root + os.sep)):
+                return name
+        return None
+
+    def record(self, path: Union[str, Path], size: Optional[int] = None) -> None:
+        """登记新写入的缓存文件, 非受管目录直接忽略"""
+        path = Path(path)
+        root = self._root_of(path)
+        if root is None:
+            return
+        if size is None:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                return
+        now = time.time()
+        with self._lock:
+            self._pending[str(path)] = (root, size, now)
+            need_flush = len(self._pending) >= FLUSH_THRESHOLD and not self._flushing
+            if need_flush:
+                self._flushing = True
+        if need_flush:
+            threading.Thread(target=self._background_flush, name="ww-cache-janitor", daemon=True).start()
+
+    def touch(self, path: Union[str, Path]) -> None:
+        """缓存命中时更新访问时间, 用于按预算 LRU 淘汰"""
+        with self._lock:
+            self._touched[str(path)] = time.time()
+
+    def _background_flush(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._flushing = False
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            touched, self._touched = self._touched, {}
+        if not pending and not touched:
+            return
+        try:
+            self._init_db()
+            with closing(self._connect()) as conn:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO cache_files (path, root, size, created, atime) VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT(path) DO UPDATE SET size = excluded.size, "
+                        "created = excluded.created, atime = excluded.atime",
+                        [(p, root, size, ts, ts) for p, (root, size, ts) in pending.items()],
+                    )
+                    conn.executemany(
+                        "UPDATE cache_files SET atime = ? WHERE path = ?",
+                        [(ts, p) for p, ts in touched.items()],
+                    )
+        except Exception as e:
+            logger.warning(f"[鸣潮·缓存清理] 写入缓存索引失败: {e}")
+
+    def _bootstrap(self, conn: sqlite3.Connection, name: str) -> None:
+        """目录首次纳入索引 (或 reset_roots 后) 全量扫描一次, 并移除已不存在文件的索引行"""
+        if conn.execute("SELECT 1 FROM cache_roots WHERE root = ?", (name,)).fetchone():
+            return
+        directory, recursive = CACHE_ROOTS[name]
+        rows: List[Tuple[str, str, int, float, float]] = []
+        stack = [directory] if directory.exists() else []
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except FileNotFoundError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(Path(entry.path))
+                            continue
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        # 扫描途中被删除的文件直接跳过
+                        continue
+                    rows.append((entry.path, name, st.st_size, st.st_ctime, st.st_atime))
+        found = {r[0] for r in rows}
+        gone = [
+            (p,) for (p,) in conn.execute("SELECT path FROM cache_files WHERE root = ?", (name,))
+            if p not in found
+        ]
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO cache_files VALUES (?, ?, ?, ?, ?)", rows)
+            conn.executemany("DELETE FROM cache_files WHERE path = ?", gone)
+            conn.execute("INSERT OR REPLACE INTO cache_roots VALUES (?, ?)", (name, time.time()))
+        logger.info(f"[鸣潮·缓存清理] 扫描缓存目录: {name} {len(rows)} 个文件, 移除失效索引 {len(gone)} 条")
+
+    def reset_roots(self) -> None:
+        """下次清理时重新全量扫描各目录, 用于纠正未登记的外部写入"""
+        self._init_db()
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.execute("DELETE FROM cache_roots")
+
+    @staticmethod
+    def _unlink(rows) -> Tuple[List[str], Dict[str, Tuple[int, int]]]:
+        removed: List[str] = []
+        stats: Dict[str, Tuple[int, int]] = {}
+        for path, root, size in rows:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"[鸣潮·缓存清理] 删除文件失败 {path}: {e}")
+                continue
+            else:
+                count, total = stats.get(root, (0, 0))
+                stats[root] = (count + 1, total + size)
+            removed.append(path)
+        return removed, stats
+
+    def clean(
+        self,
+        days: int,
+        budget_bytes: int = 0,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Tuple[int, int]]:
+        """按索引清理, 返回 {目录名: (删除数, 释放字节)}。
+
+        先删创建时间早于 days 天的文件, 再在总大小超过 budget_bytes 时
+        按访问时间从旧到新淘汰; limit 限制本次最多删除的文件数, 用于分片清理。
+        """
+        self.flush()
+        self._init_db()
+        result: Dict[str, Tuple[int, int]] = {}
+
+        def _merge(stats):
+            for root, (c, s) in stats.items():
+                count, total = result.get(root, (0, 0))
+                result[root] = (count + c, total + s)
+
+        remaining = limit
+        cutoff = time.time() - days * 86400
+        with closing(self._connect()) as conn:
+            for name in CACHE_ROOTS:
+                self._bootstrap(conn, name)
+
+            sql = "SELECT path, root, size FROM cache_files WHERE created < ? ORDER BY created"
+            params: tuple = (cutoff,)
+            if remaining is not None:
+                sql += " LIMIT ?"
+                params += (remaining,)
+            removed, stats = self._unlink(conn.execute(sql, params).fetchall())
+            with conn:
+                conn.executemany("DELETE FROM cache_files WHERE path = ?", [(p,) for p in removed])
+            _merge(stats)
+            if remaining is not None:
+                remaining -= len(removed)
+
+            if budget_bytes > 0 and (remaining is None or remaining > 0):
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_files").fetchone()[0]
+                over = total - budget_bytes
+                if over > 0:
+                    victims = []
+                    cursor = conn.execute("SELECT path, root, size FROM cache_files ORDER BY atime")
+                    for row in cursor:
+                        if over <= 0 or (remaining is not None and len(victims) >= remaining):
+                            break
+                        victims.append(row)
+                        over -= row[2]
+                    removed, stats = self._unlink(victims)
+                    with conn:
+                        conn.executemany("DELETE FROM cache_files WHERE path = ?", [(p,) for p in removed])
+                    _merge(stats)
+        return result
+
+
+cache_janitor = CacheJanitor()
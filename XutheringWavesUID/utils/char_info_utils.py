@@ -3,14 +3,14 @@ from typing import Any, Dict, Union, Generator
 from .api.model import RoleDetailData
 from .player_store import read_player_json
 from .resource.constant import SPECIAL_CHAR, SPECIAL_CHAR_RANK_MAP
-from .resource.RESOURCE_PATH import PLAYER_PATH
+from .player_path import player_dir
 
 PATTERN = r"[\u4e00-\u9fa5a-zA-Z0-9\U0001F300-\U0001FAFF\U00002600-\U000027BF\U00002B00-\U00002BFF\U00003200-\U000032FF-—·()（）]{1,15}"
 
 async def get_all_role_detail_info_list(
     uid: str,
 ) -> Union[Generator[RoleDetailData, Any, None], None]:
-    path = PLAYER_PATH / uid / "rawData.json"
+    path = player_dir(uid) / "rawData.json"
     player_data = await read_player_json(path)
     if not player_data:
         return None
@@ -45,7 +45,7 @@ async def get_all_roleid_detail_info_int(
 
 async def get_rover_detail_map(uid: str) -> Dict[str, RoleDetailData]:
     """读 rover.json → {canonical_id: RoleDetailData}。"""
-    data = await read_player_json(PLAYER_PATH / uid / "rover.json")
+    data = await read_player_json(player_dir(uid) / "rover.json")
     if not data:
         return {}
     out: Dict[str, RoleDetailData] = {}
@@ -11,11 +11,11 @@ from typing import Any, Dict, Optional
 import aiofiles
 from gsuid_core.logger import logger
 
-from .resource.RESOURCE_PATH import PLAYER_PATH
+from .player_path import player_dir
 
 
 def _state_path(uid: str) -> Path:
-    return PLAYER_PATH / uid / "state.json"
+    return player_dir(uid) / "state.json"
 
 
 def _default_char_record() -> Dict[str, Any]:
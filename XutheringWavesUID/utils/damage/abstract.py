@@ -1,10 +1,10 @@
 import sys
 import types
-from typing import List, Union, Optional
+from typing import Dict, List, Tuple, Union, Callable, Optional, FrozenSet
 
 from gsuid_core.logger import logger
 
-from .damage import DamageAttribute
+from .damage import DamageAttribute, percent_table, calc_weapon_percent
 
 # 跨命名空间共享: 锚定到 sys.modules 防止 abstract.py 在新命名空间重 exec 时
 # 五个 Register 子类拿到全新空 dict。
@@ -20,12 +20,24 @@ def _shared_map(cls_name):
     return _REGISTRY.setdefault(cls_name, {})
 
 
+def set_lazy_loader(loader: Optional[Callable[[str], None]]):
+    """设置按需加载钩子: lazy 注册表 find_class 未命中时以 id 调用一次, 由它完成注册"""
+    _state.lazy_loader = loader
+
+
 class WavesRegister(object):
     _id_cls_map = _shared_map("WavesRegister")
+    _lazy = False
 
     @classmethod
     def find_class(cls, _id):
-        return cls._id_cls_map.get(_id)
+        clz = cls._id_cls_map.get(_id)
+        if clz is None and cls._lazy:
+            loader = getattr(_state, "lazy_loader", None)
+            if loader is not None:
+                loader(str(_id))
+                clz = cls._id_cls_map.get(_id)
+        return clz
 
     @classmethod
     def register_class(cls, _id, _clz):
@@ -50,14 +62,31 @@ class WavesCharRegister(WavesRegister):
 
 class DamageDetailRegister(WavesRegister):
     _id_cls_map = _shared_map("DamageDetailRegister")
+    _lazy = True
 
 
 class DamageRankRegister(WavesRegister):
     _id_cls_map = _shared_map("DamageRankRegister")
+    _lazy = True
 
 
 class ScoreDetailRegister(WavesRegister):
     _id_cls_map = _shared_map("ScoreDetailRegister")
+    _lazy = True
+
+
+# do_action 按属性追加的钩子, 顺序即调用顺序
+_ENV_HOOKS: Tuple[Tuple[str, Callable[[DamageAttribute], bool]], ...] = (
+    ("env_spectro", lambda attr: attr.env_spectro),
+    ("env_aero_erosion", lambda attr: attr.env_aero_erosion),
+    ("env_havoc_bane", lambda attr: attr.env_havoc_bane),
+    ("env_fusion_burst", lambda attr: attr.env_fusion_burst),
+    ("env_glacio_chafe", lambda attr: attr.env_glacio_chafe),
+    ("env_tune_rupture", lambda attr: attr.env_tune_rupture),
+    ("env_tune_strain", lambda attr: attr.env_tune_strain),
+    ("env_tune_shifting", lambda attr: attr.env_tune_shifting()),
+    ("trigger_shield", lambda attr: attr.trigger_shield),
+)
 
 
 class WeaponAbstract(object):
@@ -65,6 +94,9 @@ class WeaponAbstract(object):
     type = None
     name = None
 
+    _dispatch_overrides: FrozenSet[str] = frozenset()
+    _dispatch_plans: Dict[Tuple[Tuple[str, ...], int], Tuple[Callable, ...]] = {}
+
     def __init__(
         self,
         weapon_id: Union[str, int],
@@ -83,6 +115,7 @@ class WeaponAbstract(object):
         self.weapon_breach = weapon_breach
         self.weapon_reson_level = weapon_reson_level
         self.weapon_detail: WavesWeaponResult = weapon_detail
+        self._percent_values = percent_table(weapon_id, weapon_reson_level)
 
     def do_action(
         self,
@@ -90,48 +123,53 @@ class WeaponAbstract(object):
         attr: DamageAttribute,
         isGroup: bool = False,
     ):
-        if isinstance(func_list, str):
-            func_list = [func_list]
-
-        if isGroup:
-            func_list.append("cast_variation")
-
-        if attr.env_spectro:
-            func_list.append("env_spectro")
-
-        if attr.env_aero_erosion:
-            func_list.append("env_aero_erosion")
-
-        if attr.env_havoc_bane:
-            func_list.append("env_havoc_bane")
-
-        if attr.env_fusion_burst:
-            func_list.append("env_fusion_burst")
-
-        if attr.env_glacio_chafe:
-            func_list.append("env_glacio_chafe")
-
-        if attr.env_tune_rupture:
-            func_list.append("env_tune_rupture")
-
-        if attr.env_tune_strain:
-            func_list.append("env_tune_strain")
-
-        if attr.env_tune_shifting():
-            func_list.append("env_tune_shifting")
-
-        if attr.trigger_shield:
-            func_list.append("trigger_shield")
-
-        func_list.append("cast_phantom")
-
-        func_list = [x for i, x in enumerate(func_list) if func_list.index(x) == i]
+        names = (func_list,) if isinstance(func_list, str) else tuple(func_list)
+        mask = 1 if isGroup else 0
+        for bit, (_, flag) in enumerate(_ENV_HOOKS, 1):
+            if flag(attr):
+                mask |= 1 << bit
+
+        plan = self._dispatch_plans.get((names, mask))
+        if plan is None:
+            plan = type(self)._build_dispatch_plan(names, mask)
+
+        for func in plan:
+            if func(self, attr, isGroup):
+                return
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 只记录子类真正覆盖的方法, 基类空实现无需调用
+        cls._dispatch_overrides = frozenset(
+            name
+            for name in dir(cls)
+            if not name.startswith("_")
+            and callable(getattr(cls, name))
+            and getattr(cls, name) is not getattr(WeaponAbstract, name, None)
+        )
+        cls._dispatch_plans = {}
 
-        for func_name in func_list:
-            method = getattr(self, func_name, None)
-            if callable(method):
-                if method(attr, isGroup):
-                    return
+    @classmethod
+    def _build_dispatch_plan(cls, names: Tuple[str, ...], mask: int) -> Tuple[Callable, ...]:
+        """按 (调用名, 环境标志位) 生成去重后的钩子调用序列并缓存到类上"""
+        order = list(names)
+        if mask & 1:
+            order.append("cast_variation")
+        for bit, (name, _) in enumerate(_ENV_HOOKS, 1):
+            if mask >> bit & 1:
+                order.append(name)
+        order.append("cast_phantom")
+
+        plan = []
+        for name in dict.fromkeys(order):
+            if name not in cls._dispatch_overrides:
+                continue
+            func = getattr(cls, name)
+            if not isinstance(func, types.FunctionType):
+                func = lambda self, attr, isGroup, _name=name: getattr(self, _name)(attr, isGroup)  # noqa: E731
+            plan.append(func)
+        cls._dispatch_plans[(names, mask)] = tuple(plan)
+        return cls._dispatch_plans[(names, mask)]
 
     def get_title(self):
         return f"{self.name}-{self.weapon_detail.get_resonLevel_name()}"
@@ -139,6 +177,10 @@ class WeaponAbstract(object):
     def param(self, param):
         return self.weapon_detail.param[param][min(self.weapon_reson_level, len(self.weapon_detail.param[param])) - 1]
 
+    def percent(self, expression: str):
+        """解析由本武器参数拼成的表达式, 结果缓存在 (武器 id, 谐振等级) 的表中"""
+        return calc_weapon_percent(self._percent_values, expression)
+
     def buff(self, attr: DamageAttribute, isGroup: bool = False):
         """buff"""
         pass
@@ -6,16 +6,40 @@ class DamageAttribute:
 def getDamageAttribute():
     return DamageAttribute
 
-def calc_percent_expression(*args, **kwargs):
+def _parse_percent(*args, **kwargs):
+    """调用构建模块解析参数表达式, 构建模块尚未下载时返回 None"""
     try:
         from ..waves_build.damage import calc_percent_expression as _func
-        return _func(*args, **kwargs)
     except ImportError:
         logger.info("[鸣潮·伤害计算] 请等待下载完成")
-        return 0
+        return None
+    return _func(*args, **kwargs)
+
+def calc_percent_expression(*args, **kwargs):
+    value = _parse_percent(*args, **kwargs)
+    return 0 if value is None else value
+
+# 武器钩子的参数表达式由 武器 id + 谐振等级 对应的参数拼成, 解析结果按 (武器 id, 谐振等级) 分表缓存:
+# 武器对象创建时绑定自己的表, 同一武器同一谐振等级的后续计算直接查表; 构建模块重载时清空
+_percent_tables = {}
+
+def percent_table(weapon_id, reson_level):
+    return _percent_tables.setdefault((str(weapon_id), reson_level), {})
+
+def calc_weapon_percent(table, expression):
+    value = table.get(expression)
+    if value is None:
+        value = _parse_percent(expression)
+        if value is None:
+            return 0
+        table[expression] = value
+    return value
 
 def reload_damage_module():
     global DamageAttribute
+    for table in _percent_tables.values():
+        table.clear()
+    _percent_tables.clear()
     try:
         from ..waves_build.damage import DamageAttribute as d
         DamageAttribute = d
@@ -21,7 +21,7 @@ from .utils import (
     phantom_damage,
     liberation_damage,
 )
-from .damage import DamageAttribute, calc_percent_expression, check_char_id
+from .damage import DamageAttribute, check_char_id
 from .abstract import WeaponAbstract, WavesWeaponRegister
 
 
@@ -56,7 +56,7 @@ class Weapon_21010015(WeaponAbstract):
         dmg = f"{self.param(1)}*{self.param(2)}"
         title = self.get_title()
         msg = f"施放共鸣技能时，共鸣解放伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21010016(WeaponAbstract):
@@ -73,7 +73,7 @@ class Weapon_21010016(WeaponAbstract):
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}"
         title = self.get_title()
         msg = f"施放变奏技能时，自身重击伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def cast_liberation(self, attr: DamageAttribute, isGroup: bool = False):
         """施放共鸣解放"""
@@ -82,7 +82,7 @@ class Weapon_21010016(WeaponAbstract):
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}"
         title = self.get_title()
         msg = f"施放共鸣解放时，自身重击伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21010023(WeaponAbstract):
@@ -110,7 +110,7 @@ class Weapon_21010026(WeaponAbstract):
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}"
         title = self.get_title()
         msg = f"施放变奏技能时，使共鸣技能伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def cast_skill(self, attr: DamageAttribute, isGroup: bool = False):
         """施放共鸣技能"""
@@ -121,7 +121,7 @@ class Weapon_21010026(WeaponAbstract):
         dmg = f"{self.weapon_detail.param[3][self.weapon_reson_level - 1]}"
         title = self.get_title()
         msg = f"施放共鸣技能时，使共鸣技能伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21010034(WeaponAbstract):
@@ -140,7 +140,7 @@ class Weapon_21010034(WeaponAbstract):
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"生命大于{self.param(0)}时，攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21010036(WeaponAbstract):
@@ -157,7 +157,7 @@ class Weapon_21010036(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放变奏技能时，共鸣解放伤害提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
     def cast_liberation(self, attr: DamageAttribute, isGroup: bool = False):
@@ -167,7 +167,7 @@ class Weapon_21010036(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放共鸣解放时，共鸣解放伤害提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
     def cast_hit(self, attr: DamageAttribute, isGroup: bool = False):
@@ -177,7 +177,7 @@ class Weapon_21010036(WeaponAbstract):
         dmg = f"{self.param(5)}"
         title = self.get_title()
         msg = f"施放重击伤害时，使队伍中的角色热熔伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21010043(WeaponAbstract):
@@ -202,13 +202,13 @@ class Weapon_21010044(WeaponAbstract):
             dmg = f"{self.param(0)}"
             title = self.get_title()
             msg = f"施放变奏技能时，自身攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
         if attr.char_template == temp_def:
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"施放变奏技能时，自身防御提升{dmg}"
-            attr.add_def_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_def_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21010045(WeaponAbstract):
@@ -223,7 +223,7 @@ class Weapon_21010045(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"共鸣解放伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -239,7 +239,7 @@ class Weapon_21010046(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放共鸣技能时，重击伤害提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def trigger_shield(self, attr: DamageAttribute, isGroup: bool = False):
         """触发护盾"""
@@ -248,7 +248,7 @@ class Weapon_21010046(WeaponAbstract):
         dmg = f"{self.param(3)}*{self.param(4)}"
         title = self.get_title()
         msg = f"自身获得护盾时，重击伤害无视目标{dmg}防御"
-        attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+        attr.add_defense_ignore(self.percent(dmg), title, msg)
 
 
 class Weapon_21010053(WeaponAbstract):
@@ -275,7 +275,7 @@ class Weapon_21010056(WeaponAbstract):
         title = self.get_title()
         dmg = f"{self.param(1)}*{self.param(2)}"
         msg = f"施放变奏技能或附加【异常效应】时，共鸣解放伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         if not attr.is_env_abnormal():
             return
@@ -284,7 +284,7 @@ class Weapon_21010056(WeaponAbstract):
         if attr.role and attr.role.role.roleId == 1508:
             dmg2 = f"{self.param(4)}"
             msg = f"满层时附加【异常效应】，全属性伤害加成提升{dmg2}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg2), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg2), title, msg)
 
 
 class Weapon_21010063(WeaponAbstract):
@@ -305,7 +305,7 @@ class Weapon_21010064(WeaponAbstract):
             dmg = f"{self.param(2)}*{self.param(3)}"
             title = self.get_title()
             msg = f"施放共鸣技能后，每2秒攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21010066(WeaponAbstract):
@@ -319,7 +319,7 @@ class Weapon_21010066(WeaponAbstract):
         dmg = f"{self.param(4)}"
         title = self.get_title()
         msg = f"使附近队伍中所有角色的暴击伤害提升{dmg}"
-        attr.add_crit_dmg(calc_percent_expression(dmg), title, msg)
+        attr.add_crit_dmg(self.percent(dmg), title, msg)
 
 
 class Weapon_21010074(WeaponAbstract):
@@ -333,7 +333,7 @@ class Weapon_21010074(WeaponAbstract):
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
             msg = f"施放普攻时，自身攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
             return True
 
     def cast_hit(self, attr: DamageAttribute, isGroup: bool = False):
@@ -342,7 +342,7 @@ class Weapon_21010074(WeaponAbstract):
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
             msg = f"施放重击伤害时，自身攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
             return True
 
 
@@ -359,7 +359,7 @@ class Weapon_21010084(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
         return True
 
 
@@ -381,7 +381,7 @@ class Weapon_21010094(WeaponAbstract):
             dmg = f"{self.param(0)}*{self.param(2)}"
             title = self.get_title()
             msg = f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21010104(WeaponAbstract):
@@ -396,13 +396,13 @@ class Weapon_21010104(WeaponAbstract):
             dmg = f"{self.param(0)}"
             title = self.get_title()
             msg = f"施放共鸣解放时，攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
         if attr.char_damage == hit_damage:
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"施放共鸣解放时，重击伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21020011(WeaponAbstract):
@@ -434,7 +434,7 @@ class Weapon_21020015(WeaponAbstract):
             dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}*{self.weapon_detail.param[2][self.weapon_reson_level - 1]}"
             title = self.get_title()
             msg = f"施放共鸣技能时，攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
             return True
 
 
@@ -451,7 +451,7 @@ class Weapon_21020016(WeaponAbstract):
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}*14"
         title = self.get_title()
         msg = f"每层【灼羽】使共鸣技能伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -466,12 +466,12 @@ class Weapon_21020017(WeaponAbstract):
 
         if attr.char_template == temp_atk:
             dmg1 = f"{self.weapon_detail.param[3][self.weapon_reson_level - 1]}*{self.weapon_detail.param[5][self.weapon_reson_level - 1]}"
-            attr.add_atk_percent(calc_percent_expression(dmg1))
+            attr.add_atk_percent(self.percent(dmg1))
             msg = f"【凶猛】为10层时，攻击提升{dmg1}"
             attr.add_effect(title, msg)
 
         dmg2 = f"{self.weapon_detail.param[7][self.weapon_reson_level - 1]}"
-        attr.add_crit_rate(calc_percent_expression(dmg2))
+        attr.add_crit_rate(self.percent(dmg2))
         title = self.get_title()
         msg = f"【凶猛】为10层时， 暴击率提升{dmg2}"
         attr.add_effect(title, msg)
@@ -524,7 +524,7 @@ class Weapon_21020026(WeaponAbstract):
             dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}*{self.weapon_detail.param[3][self.weapon_reson_level - 1]}"
         title = self.get_title()
         msg = f"普攻伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21020034(WeaponAbstract):
@@ -544,7 +544,7 @@ class Weapon_21020034(WeaponAbstract):
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"生命低于{self.param(0)}时，重击伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21020036(WeaponAbstract):
@@ -561,7 +561,7 @@ class Weapon_21020036(WeaponAbstract):
         dmg = f"{self.param(3)}"
         title = self.get_title()
         msg = f"造成普攻伤害时，普攻伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def cast_liberation(self, attr: DamageAttribute, isGroup: bool = False):
         """施放共鸣解放"""
@@ -570,7 +570,7 @@ class Weapon_21020036(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放共鸣解放后，普攻伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -596,7 +596,7 @@ class Weapon_21020044(WeaponAbstract):
             dmg = f"{self.param(0)}"
             title = self.get_title()
             msg = f"施放变奏技能时，自身攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21020045(WeaponAbstract):
@@ -611,7 +611,7 @@ class Weapon_21020045(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"共鸣技能伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -627,7 +627,7 @@ class Weapon_21020046(WeaponAbstract):
         dmg = f"{self.param(0)}"
         title = self.get_title()
         msg = f"造成治疗时，自身共鸣技能伤害提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def cast_skill(self, attr: DamageAttribute, isGroup: bool = False):
         """施放共鸣技能"""
@@ -637,7 +637,7 @@ class Weapon_21020046(WeaponAbstract):
             dmg = f"{self.param(2)}"
             title = self.get_title()
             msg = f"风主施放共鸣技能时，附近队伍中登场角色气动伤害加深{dmg}"
-            attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_deepen(self.percent(dmg), title, msg)
 
 
 class Weapon_21020053(WeaponAbstract):
@@ -657,12 +657,12 @@ class Weapon_21020056(WeaponAbstract):
             dmg = f"{self.param(2)}"
             title = self.get_title()
             msg = f"当目标的风蚀效应不少于1层时，对目标造成的伤害加深{dmg}"
-            attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_deepen(self.percent(dmg), title, msg)
 
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放变奏技能或普攻后15秒内，自身造成伤害无视目标{dmg}防御"
-        attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+        attr.add_defense_ignore(self.percent(dmg), title, msg)
 
 
 class Weapon_21020064(WeaponAbstract):
@@ -683,7 +683,7 @@ class Weapon_21020064(WeaponAbstract):
             dmg = f"{self.param(1)}*{self.param(2)}"
             title = self.get_title()
             msg = f"角色登场后获得{self.param(0)}层【守誓】效果，使攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21020066(WeaponAbstract):
@@ -700,7 +700,7 @@ class Weapon_21020066(WeaponAbstract):
         dmg = f"{self.param(5)}"
         title = self.get_title()
         msg = f"施放变奏技能时，队伍声骸技能伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def cast_phantom(self, attr: DamageAttribute, isGroup: bool = False):
         """施放声骸技能"""
@@ -708,7 +708,7 @@ class Weapon_21020066(WeaponAbstract):
             dmg = f"{self.param(2)}%*2"
             title = self.get_title()
             msg = f"施放声骸技能时，重击伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21020074(WeaponAbstract):
@@ -723,13 +723,13 @@ class Weapon_21020074(WeaponAbstract):
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
             msg = f"施放共鸣技能时，自身普攻加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         if attr.char_damage == hit_damage:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
             msg = f"施放共鸣技能时，自身重击加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21020084(WeaponAbstract):
@@ -745,7 +745,7 @@ class Weapon_21020084(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
         return True
 
 
@@ -767,7 +767,7 @@ class Weapon_21020094(WeaponAbstract):
             dmg = f"{self.param(0)}*{self.param(2)}"
             title = self.get_title()
             msg = f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21020104(WeaponAbstract):
@@ -782,13 +782,13 @@ class Weapon_21020104(WeaponAbstract):
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"施放共鸣解放时，共鸣解放伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}"
             title = self.get_title()
             msg = f"施放共鸣解放时，攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21020076(WeaponAbstract):
@@ -810,12 +810,12 @@ class Weapon_21020076(WeaponAbstract):
                 dmg = f"{self.param(1)}"
                 title = self.get_title()
                 msg = f"共鸣解放伤害无视目标{dmg}防御"
-                attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+                attr.add_defense_ignore(self.percent(dmg), title, msg)
 
                 dmg = f"{self.param(2)}"
                 title = self.get_title()
                 msg = f"共鸣解放伤害无视目标{dmg}热熔抗性"
-                attr.add_enemy_resistance(-calc_percent_expression(dmg), title, msg)
+                attr.add_enemy_resistance(-self.percent(dmg), title, msg)
 
 
 class Weapon_21020086(WeaponAbstract):
@@ -841,14 +841,14 @@ class Weapon_21020086(WeaponAbstract):
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"自身附加霜渐效应时, 冷凝伤害加深{dmg}"
-            attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_deepen(self.percent(dmg), title, msg)
 
         # 共鸣解放伤害无视目标防御
         if attr.char_damage == liberation_damage:
             dmg = f"{self.param(2)}"
             title = self.get_title()
             msg = f"共鸣解放伤害无视目标{dmg}的防御"
-            attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+            attr.add_defense_ignore(self.percent(dmg), title, msg)
 
         # 自身为登场角色时, 一定范围内的目标受到霜渐效应伤害加深
         # 仅在结算霜渐效应伤害时生效
@@ -856,7 +856,7 @@ class Weapon_21020086(WeaponAbstract):
             dmg = f"{self.param(3)}"
             title = self.get_title()
             msg = f"目标受到霜渐效应伤害加深{dmg}"
-            attr.add_effect_dmg_deepen(calc_percent_expression(dmg), title, msg)
+            attr.add_effect_dmg_deepen(self.percent(dmg), title, msg)
 
 
 class Weapon_21030011(WeaponAbstract):
@@ -889,7 +889,7 @@ class Weapon_21030015(WeaponAbstract):
                 dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}*{self.weapon_detail.param[2][self.weapon_reson_level - 1]}"
                 title = self.get_title()
                 msg = f"施放延奏技能后，入场角色攻击提升{dmg}"
-                attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+                attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21030016(WeaponAbstract):
@@ -906,7 +906,7 @@ class Weapon_21030016(WeaponAbstract):
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}"
         title = self.get_title()
         msg = f"施放变奏技能时，自身共鸣技能伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
     def cast_liberation(self, attr: DamageAttribute, isGroup: bool = False):
@@ -916,7 +916,7 @@ class Weapon_21030016(WeaponAbstract):
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}"
         title = self.get_title()
         msg = f"施放共鸣解放时，自身共鸣技能伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -946,13 +946,13 @@ class Weapon_21030026(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"为目标添加【风蚀效应】后，自身气动伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         # 攻击命中带有【风蚀效应】的敌人时，降低对方10%的气动抗性
         dmg = f"{self.param(3)}"
         title = self.get_title()
         msg = f"攻击命中带有【风蚀效应】的敌人时，降低对方{dmg}的气动抗性"
-        attr.add_enemy_resistance(-calc_percent_expression(dmg), title, msg)
+        attr.add_enemy_resistance(-self.percent(dmg), title, msg)
 
 
 class Weapon_21030034(WeaponAbstract):
@@ -980,14 +980,14 @@ class Weapon_21030036(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"造成声骸技能伤害时，重击伤害加深{dmg}"
-        attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_deepen(self.percent(dmg), title, msg)
 
         # 嘉贝莉娜
         if attr.role and attr.role.role.roleId == 1208:
             dmg = f"{self.param(6)}"
             title = self.get_title()
             msg = f"无视目标{dmg}防御"
-            attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+            attr.add_defense_ignore(self.percent(dmg), title, msg)
 
         return True
 
@@ -998,14 +998,14 @@ class Weapon_21030036(WeaponAbstract):
         dmg = f"{self.param(3)}"
         title = self.get_title()
         msg = f"造成重击伤害时，声骸技能伤害加深{dmg}"
-        attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_deepen(self.percent(dmg), title, msg)
 
         # 嘉贝莉娜
         if attr.role and attr.role.role.roleId == 1208:
             dmg = f"{self.param(6)}"
             title = self.get_title()
             msg = f"无视目标{dmg}防御"
-            attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+            attr.add_defense_ignore(self.percent(dmg), title, msg)
 
         return True
 
@@ -1025,7 +1025,7 @@ class Weapon_21030045(WeaponAbstract):
         title = self.get_title()
         dmg = f"{self.param(1)}"
         msg = f"全属性伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 class Weapon_21030046(WeaponAbstract):
     id = 21030046
@@ -1040,7 +1040,7 @@ class Weapon_21030046(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"普攻伤害提高{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def env_tune_shifting(self, attr: DamageAttribute, isGroup: bool = False):
         """震谐·偏移 (持有者为琳奈; 团队场景放行, 经琳奈 _do_buff 给队友)"""
@@ -1049,7 +1049,7 @@ class Weapon_21030046(WeaponAbstract):
         dmg = f"{self.param(3)}*{self.param(4)}"
         title = self.get_title()
         msg = f"普攻期间附加【震谐/集谐·偏移】时，全队伤害提高{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 class Weapon_21030053(WeaponAbstract):
     id = 21030053
@@ -1071,7 +1071,7 @@ class Weapon_21030056(WeaponAbstract):
         dmg = f"{self.param(1)}*{self.param(2)}"
         title = self.get_title()
         msg = f"衍射加成提升{self.param(1)}*{self.param(2)}层"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def do_action(
         self,
@@ -1084,12 +1084,12 @@ class Weapon_21030056(WeaponAbstract):
             dmg = f"{self.param(4)}"
             title = self.get_title()
             msg = f"附加【骇破·偏移】后重击加深{dmg}"
-            attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_deepen(self.percent(dmg), title, msg)
 
             dmg = f"{self.param(5)}%"
             title = self.get_title()
             msg = f"附加【骇破·偏移】后重击无视目标{dmg}防御"
-            attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+            attr.add_defense_ignore(self.percent(dmg), title, msg)
 
         super().do_action(func_list, attr, isGroup)
 
@@ -1112,7 +1112,7 @@ class Weapon_21030064(WeaponAbstract):
         dmg = f"{self.param(0)}*{self.param(2)}"
         title = self.get_title()
         msg = f"角色冲刺或闪避时，攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21030066(WeaponAbstract):
@@ -1129,7 +1129,7 @@ class Weapon_21030066(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放变奏技能时，自身普攻伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def do_action(
         self,
@@ -1142,14 +1142,14 @@ class Weapon_21030066(WeaponAbstract):
             dmg = f"{self.param(3)}"
             title = self.get_title()
             msg = f"附加【骇破·偏移】时普攻加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         # 队伍攻击提升: 队伍附加【骇破·偏移】(env)时全队生效, 由露西/丽贝卡 _do_buff 驱动到队友
         if attr.env_hack_shifting and attr.char_template == temp_atk:
             dmg = f"{self.param(5)}"
             title = self.get_title()
             msg = f"附加【骇破·偏移】时攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
         super().do_action(func_list, attr, isGroup)
 
@@ -1167,7 +1167,7 @@ class Weapon_21030074(WeaponAbstract):
         dmg = f"{self.param(0)}*{self.param(1)}"
         title = self.get_title()
         msg = f"造成普攻或重击伤害时，自身共鸣技能伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
     def cast_hit(self, attr: DamageAttribute, isGroup: bool = False):
@@ -1177,7 +1177,7 @@ class Weapon_21030074(WeaponAbstract):
         dmg = f"{self.param(0)}*{self.param(1)}"
         title = self.get_title()
         msg = f"造成普攻或重击伤害时，自身共鸣技能伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -1194,7 +1194,7 @@ class Weapon_21030084(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
         return True
 
 
@@ -1216,7 +1216,7 @@ class Weapon_21030094(WeaponAbstract):
             dmg = f"{self.param(0)}*{self.param(2)}"
             title = self.get_title()
             msg = f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21030104(WeaponAbstract):
@@ -1231,13 +1231,13 @@ class Weapon_21030104(WeaponAbstract):
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
             msg = f"造成普攻伤害时，重击伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         if attr.char_damage == attack_damage:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
             msg = f"造成普攻伤害时，攻击伤害加成提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
         return True
 
     def cast_hit(self, attr: DamageAttribute, isGroup: bool = False):
@@ -1246,13 +1246,13 @@ class Weapon_21030104(WeaponAbstract):
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
             msg = f"造成重击伤害时，重击伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         if attr.char_damage == attack_damage:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
             msg = f"造成重击伤害时，攻击伤害加成提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
         return True
 
 
@@ -1287,7 +1287,7 @@ class Weapon_21040015(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"造成共鸣技能伤害时，普攻伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def cast_attack(self, attr: DamageAttribute, isGroup: bool = False):
         """造成普攻伤害"""
@@ -1297,7 +1297,7 @@ class Weapon_21040015(WeaponAbstract):
         dmg = f"{self.param(3)}"
         title = self.get_title()
         msg = f"造成普攻伤害时，共鸣技能伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21040016(WeaponAbstract):
@@ -1314,7 +1314,7 @@ class Weapon_21040016(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放共鸣解放时，自身共鸣解放伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -1344,7 +1344,7 @@ class Weapon_21040026(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放普攻技能时，自身重击伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
     def cast_variation(self, attr: DamageAttribute, isGroup: bool = False):
@@ -1356,7 +1356,7 @@ class Weapon_21040026(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放变奏技能时，自身重击伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -1378,7 +1378,7 @@ class Weapon_21040034(WeaponAbstract):
         dmg = f"{self.param(0)}"
         title = self.get_title()
         msg = f"冲刺或冲刺时，攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21040036(WeaponAbstract):
@@ -1392,13 +1392,13 @@ class Weapon_21040036(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放普攻技能时，自身造成伤害无视目标{dmg}防御"
-        attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+        attr.add_defense_ignore(self.percent(dmg), title, msg)
 
         if attr.env_spectro_deepen:
             dmg = f"{self.param(2)}"
             title = self.get_title()
             msg = f"自身直接造成的【光噪效应】伤害加深{dmg}"
-            attr.add_effect_dmg_deepen(calc_percent_expression(dmg), title, msg)
+            attr.add_effect_dmg_deepen(self.percent(dmg), title, msg)
 
 
 class Weapon_21040043(WeaponAbstract):
@@ -1420,7 +1420,7 @@ class Weapon_21040044(WeaponAbstract):
         dmg = f"{self.param(0)}"
         title = self.get_title()
         msg = f"施放变奏技能时，自身共鸣解放伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21040045(WeaponAbstract):
@@ -1435,7 +1435,7 @@ class Weapon_21040045(WeaponAbstract):
         dmg = f"{self.param(1)}*{self.param(3)}"
         title = self.get_title()
         msg = f"普攻伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 class Weapon_21040046(WeaponAbstract):
@@ -1453,12 +1453,12 @@ class Weapon_21040046(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放变奏技能时，自身共鸣解放伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         dmg = f"{self.param(3)}*{self.param(5)}"
         title = self.get_title()
         msg = f"自身获得护盾时，共鸣解放伤害无视目标{dmg}防御"
-        attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+        attr.add_defense_ignore(self.percent(dmg), title, msg)
 
         return True
 
@@ -1471,12 +1471,12 @@ class Weapon_21040046(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放共鸣解放时，自身共鸣解放伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         dmg = f"{self.param(3)}*{self.param(5)}"
         title = self.get_title()
         msg = f"自身获得护盾时，共鸣解放伤害无视目标{dmg}防御"
-        attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+        attr.add_defense_ignore(self.percent(dmg), title, msg)
 
         return True
 
@@ -1507,19 +1507,19 @@ class Weapon_21040056(WeaponAbstract):
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"造成普攻伤害后，衍射伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         # 每次为敌方怪物附加【集谐·偏移】后，普攻伤害加深，且普攻伤害无视目标防御 (持有者能附加集谐)
         if check_char_id(attr, Tune_Strain_Role_Ids) and attr.char_damage == attack_damage:
             dmg = f"{self.param(3)}"
             title = self.get_title()
             msg = f"附加【集谐·偏移】后，普攻伤害加深{dmg}"
-            attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_deepen(self.percent(dmg), title, msg)
 
             dmg = f"{self.param(4)}"
             title = self.get_title()
             msg = f"附加【集谐·偏移】后，普攻伤害无视目标{dmg}防御"
-            attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+            attr.add_defense_ignore(self.percent(dmg), title, msg)
 
 
 class Weapon_21040064(WeaponAbstract):
@@ -1534,12 +1534,12 @@ class Weapon_21040064(WeaponAbstract):
             dmg = f"{self.param(1)}*{self.param(0)}"
             title = self.get_title()
             msg = f"施放共鸣解放时，获得3层【铁甲】效果，使攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
         dmg = f"{self.param(1)}*{self.param(0)}"
         title = self.get_title()
         msg = f"施放共鸣解放时，获得3层【铁甲】效果，使防御提升{dmg}"
-        attr.add_def_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_def_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21040074(WeaponAbstract):
@@ -1554,7 +1554,7 @@ class Weapon_21040074(WeaponAbstract):
         dmg = f"{self.param(0)}"
         title = self.get_title()
         msg = f"施放共鸣技能时，自身共鸣解放伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -1571,7 +1571,7 @@ class Weapon_21040084(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
         return True
 
 
@@ -1593,7 +1593,7 @@ class Weapon_21040094(WeaponAbstract):
             dmg = f"{self.param(0)}*{self.param(2)}"
             title = self.get_title()
             msg = f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21040104(WeaponAbstract):
@@ -1608,13 +1608,13 @@ class Weapon_21040104(WeaponAbstract):
             dmg = f"{self.param(0)}"
             title = self.get_title()
             msg = f"施放共鸣解放时，攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
         if attr.char_damage == liberation_damage:
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"施放共鸣解放时，共鸣解放伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21040066(WeaponAbstract):
@@ -1629,13 +1629,13 @@ class Weapon_21040066(WeaponAbstract):
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"施放声骸技能时，声骸技能伤害加深{dmg}"
-            attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_deepen(self.percent(dmg), title, msg)
 
         if attr.char_attr == CHAR_ATTR_SIERRA:
             dmg = f"{self.param(3)}"
             title = self.get_title()
             msg = f"造成声骸技能伤害时，气动伤害无视目标{dmg}防御"
-            attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+            attr.add_defense_ignore(self.percent(dmg), title, msg)
 
 
 class Weapon_21050011(WeaponAbstract):
@@ -1670,7 +1670,7 @@ class Weapon_21050015(WeaponAbstract):
         dmg = f"{self.param(1)}*{self.param(2)}"
         title = self.get_title()
         msg = f"造成普攻伤害时，普攻伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -1689,11 +1689,11 @@ class Weapon_21050016(WeaponAbstract):
         dmg1 = f"{self.param(1)}*{self.param(2)}"
         title = self.get_title()
         msg = f"造成共鸣技能伤害时，自身攻击提升{dmg1}"
-        attr.add_atk_percent(calc_percent_expression(dmg1), title, msg)
+        attr.add_atk_percent(self.percent(dmg1), title, msg)
         if attr.sync_strike:
             dmg2 = f"{self.param(4)}"
             msg = f"自身不在场时，该效果攻击额外提升{dmg2}"
-            attr.add_atk_percent(calc_percent_expression(dmg2), title, msg)
+            attr.add_atk_percent(self.percent(dmg2), title, msg)
 
 
 class Weapon_21050017(WeaponAbstract):
@@ -1710,7 +1710,7 @@ class Weapon_21050017(WeaponAbstract):
         dmg = f"{self.param(0)}"
         title = self.get_title()
         msg = f"施放共鸣解放时，自身治疗效果加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21050023(WeaponAbstract):
@@ -1739,7 +1739,7 @@ class Weapon_21050026(WeaponAbstract):
             dmg = f"{self.param(5)}"
             title = self.get_title()
             msg = f"使自身不在场时普攻伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
         else:
             buff_layer = int(self.param(2))
             effect_value = attr.get_effect("默认手法")
@@ -1753,7 +1753,7 @@ class Weapon_21050026(WeaponAbstract):
             dmg = f"{self.param(1)}*{buff_layer}"
             title = self.get_title()
             msg = f"施放共鸣技能时，自身在场时普攻伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21050027(WeaponAbstract):
@@ -1775,7 +1775,7 @@ class Weapon_21050027(WeaponAbstract):
         dmg = f"{self.param(0) * 4}"
         title = self.get_title()
         msg = f"对带有【光噪效应】的敌人造成伤害时获得效果：自身衍射伤害提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21050034(WeaponAbstract):
@@ -1791,7 +1791,7 @@ class Weapon_21050034(WeaponAbstract):
         dmg = f"{self.param(5)}"
         title = self.get_title()
         msg = f"施放共鸣技能时，若角色生命高于{self.param(4)}，则攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21050036(WeaponAbstract):
@@ -1806,7 +1806,7 @@ class Weapon_21050036(WeaponAbstract):
         dmg = f"{self.weapon_detail.param[4][self.weapon_reson_level - 1]}"
         title = self.get_title()
         msg = f"使附近队伍中所有角色的攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21050043(WeaponAbstract):
@@ -1827,13 +1827,13 @@ class Weapon_21050044(WeaponAbstract):
             dmg = f"{self.param(0)}"
             title = self.get_title()
             msg = f"施放变奏技能时，自身攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
         if attr.char_template == temp_life:
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"施放变奏技能时，自身生命提升{dmg}"
-            attr.add_life_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_life_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21050045(WeaponAbstract):
@@ -1845,12 +1845,12 @@ class Weapon_21050045(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
         
         if attr.char_damage == attack_damage:
             dmg2 = f"{self.param(3)}"
             msg2 = f"普攻伤害加成提升{dmg2}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg2), title, msg2)
+            attr.add_dmg_bonus(self.percent(dmg2), title, msg2)
             
         return True
 
@@ -1882,7 +1882,7 @@ class Weapon_21050046(WeaponAbstract):
         dmg = f"{self.param(1)}*{self.param(2)}"
         title = self.get_title()
         msg = f"光噪效应状态下，自身普攻、重击伤害加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
     def cast_extension(self, attr: DamageAttribute, isGroup: bool = False):
         """施放延奏技能"""
@@ -1896,7 +1896,7 @@ class Weapon_21050046(WeaponAbstract):
         dmg = f"{self.param(4)}"
         title = self.get_title()
         msg = f"施放延奏技能时，使登场角色【光噪效应】伤害加深{dmg}"
-        attr.add_effect_dmg_deepen(calc_percent_expression(dmg), title, msg)
+        attr.add_effect_dmg_deepen(self.percent(dmg), title, msg)
 
 
 class Weapon_21050053(WeaponAbstract):
@@ -1922,13 +1922,13 @@ class Weapon_21050056(WeaponAbstract):
             dmg = f"{self.param(6)}"
             title = self.get_title()
             msg = f"普攻伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         if attr.role and attr.role.role.roleId == 1607:
             dmg = f"{self.param(8)}"
             title = self.get_title()
             msg = f"无视目标{dmg}%湮灭属性抗性"
-            attr.add_enemy_resistance(-calc_percent_expression(dmg), title, msg)
+            attr.add_enemy_resistance(-self.percent(dmg), title, msg)
 
 
 class Weapon_21050064(WeaponAbstract):
@@ -1944,7 +1944,7 @@ class Weapon_21050064(WeaponAbstract):
         dmg = f"{self.param(0)}*{self.param(2)}"
         title = self.get_title()
         msg = f"造成普攻伤害时，治疗效果加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
     def cast_hit(self, attr: DamageAttribute, isGroup: bool = False):
@@ -1954,7 +1954,7 @@ class Weapon_21050064(WeaponAbstract):
         dmg = f"{self.param(0)}*{self.param(2)}"
         title = self.get_title()
         msg = f"造成重击伤害时，治疗效果加成提升{dmg}"
-        attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+        attr.add_dmg_bonus(self.percent(dmg), title, msg)
         return True
 
 
@@ -1970,18 +1970,18 @@ class Weapon_21050066(WeaponAbstract):
         dmg = f"{self.param(4)}"
         title = self.get_title()
         msg = f"造成声骸技能伤害后，无视目标{dmg}%防御"
-        attr.add_defense_ignore(calc_percent_expression(dmg), title, msg)
+        attr.add_defense_ignore(self.percent(dmg), title, msg)
         if attr.char_damage == phantom_damage:
             dmg = f"{self.param(3)}"
             title = self.get_title()
             msg = f"造成声骸技能伤害后，声骸技能伤害加深{dmg}"
-            attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_deepen(self.percent(dmg), title, msg)
 
         if attr.char_damage == skill_damage:
             dmg = f"{self.param(2)}"
             title = self.get_title()
             msg = f"造成声骸技能伤害后，共鸣技能伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
 
 class Weapon_21050074(WeaponAbstract):
@@ -1998,7 +1998,7 @@ class Weapon_21050074(WeaponAbstract):
         dmg = f"{self.param(0)}"
         title = self.get_title()
         msg = f"施放共鸣解放时，自身攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21050076(WeaponAbstract):
@@ -2019,13 +2019,13 @@ class Weapon_21050076(WeaponAbstract):
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"附加聚爆效应时, 共鸣解放伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         if attr.char_template == temp_atk:
             dmg = f"{self.param(3)}"
             title = self.get_title()
             msg = f"队伍中角色附加聚爆效应时, 攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
     def cast_tune_strain(self, attr: DamageAttribute, isGroup: bool = False):
         """施加集谐·偏移"""
@@ -2038,13 +2038,13 @@ class Weapon_21050076(WeaponAbstract):
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"附加集谐·偏移时, 共鸣解放伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         if attr.char_template == temp_atk:
             dmg = f"{self.param(3)}"
             title = self.get_title()
             msg = f"队伍中角色附加集谐·偏移时, 攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21050084(WeaponAbstract):
@@ -2060,7 +2060,7 @@ class Weapon_21050084(WeaponAbstract):
         dmg = f"{self.param(1)}"
         title = self.get_title()
         msg = f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
-        attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+        attr.add_atk_percent(self.percent(dmg), title, msg)
         return True
 
 
@@ -2082,14 +2082,14 @@ class Weapon_21050086(WeaponAbstract):
             dmg = f"{self.param(1)}"
             title = self.get_title()
             msg = f"附加霜渐效应时自身冷凝加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         # 队伍攻击提升: 队伍附加【霜渐效应】(env)时全队生效, 由洛瑟菈/绯雪 _do_buff 驱动到队友
         if attr.env_glacio_chafe and attr.char_template == temp_atk:
             dmg = f"{self.param(3)}"
             title = self.get_title()
             msg = f"附加霜渐效应时攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
         super().do_action(func_list, attr, isGroup)
 
@@ -2110,7 +2110,7 @@ class Weapon_21050094(WeaponAbstract):
             dmg = f"{self.param(0)}*{self.param(2)}"
             title = self.get_title()
             msg = f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 class Weapon_21050104(WeaponAbstract):
@@ -2125,13 +2125,13 @@ class Weapon_21050104(WeaponAbstract):
             dmg = f"{self.param(0)}"
             title = self.get_title()
             msg = f"施放共鸣技能时，普攻伤害加成提升{dmg}"
-            attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
+            attr.add_dmg_bonus(self.percent(dmg), title, msg)
 
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}"
             title = self.get_title()
             msg = f"施放共鸣技能时，攻击加成提升{dmg}"
-            attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
+            attr.add_atk_percent(self.percent(dmg), title, msg)
 
 
 def register_weapon():
@@ -1,7 +1,7 @@
-from typing import Any, Dict, List, Type, TypeVar, Optional
+from typing import Any, Dict, List, Type, Tuple, TypeVar, Optional
 
 from sqlmodel import Field, col, select
-from sqlalchemy import null, delete, update
+from sqlalchemy import func, null, delete, update, bindparam
 from sqlalchemy.sql import or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +21,7 @@ from .waves_subscribe import WavesSubscribe
 from .waves_user_activity import WavesUserActivity
 from .waves_user_sdk import WavesUserSdk
 from .waves_gacha_cloud import WavesGachaCloud
+from .waves_bind_group import WavesBindGroup, split_group_ids
 
 exec_list.extend(
     [
@@ -48,6 +49,19 @@ exec_list.extend(
         "DELETE FROM WavesStaminaRecord WHERE id NOT IN (SELECT MAX(id) FROM WavesStaminaRecord GROUP BY user_id, bot_id, uid)",
         'CREATE TABLE IF NOT EXISTS "WavesGachaCloud" (id INTEGER NOT NULL, bot_id VARCHAR NOT NULL, user_id VARCHAR NOT NULL, uid VARCHAR NOT NULL, login_info VARCHAR NOT NULL, is_valid BOOLEAN NOT NULL, created_time INTEGER, last_used_time INTEGER, PRIMARY KEY (id))',
         'CREATE INDEX IF NOT EXISTS "ix_WavesGachaCloud_uid" ON "WavesGachaCloud" (uid)',
+        'CREATE TABLE IF NOT EXISTS "WavesBindGroup" (id INTEGER NOT NULL, bind_id INTEGER NOT NULL, group_id VARCHAR NOT NULL, PRIMARY KEY (id), UNIQUE (bind_id, group_id))',
+        'CREATE INDEX IF NOT EXISTS "ix_WavesBindGroup_group_bind" ON "WavesBindGroup" (group_id, bind_id)',
+        "WITH RECURSIVE split(bind_id, part, rest) AS (SELECT id, '', IFNULL(group_id, '') || '_' FROM WavesBind UNION ALL SELECT bind_id, substr(rest, 1, instr(rest, '_') - 1), substr(rest, instr(rest, '_') + 1) FROM split WHERE rest != '') INSERT OR IGNORE INTO WavesBindGroup (bind_id, group_id) SELECT bind_id, part FROM split WHERE part != ''",
+        "DELETE FROM WavesBindGroup WHERE NOT EXISTS (SELECT 1 FROM WavesBind WHERE WavesBind.id = WavesBindGroup.bind_id AND instr('_' || IFNULL(WavesBind.group_id, '') || '_', '_' || WavesBindGroup.group_id || '_') > 0)",
+        "DELETE FROM WavesUserActivity WHERE id NOT IN (SELECT MAX(id) FROM WavesUserActivity GROUP BY user_id, bot_id, bot_self_id)",
+        'CREATE UNIQUE INDEX IF NOT EXISTS "ux_WavesUserActivity_user_bot_self" ON "WavesUserActivity" (user_id, bot_id, bot_self_id)',
+        'CREATE INDEX IF NOT EXISTS "ix_WavesUserActivity_last_active_time" ON "WavesUserActivity" (last_active_time)',
+        'CREATE INDEX IF NOT EXISTS "ix_WavesUser_last_used_time" ON "WavesUser" (last_used_time)',
+        'CREATE INDEX IF NOT EXISTS "ix_WavesBind_uid" ON "WavesBind" (uid)',
+        'CREATE INDEX IF NOT EXISTS "ix_WavesBind_user_bot" ON "WavesBind" (user_id, bot_id)',
+        'CREATE INDEX IF NOT EXISTS "ix_WavesUser_user_bot_uid" ON "WavesUser" (user_id, bot_id, uid)',
+        'CREATE INDEX IF NOT EXISTS "ix_WavesUser_cookie_uid" ON "WavesUser" (cookie, uid)',
+        'CREATE INDEX IF NOT EXISTS "ix_WavesStaminaRecord_user_bot_uid" ON "WavesStaminaRecord" (user_id, bot_id, uid)',
     ]
 )
 
@@ -65,8 +79,48 @@ class WavesBind(Bind, table=True):
     @with_session
     async def get_group_all_uid(cls: Type[T_WavesBind], session: AsyncSession, group_id: Optional[str] = None):
         """根据传入`group_id`获取该群号下所有绑定`uid`列表"""
-        result = await session.scalars(select(cls).where(col(cls.group_id).contains(group_id)))
-        return result.all()
+        if not group_id:
+            return []
+        sql = (
+            select(cls)
+            .join(WavesBindGroup, col(WavesBindGroup.bind_id) == col(cls.id))
+            .where(col(WavesBindGroup.group_id) == group_id)
+        )
+        result = await session.scalars(sql)
+        # 关系表只做索引, 以 group_id 原字段为准, 防止两边短暂不一致
+        return [bind for bind in result.all() if group_id in split_group_ids(bind.group_id)]
+
+    @classmethod
+    async def _sync_bind_groups(cls: Type[T_WavesBind], user_id: str, bot_id: str):
+        bind = await cls.select_data(user_id, bot_id)
+        if bind and bind.id is not None:
+            await WavesBindGroup.sync_groups(bind.id, bind.group_id)
+
+    @classmethod
+    async def insert_data(cls: Type[T_WavesBind], user_id: str, bot_id: str, **data) -> int:
+        code = await super().insert_data(user_id, bot_id, **data)
+        if "group_id" in data:
+            await cls._sync_bind_groups(user_id, bot_id)
+        return code
+
+    @classmethod
+    async def update_data(cls: Type[T_WavesBind], user_id: str, bot_id: str, **data) -> int:
+        code = await super().update_data(user_id, bot_id, **data)
+        if "group_id" in data:
+            await cls._sync_bind_groups(user_id, bot_id)
+        return code
+
+    @classmethod
+    @with_session
+    async def get_uid_bind_count(cls: Type[T_WavesBind], session: AsyncSession) -> int:
+        """统计鸣潮绑定行 (uid 非空) 数量, 战双 pgr 绑定不计入"""
+        sql = (
+            select(func.count())
+            .select_from(cls)
+            .where(col(cls.uid) != null(), col(cls.uid) != "")
+        )
+        result = await session.execute(sql)
+        return result.scalar_one()
 
     @classmethod
     @with_session
@@ -314,6 +368,25 @@ class WavesUser(User, table=True):
         data = result.scalars().all()
         return list(data)
 
+    @classmethod
+    @with_session
+    async def get_waves_all_user_count(cls: Type[T_WavesUser], session: AsyncSession) -> int:
+        """获取有效用户数量，条件与 get_waves_all_user 一致"""
+        sql = (
+            select(func.count())
+            .select_from(cls)
+            .where(
+                and_(
+                    or_(col(cls.status) == null(), col(cls.status) == ""),
+                    col(cls.cookie) != null(),
+                    col(cls.cookie) != "",
+                )
+            )
+        )
+
+        result = await session.execute(sql)
+        return result.scalar_one()
+
     @classmethod
     @with_session
     async def delete_all_invalid_cookie(cls, session: AsyncSession):
@@ -501,6 +574,33 @@ class WavesUser(User, table=True):
         result = await session.execute(sql)
         return result.rowcount
 
+    @classmethod
+    @with_session
+    async def update_avatar_urls(
+        cls: Type[T_WavesUser],
+        session: AsyncSession,
+        items: List[Tuple[str, str, str]],
+    ) -> None:
+        """批量更新头像 URL, items 为 (user_id, bot_id, avatar_url), 同一事务内执行"""
+        params = [
+            {"b_user_id": user_id, "b_bot_id": bot_id, "avatar_url": avatar_url}
+            for user_id, bot_id, avatar_url in items
+            if avatar_url
+        ]
+        if not params:
+            return
+        sql = (
+            update(cls.__table__)  # type: ignore
+            .where(
+                and_(
+                    cls.__table__.c.user_id == bindparam("b_user_id"),  # type: ignore
+                    cls.__table__.c.bot_id == bindparam("b_bot_id"),  # type: ignore
+                )
+            )
+            .values(avatar_url=bindparam("avatar_url"))
+        )
+        await session.execute(sql, params)
+
     @classmethod
     @with_session
     async def get_active_user_count(
@@ -521,19 +621,22 @@ class WavesUser(User, table=True):
         current_time = int(time.time())
         threshold_time = current_time - (active_days * 24 * 60 * 60)
 
-        sql = select(cls).where(
-            and_(
-                or_(col(cls.status) == null(), col(cls.status) == ""),
-                col(cls.cookie) != null(),
-                col(cls.cookie) != "",
-                col(cls.last_used_time) != null(),
-                col(cls.last_used_time) >= threshold_time,
+        sql = (
+            select(func.count())
+            .select_from(cls)
+            .where(
+                and_(
+                    or_(col(cls.status) == null(), col(cls.status) == ""),
+                    col(cls.cookie) != null(),
+                    col(cls.cookie) != "",
+                    col(cls.last_used_time) != null(),
+                    col(cls.last_used_time) >= threshold_time,
+                )
             )
         )
 
         result = await session.execute(sql)
-        data = result.scalars().all()
-        return len(data)
+        return result.scalar_one()
 
 
 class WavesStaminaRecord(BaseModel, table=True):
@@ -599,6 +702,36 @@ class WavesStaminaRecord(BaseModel, table=True):
         session.add(new_record)
         return True
 
+    @classmethod
+    @with_session
+    async def bulk_upsert_records(
+        cls: Type[T_WavesStaminaRecord],
+        session: AsyncSession,
+        records: List[Dict[str, Any]],
+    ) -> int:
+        """同一事务内批量更新或创建体力记录
+
+        每条按 (user_id, bot_id, uid) 定位, 只写入记录中给出的字段
+        """
+        for data in records:
+            sql = select(cls).where(
+                and_(
+                    cls.user_id == data["user_id"],
+                    cls.bot_id == data["bot_id"],
+                    cls.uid == data["uid"],
+                )
+            )
+            result = await session.execute(sql)
+            record = result.scalars().first()
+
+            if record:
+                for key, value in data.items():
+                    setattr(record, key, value)
+                session.add(record)
+            else:
+                session.add(cls(**data))
+        return len(records)
+
     @classmethod
     @with_session
     async def update_ck_valid(
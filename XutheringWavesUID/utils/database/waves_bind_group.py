@@ -0,0 +1,55 @@
+"""群成员关系表。
+
+``WavesBind.group_id`` 以 ``_`` 拼接存储所属群号, 按群查询只能 LIKE 全表扫描,
+还会误匹配其他群号的子串。本表把每个 (bind_id, group_id) 拆成一行并建索引,
+由 ``WavesBind`` 写入 ``group_id`` 时同步维护, 启动时由 exec_list 全量校正。
+"""
+
+from typing import Any, Optional, Type, TypeVar
+
+from sqlmodel import Field, col, select
+from sqlalchemy import Index, delete, UniqueConstraint
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gsuid_core.utils.database.base_models import BaseIDModel, with_session
+
+T_WavesBindGroup = TypeVar("T_WavesBindGroup", bound="WavesBindGroup")
+
+
+def split_group_ids(group_id: Optional[str]) -> set[str]:
+    return {g for g in (group_id or "").split("_") if g}
+
+
+class WavesBindGroup(BaseIDModel, table=True):
+    """绑定记录与群号的对应关系"""
+
+    __tablename__ = "WavesBindGroup"
+    __table_args__: Any = (
+        UniqueConstraint("bind_id", "group_id"),
+        Index("ix_WavesBindGroup_group_bind", "group_id", "bind_id"),
+        {"extend_existing": True},
+    )
+
+    bind_id: int = Field(default=0, title="绑定记录ID")
+    group_id: str = Field(default="", title="群号")
+
+    @classmethod
+    @with_session
+    async def sync_groups(
+        cls: Type[T_WavesBindGroup],
+        session: AsyncSession,
+        bind_id: int,
+        group_id: Optional[str],
+    ) -> None:
+        """按 WavesBind.group_id 的当前值增删该绑定的群关系"""
+        groups = split_group_ids(group_id)
+        result = await session.execute(select(cls.group_id).where(col(cls.bind_id) == bind_id))
+        existing = set(result.scalars().all())
+
+        stale = existing - groups
+        if stale:
+            await session.execute(
+                delete(cls).where(col(cls.bind_id) == bind_id, col(cls.group_id).in_(stale))
+            )
+        for g in groups - existing:
+            session.add(cls(bind_id=bind_id, group_id=g))
@@ -1,7 +1,9 @@
-from typing import Any, Dict, Optional, Type, TypeVar
+import time
+from typing import Any, List, Tuple, Optional, Type, TypeVar
 
 from sqlmodel import Field, select
-from sqlalchemy import update
+from sqlalchemy import Index, func, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import and_, or_
 
@@ -18,7 +20,10 @@ class WavesUserActivity(BaseBotIDModel, table=True):
     """
 
     __tablename__ = "WavesUserActivity"
-    __table_args__: Dict[str, Any] = {"extend_existing": True}
+    __table_args__: Any = (
+        Index("ux_WavesUserActivity_user_bot_self", "user_id", "bot_id", "bot_self_id", unique=True),
+        {"extend_existing": True},
+    )
 
     user_id: str = Field(default="", title="用户ID")
     bot_self_id: str = Field(default="", title="BotSelfID")
@@ -71,7 +76,7 @@ class WavesUserActivity(BaseBotIDModel, table=True):
                     cls.bot_id == bot_self_id,
                     or_(cls.bot_self_id == "", cls.bot_self_id.is_(None)),
                 )
-            )
+            ).order_by(cls.id)
             legacy_result = await session.execute(legacy_sql)
             legacy = legacy_result.scalars().first()
             if legacy:
@@ -91,6 +96,71 @@ class WavesUserActivity(BaseBotIDModel, table=True):
 
         return True
 
+    @classmethod
+    @with_session
+    async def bulk_update_user_activity(
+        cls: Type[T_WavesUserActivity],
+        session: AsyncSession,
+        entries: List[Tuple[str, str, str]],
+        chunk_size: int = 200,
+    ) -> int:
+        """批量更新用户活跃时间, 全部在同一事务内完成
+
+        与逐条 update_user_activity 结果一致: 先把命中的旧格式记录原地迁移,
+        再按 chunk_size 分块执行多行 INSERT ... ON CONFLICT DO UPDATE。
+        依赖 (user_id, bot_id, bot_self_id) 唯一索引, 仅支持 SQLite。
+
+        Args:
+            entries: (user_id, bot_id, bot_self_id) 列表
+
+        Returns:
+            int: 写入条数
+        """
+        if not entries:
+            return 0
+        current_time = int(time.time())
+
+        # 兼容旧数据：新格式记录不存在时，把 bot_id 里存 bot_self_id 的旧记录就地改写。
+        # 与逐条版本一样只改写一行 (bot_self_id 为 '' 和 NULL 的旧记录可能同时存在,
+        # 全部改写会撞上唯一索引)
+        await session.execute(
+            text(
+                "UPDATE WavesUserActivity SET bot_id = :bot_id, bot_self_id = :bot_self_id, "
+                "last_active_time = :last_active_time "
+                "WHERE id = (SELECT id FROM WavesUserActivity WHERE user_id = :user_id "
+                "AND bot_id = :bot_self_id AND IFNULL(bot_self_id, '') = '' ORDER BY id LIMIT 1) "
+                "AND NOT EXISTS (SELECT 1 FROM WavesUserActivity WHERE user_id = :user_id "
+                "AND bot_id = :bot_id AND bot_self_id = :bot_self_id)"
+            ),
+            [
+                {
+                    "user_id": user_id,
+                    "bot_id": bot_id,
+                    "bot_self_id": bot_self_id,
+                    "last_active_time": current_time,
+                }
+                for user_id, bot_id, bot_self_id in entries
+            ],
+        )
+
+        rows = [
+            {
+                "user_id": user_id,
+                "bot_id": bot_id,
+                "bot_self_id": bot_self_id,
+                "last_active_time": current_time,
+            }
+            for user_id, bot_id, bot_self_id in entries
+        ]
+        for i in range(0, len(rows), chunk_size):
+            stmt = sqlite_insert(cls).values(rows[i : i + chunk_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "bot_id", "bot_self_id"],
+                set_={"last_active_time": stmt.excluded.last_active_time},
+            )
+            await session.execute(stmt)
+        return len(rows)
+
     @classmethod
     @with_session
     async def get_user_last_active_time(
@@ -153,16 +223,19 @@ class WavesUserActivity(BaseBotIDModel, table=True):
         current_time = int(time.time())
         threshold_time = current_time - (active_days * 24 * 60 * 60)
 
-        sql = select(cls).where(
-            and_(
-                cls.last_active_time.is_not(None),
-                cls.last_active_time >= threshold_time,
+        sql = (
+            select(func.count())
+            .select_from(cls)
+            .where(
+                and_(
+                    cls.last_active_time.is_not(None),
+                    cls.last_active_time >= threshold_time,
+                )
             )
         )
 
         result = await session.execute(sql)
-        data = result.scalars().all()
-        return len(data)
+        return result.scalar_one()
 
     @classmethod
     @with_session
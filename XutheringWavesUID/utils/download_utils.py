@@ -8,7 +8,9 @@ import tempfile
 import threading
 import time
 from pathlib import Path
+from typing import Dict, List, Tuple, Iterable, Optional
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 from gsuid_core.logger import logger
 
@@ -121,6 +123,110 @@ def get_file_hash_sha256(file_path):
     return hash_sha256.hexdigest()
 
 
+# 文件摘要清单: 绝对路径 -> [size, mtime_ns, inode, sha256]。
+# stat 三元组未变的文件直接复用记录的摘要, 只有新增/变化的文件才真正读盘计算。
+_MANIFEST_LOCK = threading.RLock()
+_manifest: Optional[Dict[str, list]] = None
+
+StatKey = Tuple[int, int, int]
+
+
+def _get_manifest_path() -> Path:
+    from .resource.RESOURCE_PATH import BUILD_HASH_MANIFEST
+
+    return BUILD_HASH_MANIFEST
+
+
+def _load_manifest() -> Dict[str, list]:
+    global _manifest
+    with _MANIFEST_LOCK:
+        if _manifest is None:
+            try:
+                with open(_get_manifest_path(), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                _manifest = data if isinstance(data, dict) else {}
+            except FileNotFoundError:
+                _manifest = {}
+            except Exception as e:
+                logger.warning(f"[鸣潮·下载工具] 摘要清单读取失败, 将重新计算: {e}")
+                _manifest = {}
+        return _manifest
+
+
+def save_hash_manifest():
+    """清理已不存在的文件记录后原子写回清单"""
+    with _MANIFEST_LOCK:
+        if _manifest is None:
+            return
+        for key in [k for k in _manifest if not os.path.exists(k)]:
+            del _manifest[key]
+        manifest_path = _get_manifest_path()
+        try:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=manifest_path.parent, prefix=".tmp_")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(_manifest, f)
+            os.replace(tmp, manifest_path)
+        except Exception as e:
+            logger.warning(f"[鸣潮·下载工具] 摘要清单写入失败: {e}")
+
+
+def _stat_key(path: Path) -> Optional[StatKey]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def _record_digest(path: Path, stat_key: Optional[StatKey], digest: str):
+    if stat_key is None:
+        return
+    with _MANIFEST_LOCK:
+        _load_manifest()[str(path)] = [*stat_key, digest]
+
+
+def _forget_digest(path: Path):
+    with _MANIFEST_LOCK:
+        _load_manifest().pop(str(path), None)
+
+
+def get_file_digests(paths: Iterable[Path]) -> Dict[Path, Optional[str]]:
+    """批量取 SHA256。stat 命中清单的直接返回, 其余在线程池中并行计算; 读取失败为 None"""
+    manifest = _load_manifest()
+    result: Dict[Path, Optional[str]] = {}
+    pending: List[Tuple[Path, StatKey]] = []
+    for path in paths:
+        stat_key = _stat_key(path)
+        if stat_key is None:
+            result[path] = None
+            continue
+        entry = manifest.get(str(path))
+        if entry and tuple(entry[:3]) == stat_key:
+            result[path] = entry[3]
+        else:
+            pending.append((path, stat_key))
+
+    if not pending:
+        return result
+
+    def _hash(item: Tuple[Path, StatKey]) -> Optional[str]:
+        try:
+            return get_file_hash_sha256(item[0])
+        except Exception as e:
+            logger.error(f"[鸣潮·下载工具] 计算文件 {item[0]} hash 失败: {e}")
+            return None
+
+    workers = min(len(pending), (os.cpu_count() or 1) + 4, 32)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = list(executor.map(_hash, pending))
+    for (path, stat_key), digest in zip(pending, digests):
+        result[path] = digest
+        if digest is not None:
+            _record_digest(path, stat_key, digest)
+    return result
+
+
 def check_file_hash(path: Path) -> bool:
     hash_file = path / "hash.json"
     if not hash_file.exists():
@@ -133,37 +239,30 @@ def check_file_hash(path: Path) -> bool:
         logger.error(f"[鸣潮·下载工具] 读取 hash.json 失败: {e}")
         return False
 
-    deleted = False
-
-    for file in path.iterdir():
-        if file.is_file() and file.suffix != '.json':
-            filename = file.name
-
-            if filename in hash_data:
-                try:
-                    file_hash = get_file_hash_sha256(file)
-                    expected_hash = hash_data[filename]
-
-                    if file_hash != expected_hash:
-                        logger.info(f"[鸣潮·下载工具] 文件 {filename} hash 不匹配，已删除")
-                        file.unlink()
-                        deleted = True
-                except Exception as e:
-                    logger.error(f"[鸣潮·下载工具] 检查文件 {filename} hash 失败: {e}")
+    files = [
+        file
+        for file in path.iterdir()
+        if file.is_file() and file.suffix != '.json' and file.name in hash_data
+    ]
+    digests = get_file_digests(files)
 
+    deleted = False
+    for file in files:
+        file_hash = digests.get(file)
+        if file_hash is None or file_hash == hash_data[file.name]:
+            continue
+        try:
+            logger.info(f"[鸣潮·下载工具] 文件 {file.name} hash 不匹配，已删除")
+            file.unlink()
+            _forget_digest(file)
+            deleted = True
+        except Exception as e:
+            logger.error(f"[鸣潮·下载工具] 检查文件 {file.name} hash 失败: {e}")
+
+    save_hash_manifest()
     return deleted
 
 
-
-def _is_same_file(src_file: Path, dst_file: Path) -> bool:
-    if not dst_file.exists():
-        return False
-    try:
-        return get_file_hash(src_file) == get_file_hash(dst_file)
-    except Exception:
-        return False
-
-
 def _replace_or_skip(tmp: str, dst_file: Path, src_file: Path) -> bool:
     try:
         if dst_file.exists():
@@ -189,10 +288,15 @@ def _atomic_copy_tree(src, dst):
     files = [f for f in src_path.rglob("*") if f.is_file()]
     # 锁敏感的编译扩展先复制
     files.sort(key=lambda p: p.suffix.lower() not in (".pyd", ".so", ".dll", ".dylib"))
+    pairs = [(src_file, Path(dst) / src_file.relative_to(src_path)) for src_file in files]
+    digests = get_file_digests(
+        [src_file for src_file, _ in pairs]
+        + [dst_file for _, dst_file in pairs if dst_file.exists()]
+    )
     updated = 0
-    for src_file in files:
-        dst_file = Path(dst) / src_file.relative_to(src_path)
-        if _is_same_file(src_file, dst_file):
+    for src_file, dst_file in pairs:
+        src_digest = digests.get(src_file)
+        if src_digest is not None and digests.get(dst_file) == src_digest:
             continue
         dst_file.parent.mkdir(parents=True, exist_ok=True)
         fd, tmp = tempfile.mkstemp(dir=dst_file.parent, prefix=".tmp_")
@@ -201,12 +305,15 @@ def _atomic_copy_tree(src, dst):
             shutil.copy2(src_file, tmp)
             if _replace_or_skip(tmp, dst_file, src_file):
                 updated += 1
+                if src_digest is not None:
+                    _record_digest(dst_file, _stat_key(dst_file), src_digest)
         except Exception:
             try:
                 os.unlink(tmp)
             except OSError:
                 pass
             raise
+    save_hash_manifest()
     return updated
 
 
@@ -255,20 +362,19 @@ def _copy_if_different(src, dst, name, soft=False):
     if dst_path.exists() and count_files(dst_path, "*.py") > 0:
         return False
 
-    needs_update = False
-
-    for src_file in sorted(src_path.rglob("*")):
-        if src_file.is_file() and not src_file.suffix == ".json":
-            rel_path = src_file.relative_to(src)
-            dst_file = Path(dst) / rel_path
-
-            if not dst_file.exists():
-                needs_update = True
-                break
-
-            if get_file_hash(src_file) != get_file_hash(dst_file):
-                needs_update = True
-                break
+    pairs = [
+        (src_file, dst_path / src_file.relative_to(src_path))
+        for src_file in sorted(src_path.rglob("*"))
+        if src_file.is_file() and not src_file.suffix == ".json"
+    ]
+    needs_update = any(not dst_file.exists() for _, dst_file in pairs)
+    if not needs_update:
+        digests = get_file_digests([f for pair in pairs for f in pair])
+        save_hash_manifest()
+        needs_update = any(
+            digests.get(src_file) is None or digests.get(src_file) != digests.get(dst_file)
+            for src_file, dst_file in pairs
+        )
 
     if needs_update:
         if not soft:
@@ -1,24 +1,29 @@
+import json
+from typing import Any, Dict, Tuple, Callable
+
 from gsuid_core.logger import logger
 
 
+def _convert(value):
+    if isinstance(value, str):
+        if "%" in value:
+            value.replace("%", "")
+        try:
+            value = float(value)
+        except ValueError as _:
+            pass
+    elif isinstance(value, list):
+        return [_convert(item) for item in value]
+    return value
+
+
 def convert_wrapper(func):
     def wrapper(a, b):
-        def convert(value):
-            if isinstance(value, str):
-                if "%" in value:
-                    value.replace("%", "")
-                try:
-                    value = float(value)
-                except ValueError as _:
-                    pass
-            elif isinstance(value, list):
-                return [convert(item) for item in value]
-            return value
-
-        a = convert(a)
-        b = convert(b)
+        a = _convert(a)
+        b = _convert(b)
         return func(a, b)
 
+    wrapper.raw = func
     return wrapper
 
 
@@ -67,6 +72,24 @@ class ExpressionFunc:
         return a not in b
 
 
+LOGICAL_OPERATIONS = {
+    "&&": all,
+    "||": any,
+    "!": lambda v: not list(v)[0],
+}
+
+COMPARISON_OPERATIONS = {
+    "=": ExpressionFunc.func_equal,
+    "!=": ExpressionFunc.func_not_equal,
+    "<": ExpressionFunc.func_less_than,
+    ">": ExpressionFunc.func_greater_than,
+    "<=": ExpressionFunc.func_less_than_or_equal,
+    ">=": ExpressionFunc.func_greater_than_or_equal,
+    "in": ExpressionFunc.func_in,
+    "!in": ExpressionFunc.func_not_in,
+}
+
+
 class ExpressionEvaluator:
     def __init__(self, ctx):
         self.ctx = ctx
@@ -75,40 +98,96 @@ class ExpressionEvaluator:
         return self._evaluate_expression(expression["op"], expression)
 
     def _evaluate_expression(self, op, expression):
-        if op in {"&&", "||", "!"}:
+        if op in LOGICAL_OPERATIONS:
             return self._evaluate_logical(op, expression["sub"])
         else:
             return self._evaluate_comparison(expression)
 
     def _evaluate_logical(self, op, childs):
-        operations = {
-            "&&": all,
-            "||": any,
-            "!": lambda v: not list(v)[0],
-        }
-        operation = operations[op]
+        operation = LOGICAL_OPERATIONS[op]
         return operation(self.evaluate(child) for child in childs)
 
     def _evaluate_comparison(self, expression):
-        operations = {
-            "=": ExpressionFunc.func_equal,
-            "!=": ExpressionFunc.func_not_equal,
-            "<": ExpressionFunc.func_less_than,
-            ">": ExpressionFunc.func_greater_than,
-            "<=": ExpressionFunc.func_less_than_or_equal,
-            ">=": ExpressionFunc.func_greater_than_or_equal,
-            "in": ExpressionFunc.func_in,
-            "!in": ExpressionFunc.func_not_in,
-        }
         key, op, value = expression["key"], expression["op"], expression["value"]
-        return operations[op](self.ctx.get(key), value)
+        return COMPARISON_OPERATIONS[op](self.ctx.get(key), value)
+
+
+CompiledExpression = Callable[[Any], Any]
+
+
+def _raise_later(exc: Exception) -> CompiledExpression:
+    # 解释器只在求值到该节点时才报错 (短路分支里的坏节点不报错), 编译结果保持一致
+    def fail(ctx):
+        raise exc
+
+    return fail
+
+
+def _compile_node(expression) -> CompiledExpression:
+    try:
+        op = expression["op"]
+        if op in LOGICAL_OPERATIONS:
+            childs = tuple(_compile_node(child) for child in expression["sub"])
+        else:
+            key, value = expression["key"], expression["value"]
+            func = COMPARISON_OPERATIONS[op]
+    except Exception as e:
+        return _raise_later(e)
+
+    if op == "&&":
+        return lambda ctx: all(child(ctx) for child in childs)
+    if op == "||":
+        return lambda ctx: any(child(ctx) for child in childs)
+    if op == "!":
+        # 与解释器一致: 先求值全部子节点, 再对第一个取反
+        return lambda ctx: not [child(ctx) for child in childs][0]
+
+    raw = getattr(func, "raw", None)
+    if raw is None:
+        return lambda ctx: func(ctx.get(key), value)
+    # 常量操作数只转换一次, 上下文取值仍按原规则逐次转换
+    const = _convert(value)
+    return lambda ctx: raw(_convert(ctx.get(key)), const)
+
+
+_compiled_by_id: Dict[int, Tuple[Any, CompiledExpression]] = {}
+_compiled_by_source: Dict[str, CompiledExpression] = {}
+_COMPILED_CACHE_MAX = 4096
+
+
+def compile_expression(expression) -> CompiledExpression:
+    """把条件树编译为 ctx -> 结果 的闭包。
+
+    先按对象身份缓存 (同时持有引用, 防止 id 复用); 未命中时按 JSON 内容缓存,
+    同一份表达式被反复重新加载也只编译一次。
+    """
+    entry = _compiled_by_id.get(id(expression))
+    if entry is not None and entry[0] is expression:
+        return entry[1]
+
+    try:
+        source = json.dumps(expression, sort_keys=True, ensure_ascii=False)
+    except (TypeError, ValueError):
+        source = None
+
+    compiled = _compiled_by_source.get(source) if source is not None else None
+    if compiled is None:
+        compiled = _compile_node(expression)
+        if source is not None:
+            if len(_compiled_by_source) >= _COMPILED_CACHE_MAX:
+                _compiled_by_source.clear()
+            _compiled_by_source[source] = compiled
+
+    if len(_compiled_by_id) >= _COMPILED_CACHE_MAX:
+        _compiled_by_id.clear()
+    _compiled_by_id[id(expression)] = (expression, compiled)
+    return compiled
 
 
 def find_first_matching_expression(ctx, expressions, default="calc.json"):
-    evaluator = ExpressionEvaluator(ctx)
     for expr in expressions:
         try:
-            if evaluator.evaluate(expr):
+            if compile_expression(expr)(ctx):
                 return expr["choose"]
         except Exception as e:
             logger.exception(f"[鸣潮·伤害计算] {e}")
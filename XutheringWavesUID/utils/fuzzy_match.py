@@ -1,13 +1,15 @@
 """基于拼音 + 字面相似度的"你可能想找"通用模糊匹配。
 
 pypinyin / rapidfuzz 都是可选依赖, 缺则降级。
+每个别名表首次查询时建一次索引 (拼音音节 / 汉字 / 拼音字母倒排),
+查询只对倒排召回、且按字母重合下界可能达到 min_score 的候选打分。
 """
 
 from __future__ import annotations
 
 import difflib
 from collections import Counter
-from typing import Dict, List, Tuple, Iterable
+from typing import Set, Dict, List, Tuple
 
 from gsuid_core.logger import logger
 
@@ -25,19 +27,19 @@ def _import_pypinyin():
 
 def _import_rapidfuzz():
     try:
-        from rapidfuzz import fuzz  # type: ignore
-        return fuzz
+        from rapidfuzz import fuzz, process  # type: ignore
+        return fuzz, process
     except Exception:
         logger.warning("[鸣潮·模糊匹配] 未安装rapidfuzz，安装后模糊匹配更快, 且支持'近子串'容错加分。")
         logger.info("[鸣潮·模糊匹配] 安装方法 Linux/Mac: 在当前目录下执行 source .venv/bin/activate && uv pip install rapidfuzz")
         logger.info("[鸣潮·模糊匹配] 安装方法 Windows: 在当前目录下执行 .venv\\Scripts\\activate; uv pip install rapidfuzz")
-        return None
+        return None, None
 
 
 lazy_pinyin, Style = _import_pypinyin()
 _HAS_PYPINYIN = lazy_pinyin is not None
 
-_rf_fuzz = _import_rapidfuzz()
+_rf_fuzz, _rf_process = _import_rapidfuzz()
 _HAS_RAPIDFUZZ = _rf_fuzz is not None
 
 
@@ -77,47 +79,165 @@ def _ratio(a: str, b: str) -> float:
     return difflib.SequenceMatcher(None, a, b).ratio()
 
 
-def _reorder_ratio(query: str, name: str, query_py_sorted: str, name_py_sorted: str) -> float:
-    """处理音节顺序颠倒 — 拼音 token 多重集重合率, 比字符级度量更严格。
-
-    无 pypinyin 时退化为整串拼音字母排序 ratio。
-    """
-    if not _HAS_PYPINYIN:
-        return _ratio(query_py_sorted, name_py_sorted)
-    qt = _to_pinyin_tokens(query).split()
-    nt = _to_pinyin_tokens(name).split()
+def _token_overlap(qt: Counter, nt: Counter) -> float:
+    """处理音节顺序颠倒 — 拼音 token 多重集重合率, 比字符级度量更严格。"""
     if not qt or not nt:
         return 0.0
-    overlap = sum((Counter(qt) & Counter(nt)).values())
-    return overlap / max(len(qt), len(nt))
-
-
-def _score_pair(query_norm: str, query_py: str, query_py_sorted: str, name: str) -> float:
-    """对比 query 和单个候选名，返回 [0,1] 分数。"""
-    n_lower = name.lower()
-    n_py = _to_pinyin(name)
-    n_py_sorted = "".join(sorted(n_py))
-
-    s = max(
-        _ratio(query_norm, n_lower),
-        _ratio(query_py, n_py),
-        _reorder_ratio(query_norm, name, query_py_sorted, n_py_sorted),
-    )
-
-    # 子串加分: 短拼音串 <3 字符时跳过, 避免短缩写产生大量噪声命中
-    if query_py and n_py:
-        short = min(len(query_py), len(n_py))
-        long_ = max(len(query_py), len(n_py))
-        if short >= 3:
-            if query_py in n_py or n_py in query_py:
-                s = max(s, 0.6 + 0.4 * short / long_)
-            elif _HAS_RAPIDFUZZ:
-                # 近子串: 用 partial_ratio 容许 typo / 漏字
-                pr = _rf_fuzz.partial_ratio(query_py, n_py) / 100.0
-                if pr >= 0.85:
-                    s = max(s, pr * (0.6 + 0.4 * short / long_))
-
-    return s
+    overlap = sum((qt & nt).values())
+    return overlap / max(sum(qt.values()), sum(nt.values()))
+
+
+def _exact_keys(lower: str, tokens: List[str]) -> Set[str]:
+    """拼音音节 / 汉字倒排键: 命中即直接进入打分"""
+    keys = {f"t:{t}" for t in tokens}
+    keys.update(f"h:{c}" for c in lower if not c.isascii() and not c.isspace())
+    return keys
+
+
+def _letter_keys(py: str) -> List[str]:
+    """拼音字母按出现次序编号 ("a1", "a2"...), 两串命中的公共键数即字母多重集重合数"""
+    seen: Counter = Counter()
+    keys = []
+    for c in py:
+        seen[c] += 1
+        keys.append(f"u:{c}{seen[c]}")
+    return keys
+
+
+def _is_mixed(s: str) -> bool:
+    return any(c.isascii() for c in s) and any(not c.isascii() for c in s)
+
+
+class _FuzzyIndex:
+    """单个别名表的模糊匹配索引, 预先算好每个名字的拼音特征与倒排表。
+
+    召回是精确的 (不丢任何能达到 min_score 的候选):
+    - 音节重排得分需要公共拼音音节, 汉字字面得分需要公共汉字, 二者由倒排直接召回;
+    - 其余度量 (拼音 ratio / partial_ratio / 子串 / 字母排序 ratio) 达到 min_score,
+      都要求两串拼音字母多重集至少重合 floor * 较短串长度, 由字母倒排计数筛出;
+    - 中英混排的名字或查询字面 ratio 不受该下界约束, 有公共字母即保留。
+    """
+
+    __slots__ = ("source", "canonicals", "owner", "lower", "py", "py_sorted", "tokens", "mixed", "postings")
+
+    def __init__(self, candidates: Dict[str, List[str]]):
+        self.source = candidates
+        self.canonicals: List[str] = []
+        self.owner: List[int] = []
+        self.lower: List[str] = []
+        self.py: List[str] = []
+        self.py_sorted: List[str] = []
+        self.tokens: List[Counter] = []
+        self.mixed: List[bool] = []
+        self.postings: Dict[str, List[int]] = {}
+
+        for canonical, aliases in candidates.items():
+            c_idx = len(self.canonicals)
+            self.canonicals.append(canonical)
+            for name in (canonical, *aliases):
+                idx = len(self.owner)
+                n_lower = name.lower()
+                n_py = _to_pinyin(name)
+                n_tokens = _to_pinyin_tokens(name).split()
+                self.owner.append(c_idx)
+                self.lower.append(n_lower)
+                self.py.append(n_py)
+                self.py_sorted.append("".join(sorted(n_py)))
+                self.tokens.append(Counter(n_tokens))
+                self.mixed.append(_is_mixed(n_lower))
+                for key in (*_exact_keys(n_lower, n_tokens), *_letter_keys(n_py)):
+                    self.postings.setdefault(key, []).append(idx)
+
+    def shortlist(self, q_lower: str, q_py: str, q_tokens: List[str], min_score: float) -> List[int]:
+        hit: Set[int] = set()
+        for key in _exact_keys(q_lower, q_tokens):
+            hit.update(self.postings.get(key, ()))
+
+        overlap: Dict[int, int] = {}
+        for key in _letter_keys(q_py):
+            for i in self.postings.get(key, ()):
+                overlap[i] = overlap.get(i, 0) + 1
+        # partial_ratio 可对齐到较短的边缘窗口, 其下界为 p/(2-p), p 为该路径的最低分
+        p = max(min_score, 0.85)
+        floor = min(min_score, p / (2 - p)) - 1e-9
+        q_mixed = _is_mixed(q_lower)
+        q_len = len(q_py)
+        for i, n in overlap.items():
+            if q_mixed or self.mixed[i] or n >= floor * min(q_len, len(self.py[i])):
+                hit.add(i)
+        return sorted(hit)
+
+
+_INDEX_CACHE_MAX = 16
+_index_cache: Dict[int, _FuzzyIndex] = {}
+
+
+def invalidate_fuzzy_index() -> None:
+    """别名表重载或原地修改后调用, 下次查询重建索引"""
+    _index_cache.clear()
+
+
+def _get_index(candidates: Dict[str, List[str]]) -> _FuzzyIndex:
+    """按别名表对象取索引; 别名数据变化须调用 invalidate_fuzzy_index。"""
+    index = _index_cache.get(id(candidates))
+    if index is not None and index.source is candidates:
+        return index
+    index = _FuzzyIndex(candidates)
+    _index_cache.pop(id(candidates), None)
+    if len(_index_cache) >= _INDEX_CACHE_MAX:
+        _index_cache.pop(next(iter(_index_cache)))
+    _index_cache[id(candidates)] = index
+    return index
+
+
+def _batch_ratio(query: str, names: List[str]) -> List[float]:
+    if not query:
+        return [0.0] * len(names)
+    if _HAS_RAPIDFUZZ and names:
+        row = [0.0] * len(names)
+        for _, score, i in _rf_process.extract(query, names, scorer=_rf_fuzz.ratio, limit=None):
+            if names[i]:
+                row[i] = score / 100.0
+        return row
+    return [_ratio(query, n) for n in names]
+
+
+def _score_shortlist(
+    index: _FuzzyIndex,
+    ids: List[int],
+    query_norm: str,
+    query_py: str,
+    query_py_sorted: str,
+    query_tokens: Counter,
+) -> List[float]:
+    """对召回的候选批量打分, 返回 [0,1] 分数, 与 ids 一一对应。"""
+    lower_ratio = _batch_ratio(query_norm, [index.lower[i] for i in ids])
+    py_ratio = _batch_ratio(query_py, [index.py[i] for i in ids])
+
+    scores: List[float] = []
+    for i, r_lower, r_py in zip(ids, lower_ratio, py_ratio):
+        n_py = index.py[i]
+        if _HAS_PYPINYIN:
+            # 处理音节顺序颠倒; 无 pypinyin 时退化为整串拼音字母排序 ratio
+            reorder = _token_overlap(query_tokens, index.tokens[i])
+        else:
+            reorder = _ratio(query_py_sorted, index.py_sorted[i])
+        s = max(r_lower, r_py, reorder)
+
+        # 子串加分: 短拼音串 <3 字符时跳过, 避免短缩写产生大量噪声命中
+        if query_py and n_py:
+            short = min(len(query_py), len(n_py))
+            long_ = max(len(query_py), len(n_py))
+            if short >= 3:
+                if query_py in n_py or n_py in query_py:
+                    s = max(s, 0.6 + 0.4 * short / long_)
+                elif _HAS_RAPIDFUZZ:
+                    # 近子串: 用 partial_ratio 容许 typo / 漏字
+                    pr = _rf_fuzz.partial_ratio(query_py, n_py) / 100.0
+                    if pr >= 0.85:
+                        s = max(s, pr * (0.6 + 0.4 * short / long_))
+        scores.append(s)
+    return scores
 
 
 def fuzzy_suggest(
@@ -144,20 +264,21 @@ def fuzzy_suggest(
     q_lower = q.lower()
     q_py = _to_pinyin(q)
     q_py_sorted = "".join(sorted(q_py))
+    q_tokens = _to_pinyin_tokens(q).split()
+
+    index = _get_index(candidates)
+    ids = index.shortlist(q_lower, q_py, q_tokens, min_score)
+    name_scores = _score_shortlist(index, ids, q_lower, q_py, q_py_sorted, Counter(q_tokens))
 
-    scores: Dict[str, float] = {}
-    for canonical, aliases in candidates.items():
-        names: Iterable[str] = (canonical, *aliases)
-        best = 0.0
-        for name in names:
-            s = _score_pair(q_lower, q_py, q_py_sorted, name)
-            if s > best:
-                best = s
-                if best >= 0.99:
-                    break
-        if best >= min_score:
-            scores[canonical] = best
+    # 与逐个扫描保持一致: 同一规范名命中 >=0.99 后不再看其余别名
+    best: Dict[int, float] = {}
+    for i, s in zip(ids, name_scores):
+        c_idx = index.owner[i]
+        cur = best.get(c_idx, 0.0)
+        if cur < 0.99 and s > cur:
+            best[c_idx] = s
 
+    scores = {index.canonicals[c]: s for c, s in best.items() if s >= min_score}
     result = sorted(scores.items(), key=lambda x: -x[1])[:top_n]
     if result:
         detail = ", ".join(f"{n}:{s:.3f}" for n, s in result)
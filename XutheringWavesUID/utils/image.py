@@ -1,9 +1,11 @@
 import os
 import random
 import base64
+import asyncio
 from io import BytesIO
+from functools import partial
 from contextvars import ContextVar
-from typing import Tuple, Union, Literal, Optional
+from typing import Any, Dict, Tuple, Union, Literal, Callable, Iterable, Optional, Awaitable
 from pathlib import Path
 
 # 面板编辑器预览用: 强制本次渲染的立绘/背景图。
@@ -24,6 +26,7 @@ from gsuid_core.models import Event
 from gsuid_core.utils.image.utils import sget
 from gsuid_core.utils.image.image_tools import crop_center_img
 
+from .cache_janitor import cache_janitor
 from .resource.RESOURCE_PATH import (
     AVATAR_PATH,
     CACHE_PATH,
@@ -192,6 +195,7 @@ def img_to_b64(path: Union[str, Path], quality: int = 0, bake: bool = False,
         path_hash = hashlib.md5(str(path.resolve()).encode()).hexdigest()[:8]
         bake_path = BAKE_PATH / f"{path.stem}_{path_hash}_q{quality}{size_tag}.webp"
         if bake_path.exists() and bake_path.stat().st_mtime >= path.stat().st_mtime:
+            cache_janitor.touch(bake_path)
             with open(bake_path, "rb") as f:
                 return "data:image/webp;base64," + base64.b64encode(f.read()).decode('utf-8')
         # 未命中：PIL 打开 → WebP → 写入烘焙
@@ -201,6 +205,7 @@ def img_to_b64(path: Union[str, Path], quality: int = 0, bake: bool = False,
         data = buffered.getvalue()
         try:
             bake_path.write_bytes(data)
+            cache_janitor.record(bake_path, len(data))
         except Exception:
             pass
         return "data:image/webp;base64," + base64.b64encode(data).decode('utf-8')
@@ -937,6 +942,7 @@ async def pic_download_from_url(
     webp_path = _path.with_suffix(".webp")
 
     if webp_path.exists():
+        cache_janitor.touch(webp_path)
         return Image.open(webp_path).convert("RGBA")
 
     if not _path.exists():
@@ -954,13 +960,40 @@ async def pic_download_from_url(
         try:
             img.save(webp_path, "WEBP", quality=85)
             _path.unlink(missing_ok=True)
+            cache_janitor.record(webp_path)
             logger.debug(f"[鸣潮·图像] 已将图片转为webp: {webp_path.name}")
         except Exception as e:
+            cache_janitor.record(_path)
             logger.warning(f"[鸣潮·图像] 转换webp失败: {e}")
+    else:
+        # 原链接即为 webp, 下载的文件本身就是缓存
+        cache_janitor.record(_path)
 
     return img
 
 
+async def prefetch_images(keys: Iterable[Any], loader: Callable[[Any], Awaitable[Image.Image]]) -> Dict[Any, Image.Image]:
+    """批量预取贴图 (去重), 供 to_thread 合成阶段直接取用; 读取失败的 key 不放入结果"""
+    keys = list(dict.fromkeys(keys))
+    imgs = await asyncio.gather(*[loader(k) for k in keys], return_exceptions=True)
+    return {k: img for k, img in zip(keys, imgs) if isinstance(img, Image.Image)}
+
+
+async def prefetch_square_avatars(resource_ids: Iterable[Union[int, str]]) -> Dict[Union[int, str], Image.Image]:
+    """批量预取方形头像, 读取失败的 id 不放入结果, 取用时配合 square_placeholder"""
+    return await prefetch_images(resource_ids, get_square_avatar)
+
+
+async def prefetch_pics_from_url(path: Path, pic_urls: Iterable[str]) -> Dict[str, Image.Image]:
+    """批量预取远程图片 (去重), 下载失败的 url 不放入结果"""
+    return await prefetch_images((u for u in pic_urls if u), partial(pic_download_from_url, path))
+
+
+def square_placeholder(size: int = 160) -> Image.Image:
+    """预取失败时的占位图 (半透明灰底)"""
+    return Image.new("RGBA", (size, size), (60, 60, 60, int(0.5 * 255)))
+
+
 async def get_custom_gaussian_blur(img: Image.Image) -> Image.Image:
     return _get_custom_gaussian_blur(img)
 
@@ -1,10 +1,17 @@
-import importlib
 import re
+import sys
+import importlib
+import threading
 from pathlib import Path
 
 from gsuid_core.logger import logger
 
-from ...damage.abstract import DamageRankRegister, DamageDetailRegister, ScoreDetailRegister
+from ...damage.abstract import (
+    DamageRankRegister,
+    ScoreDetailRegister,
+    DamageDetailRegister,
+    set_lazy_loader,
+)
 
 # 漂泊者男女共用同一份伤害模块，需要把女性 ID 显式重定向到男性 ID 的模块上
 ID_ALIASES = {
@@ -18,8 +25,11 @@ _SKIP_IDS = {"0000"}
 _DAMAGE_FILE_RE = re.compile(r"^damage_(\d+)(?:\.|$)")
 
 
+_WAVES_BUILD_DIR = Path(__file__).resolve().parent.parent / "waves_build"
+
+
 def _discover_id_mapping():
-    waves_build_dir = Path(__file__).resolve().parent.parent / "waves_build"
+    waves_build_dir = _WAVES_BUILD_DIR
     mapping = {}
     if waves_build_dir.is_dir():
         for entry in waves_build_dir.iterdir():
@@ -38,57 +48,81 @@ def _discover_id_mapping():
     return mapping
 
 
+def _dir_mtime() -> int:
+    try:
+        return _WAVES_BUILD_DIR.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+_mapping_mtime = _dir_mtime()
 ID_MAPPING = _discover_id_mapping()
 
-# 一次完整 reload_all_register 里, 单个 damage_<id>.py 会被 register_damage /
-# register_rank / register_score 各扫一遍, 加上 ID_MAPPING 里 1408→1406 / 1501→1502 /
-# 1605→1604 这类别名共用模块, 不做去重会被 reload 多次, 触发 SQLModel 等的
-# "类已存在" 警告。_reloaded_modules 在一次 reload_all_register 周期内共享, 保证
-# 每个模块文件 reload 一次即可。
+
+def _get_id_mapping():
+    """模块映射按目录 mtime 缓存, 目录有文件增删时才重新扫盘"""
+    global ID_MAPPING, _mapping_mtime
+    mtime = _dir_mtime()
+    if mtime != _mapping_mtime:
+        ID_MAPPING = _discover_id_mapping()
+        _mapping_mtime = mtime
+    return ID_MAPPING
+
+
+# 单个 damage_<id>.py 同时提供 damage_detail / rank / score_detail 三个注册表的内容,
+# 加上 ID_MAPPING 里 1408→1406 / 1501→1502 / 1605→1604 这类别名共用模块, 不做去重会
+# 被 reload 多次, 触发 SQLModel 等的 "类已存在" 警告。
+# 模块不再在启动时全部导入: find_class 首次查询某角色时才导入并一次注册三张表。
+# reload_all_register 只把已导入的模块记入 _stale_modules, 下次用到时 reload,
+# 每个模块文件在一个 reload 周期内仍只 reload 一次。
+_REGISTER_TARGETS = (
+    ("damage_detail", DamageDetailRegister),
+    ("rank", DamageRankRegister),
+    ("score_detail", ScoreDetailRegister),
+)
 _INITIAL_IMPORT_NOTICE_SHOWN = False
+_load_lock = threading.RLock()
+_attempted_ids: set = set()
+_stale_modules: set = set()
+
+
+def _import_damage_module(module_suffix):
+    module_path = f"..waves_build.damage_{module_suffix}"
+    module = importlib.import_module(module_path, package=__package__)
+    if module_suffix in _stale_modules:
+        _stale_modules.discard(module_suffix)
+        # 编译扩展 (.so/.pyd) reload 行为不稳定, 仅 reload .py / .pyc。
+        origin = ""
+        spec = getattr(module, "__spec__", None)
+        if spec is not None:
+            origin = getattr(spec, "origin", "") or ""
+        if origin.endswith((".py", ".pyc")):
+            module = importlib.reload(module)
+        else:
+            logger.debug(
+                f"[鸣潮·伤害注册] 跳过编译扩展 reload module={module_path} "
+                f"origin={origin}"
+            )
+    return module
 
-def _dynamic_load_and_register(attr_name, register_cls, force_reload=False, reloaded_set=None):
-    global _INITIAL_IMPORT_NOTICE_SHOWN, ID_MAPPING
-    # 重新扫盘以兼容「首装时模块尚未下载完，下载完成后再 reload」的路径
-    ID_MAPPING = _discover_id_mapping()
-    current_globals = globals()
-    if reloaded_set is None:
-        reloaded_set = set()
-    for char_id, module_suffix in ID_MAPPING.items():
-        module_path = f"..waves_build.damage_{module_suffix}"
-        try:
-            module = importlib.import_module(module_path, package=__package__)
-            if force_reload and module_suffix not in reloaded_set:
-                # 编译扩展 (.so/.pyd) reload 行为不稳定, 仅 reload .py / .pyc。
-                origin = ""
-                spec = getattr(module, "__spec__", None)
-                if spec is not None:
-                    origin = getattr(spec, "origin", "") or ""
-                if origin.endswith((".py", ".pyc")):
-                    importlib.reload(module)
-                else:
-                    logger.debug(
-                        f"[鸣潮·伤害注册] 跳过编译扩展 reload module={module_path} "
-                        f"origin={origin}"
-                    )
-                reloaded_set.add(module_suffix)
-            if not hasattr(module, attr_name):
-                logger.debug(
-                    f"[鸣潮·伤害注册] {module_path} 缺失 attr={attr_name} (char_id={char_id})"
-                )
-                continue
 
-            target_obj = getattr(module, attr_name)
-            if target_obj is None:
-                continue
-            if isinstance(target_obj, (list, dict)) and not target_obj:
-                continue
-            register_cls.register_class(char_id, target_obj)
-            global_var_name = f"{attr_name.split('_')[0]}_{char_id}"
-            current_globals[global_var_name] = target_obj
+def load_char_register(char_id: str):
+    """导入 char_id 对应的伤害模块并注册到三张表, 每个 reload 周期内每个角色只尝试一次"""
+    global _INITIAL_IMPORT_NOTICE_SHOWN
+    with _load_lock:
+        if char_id in _attempted_ids:
+            return
+        module_suffix = _get_id_mapping().get(char_id)
+        if module_suffix is None:
+            return
+        _attempted_ids.add(char_id)
 
+        module_path = f"..waves_build.damage_{module_suffix}"
+        reloading = module_suffix in _stale_modules
+        try:
+            module = _import_damage_module(module_suffix)
         except ImportError as e:
-            if not _INITIAL_IMPORT_NOTICE_SHOWN and not force_reload:
+            if not _INITIAL_IMPORT_NOTICE_SHOWN and not reloading:
                 logger.warning(
                     "[鸣潮·伤害注册] 计算模块未找到，请观察下载是否进行，"
                     "并等待下载完成后再进行其他操作，除非遇到下载问题。"
@@ -96,25 +130,43 @@ def _dynamic_load_and_register(attr_name, register_cls, force_reload=False, relo
                 _INITIAL_IMPORT_NOTICE_SHOWN = True
             logger.warning(
                 f"[鸣潮·伤害注册] ImportError module={module_path} char_id={char_id} "
-                f"attr={attr_name} reload={force_reload}: {e}"
+                f"reload={reloading}: {e}"
             )
+            return
         except Exception as e:
             logger.warning(
                 f"[鸣潮·伤害注册] {type(e).__name__} module={module_path} "
-                f"char_id={char_id} attr={attr_name} reload={force_reload}: {e}"
+                f"char_id={char_id} reload={reloading}: {e}"
             )
+            return
 
-
-def register_damage(reload=False, reloaded_set=None):
-    _dynamic_load_and_register(attr_name="damage_detail", register_cls=DamageDetailRegister, force_reload=reload, reloaded_set=reloaded_set)
+        current_globals = globals()
+        for attr_name, register_cls in _REGISTER_TARGETS:
+            target_obj = getattr(module, attr_name, None)
+            if target_obj is None:
+                logger.debug(
+                    f"[鸣潮·伤害注册] {module_path} 缺失 attr={attr_name} (char_id={char_id})"
+                )
+                continue
+            if isinstance(target_obj, (list, dict)) and not target_obj:
+                continue
+            register_cls.register_class(char_id, target_obj)
+            current_globals[f"{attr_name.split('_')[0]}_{char_id}"] = target_obj
 
 
-def register_rank(reload=False, reloaded_set=None):
-    _dynamic_load_and_register(attr_name="rank", register_cls=DamageRankRegister, force_reload=reload, reloaded_set=reloaded_set)
+def invalidate_damage_register():
+    """开启新的 reload 周期: 清空三张表, 已导入的伤害模块在下次用到时 reload 一次"""
+    with _load_lock:
+        for module_suffix in set(_get_id_mapping().values()):
+            module_name = f"{__package__.rsplit('.', 1)[0]}.waves_build.damage_{module_suffix}"
+            if module_name in sys.modules:
+                _stale_modules.add(module_suffix)
+        _attempted_ids.clear()
+        for _, register_cls in _REGISTER_TARGETS:
+            register_cls._id_cls_map.clear()
 
 
-def register_score(reload=False, reloaded_set=None):
-    _dynamic_load_and_register(attr_name="score_detail", register_cls=ScoreDetailRegister, force_reload=reload, reloaded_set=reloaded_set)
+set_lazy_loader(load_char_register)
 
 
 def reload_all_register():
@@ -127,11 +179,8 @@ def reload_all_register():
     register_weapon()
     register_echo()
 
-    # 一个 cycle 内三个 register 共享 reloaded_set, 同一 damage_<id>.py 只 reload 一次
-    reloaded_set = set()
-    register_damage(reload=True, reloaded_set=reloaded_set)
-    register_rank(reload=True, reloaded_set=reloaded_set)
-    register_score(reload=True, reloaded_set=reloaded_set)
+    # 伤害/排行/评分三张表改为按角色首次查询时加载, 这里只开启新的 reload 周期
+    invalidate_damage_register()
 
     register_char()
 
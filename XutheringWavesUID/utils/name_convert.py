@@ -1,10 +1,12 @@
 import json
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from typing import Dict, List, Callable, Optional
 
 from msgspec import json as msgjson
 
 from gsuid_core.logger import logger
 
+from .fuzzy_match import invalidate_fuzzy_index
 from .resource.RESOURCE_PATH import (
     MAP_PATH,
     MAP_ALIAS_PATH,
@@ -37,6 +39,87 @@ _echo_i18n_reverse: Dict[str, str] = {}
 
 _data_loaded = False
 
+_SEP = "\x00"
+
+
+class _AliasIndex:
+    """别名索引: 精确匹配走哈希表, 子串匹配走按 key 顺序拼接的单个字符串
+
+    子串查找用 str.find 在拼接串上一次完成, 命中位置二分回条目,
+    第一个命中即为原先按 dict 顺序线性扫描得到的 key。
+    alias_substring 为 False 时只对 key 做子串匹配, 别名仍需完全相等。
+    """
+
+    __slots__ = ("exact", "_order", "_alias_substring", "_blob", "_starts", "_keys")
+
+    def __init__(
+        self,
+        alias_data: Dict[str, List[str]],
+        transform: Optional[Callable[[str], str]] = None,
+        alias_substring: bool = True,
+    ):
+        exact: Dict[str, str] = {}
+        order: Dict[str, int] = {}
+        parts: List[str] = []
+        starts: List[int] = []
+        keys: List[str] = []
+        pos = 0
+        for key, aliases in alias_data.items():
+            order.setdefault(key, len(order))
+            for i, name in enumerate((key, *aliases)):
+                if transform:
+                    name = transform(name)
+                exact.setdefault(name, key)
+                if i and not alias_substring:
+                    continue
+                parts.append(name)
+                starts.append(pos)
+                keys.append(key)
+                pos += len(name) + 1
+        self.exact = exact
+        self._order = order
+        self._alias_substring = alias_substring
+        self._blob = _SEP.join(parts)
+        self._starts = starts
+        self._keys = keys
+
+    def _find(self, name: str) -> Optional[str]:
+        if not self._keys or _SEP in name:
+            return None
+        idx = self._blob.find(name)
+        if idx < 0:
+            return None
+        return self._keys[bisect_right(self._starts, idx) - 1]
+
+    def search(self, name: str) -> Optional[str]:
+        """按 dict 顺序返回第一个命中的 key"""
+        key = self._find(name)
+        if self._alias_substring:
+            return key
+        exact_key = self.exact.get(name)
+        if key is None or (exact_key is not None and self._order[exact_key] < self._order[key]):
+            return exact_key
+        return key
+
+    def resolve(self, name: str) -> Optional[str]:
+        """先精确匹配, 再子串匹配"""
+        key = self.exact.get(name)
+        if key is not None:
+            return key
+        return self._find(name)
+
+
+def _strip_sonata_suffix(name: str) -> str:
+    return name.rstrip("套")
+
+
+_char_index = _AliasIndex({})
+_weapon_index = _AliasIndex({})
+_sonata_index = _AliasIndex({})
+_echo_index = _AliasIndex({})
+# id2name 反向表: {name: 第一个对应的 id}
+_name2id: Dict[str, str] = {}
+
 
 def _normalize(name: str) -> str:
     """归一化名称: 小写并去除空格"""
@@ -146,6 +229,28 @@ def load_alias_data():
     with open(CUSTOM_ECHO_ALIAS_PATH, "w", encoding="UTF-8") as f:
         f.write(json.dumps(echo_alias_data, indent=2, ensure_ascii=False))
 
+    _rebuild_alias_index()
+
+
+def _rebuild_alias_index():
+    """根据当前别名数据重建索引, 全部构建完成后一次性替换; 模糊匹配索引随之失效"""
+    global _char_index, _weapon_index, _sonata_index, _echo_index
+    invalidate_fuzzy_index()
+    _char_index, _weapon_index, _sonata_index, _echo_index = (
+        _AliasIndex(char_alias_data, alias_substring=False),
+        _AliasIndex(weapon_alias_data, alias_substring=False),
+        _AliasIndex(sonata_alias_data, _strip_sonata_suffix),
+        _AliasIndex(echo_alias_data),
+    )
+
+
+def _rebuild_id_index():
+    global _name2id
+    name2id: Dict[str, str] = {}
+    for _id, name in id2name.items():
+        name2id.setdefault(name, _id)
+    _name2id = name2id
+
 
 def ensure_data_loaded(force: bool = False):
     """确保所有数据已加载
@@ -228,6 +333,7 @@ def ensure_data_loaded(force: bool = False):
     with open(CUSTOM_ID2NAME_PATH, "w", encoding="UTF-8") as f:
         f.write(json.dumps(id2name, indent=2, ensure_ascii=False))
 
+    _rebuild_id_index()
     _data_loaded = True
 
 
@@ -237,19 +343,12 @@ def alias_to_char_name(char_name: str) -> str:
     chs = _i18n_to_chs(char_name, _char_i18n_reverse)
     if chs:
         char_name = chs
-    for key, aliases in char_alias_data.items():
-        if char_name == key or char_name in aliases:
-            return key
-    for i in char_alias_data:
-        if (char_name in i) or (char_name in char_alias_data[i]):
-            return i
-    return char_name
+    return _char_index.resolve(char_name) or char_name
 
 
 def is_valid_char_name(char_name: str) -> bool:
     ensure_data_loaded()
-    all_names = set(char_alias_data.keys()) | {alias for aliases in char_alias_data.values() for alias in aliases}
-    return char_name in sorted(all_names, key=len, reverse=True)
+    return char_name in _char_index.exact
 
 
 def alias_to_char_name_optional(char_name: Optional[str]) -> Optional[str]:
@@ -260,13 +359,7 @@ def alias_to_char_name_optional(char_name: Optional[str]) -> Optional[str]:
     chs = _i18n_to_chs(char_name, _char_i18n_reverse)
     if chs:
         char_name = chs
-    for key, aliases in char_alias_data.items():
-        if char_name == key or char_name in aliases:
-            return key
-    for i in char_alias_data:
-        if (char_name in i) or (char_name in char_alias_data[i]):
-            return i
-    return None
+    return _char_index.resolve(char_name)
 
 
 def alias_to_char_name_list(char_name: str) -> List[str]:
@@ -275,13 +368,10 @@ def alias_to_char_name_list(char_name: str) -> List[str]:
     chs = _i18n_to_chs(char_name, _char_i18n_reverse)
     if chs:
         char_name = chs
-    for key, aliases in char_alias_data.items():
-        if char_name == key or char_name in aliases:
-            return aliases
-    for i in char_alias_data:
-        if (char_name in i) or (char_name in char_alias_data[i]):
-            return char_alias_data[i]
-    return []
+    key = _char_index.resolve(char_name)
+    if key is None:
+        return []
+    return char_alias_data.get(key, [])
 
 
 def char_id_to_char_name(char_id: str) -> Optional[str]:
@@ -296,13 +386,11 @@ def char_id_to_char_name(char_id: str) -> Optional[str]:
 def char_name_to_char_id(char_name: str) -> Optional[str]:
     ensure_data_loaded()
     char_name = alias_to_char_name(char_name)
-    for id, name in id2name.items():
-        if char_name == name:
-            from .resource.constant import SPECIAL_CHAR_RANK_MAP
-            mapped_id = SPECIAL_CHAR_RANK_MAP.get(id, id)
-            return mapped_id
-    else:
+    _id = _name2id.get(char_name)
+    if _id is None:
         return None
+    from .resource.constant import SPECIAL_CHAR_RANK_MAP
+    return SPECIAL_CHAR_RANK_MAP.get(_id, _id)
 
 
 def alias_to_weapon_name(weapon_name: str) -> str:
@@ -311,48 +399,30 @@ def alias_to_weapon_name(weapon_name: str) -> str:
     chs = _i18n_to_chs(weapon_name, _weapon_i18n_reverse)
     if chs:
         weapon_name = chs
-    for i in weapon_alias_data:
-        if (weapon_name in i) or (weapon_name in weapon_alias_data[i]):
-            return i
+    name = _weapon_index.search(weapon_name)
+    if name is not None:
+        return name
 
     if "专武" in weapon_name:
         char_name = weapon_name.replace("专武", "")
         name = alias_to_char_name(char_name)
         weapon_name = f"{name}专武"
 
-    for i in weapon_alias_data:
-        if (weapon_name in i) or (weapon_name in weapon_alias_data[i]):
-            return i
-
-    return weapon_name
+    return _weapon_index.search(weapon_name) or weapon_name
 
 
 def weapon_name_to_weapon_id(weapon_name: str) -> Optional[str]:
     ensure_data_loaded()
     weapon_name = alias_to_weapon_name(weapon_name)
-    for id, name in id2name.items():
-        if weapon_name == name:
-            return id
-    else:
-        return None
+    return _name2id.get(weapon_name)
 
 
 def alias_to_sonata_name(sonata_name: str | None) -> str | None:
     ensure_data_loaded()
     if sonata_name is None:
         return None
-    # Remove "套" character to make it optional
-    normalized_sonata_name = sonata_name.rstrip('套')
-    for i in sonata_alias_data:
-        # Check if normalized input matches the key (with "套" stripped)
-        normalized_key = i.rstrip('套')
-        if normalized_sonata_name in normalized_key:
-            return i
-        # Check if normalized input matches any alias (with "套" stripped)
-        for alias in sonata_alias_data[i]:
-            if normalized_sonata_name in alias.rstrip('套'):
-                return i
-    return None
+    # "套" 字可省略: 输入与 key/别名都去掉末尾的 "套" 再做子串匹配
+    return _sonata_index.search(_strip_sonata_suffix(sonata_name))
 
 
 def alias_to_echo_name(echo_name: str) -> str:
@@ -361,27 +431,13 @@ def alias_to_echo_name(echo_name: str) -> str:
     chs = _i18n_to_chs(echo_name, _echo_i18n_reverse)
     if chs:
         echo_name = chs
-    for i, j in echo_alias_data.items():
-        if echo_name == i:
-            return i
-        if echo_name in j:
-            return i
-        for k in j:
-            if k and echo_name in k:
-                return i
-        if echo_name in i:
-            return i
-    return echo_name
+    return _echo_index.search(echo_name) or echo_name
 
 
 def echo_name_to_echo_id(echo_name: str) -> Optional[str]:
     ensure_data_loaded()
     echo_name = alias_to_echo_name(echo_name)
-    for id, name in id2name.items():
-        if echo_name == name:
-            return id
-    else:
-        return None
+    return _name2id.get(echo_name)
 
 
 def easy_id_to_name(id: str, default: str = "") -> str:
@@ -1,4 +1,4 @@
-"""每用户级面板图绑定: PLAYER_PATH/<uid>/panel_card_pref.json, 角色名 → hash。
+"""每用户级面板图绑定: player_dir(uid)/panel_card_pref.json, 角色名 → hash。
 
 只放写读, 不做角色名校验也不查 hash 是否存在 — 那是调用方的事。
 故意不进库: 这是用户在他自己存档目录下的偏好文件, 跟随 uid 备份/迁移最自然。
@@ -12,7 +12,7 @@ from typing import Dict, Optional
 
 from gsuid_core.logger import logger
 
-from .resource.RESOURCE_PATH import PLAYER_PATH
+from .player_path import player_dir
 from .resource.constant import ID_FULL_CHAR_NAME
 
 
@@ -25,7 +25,7 @@ def pair_pin_key(char_id: object, fallback: str) -> str:
 
 
 def _path(uid: str) -> Path:
-    return PLAYER_PATH / str(uid) / _FILENAME
+    return player_dir(uid) / _FILENAME
 
 
 def load(uid: str) -> Dict[str, str]:
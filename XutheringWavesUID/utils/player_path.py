@@ -0,0 +1,140 @@
+"""逐 uid 数据目录的分片布局。
+
+目录由平铺的 PLAYER_PATH/<uid> 改为 PLAYER_PATH/ab/cd/<uid>, ab/cd 取 uid 的
+md5 前四位, 单个目录的条目数保持在几百以内。旧的平铺目录由 migrate_player_dirs_sync
+在运行中分批搬迁, 搬迁完成前 player_dir 对两种布局都能解析。
+"""
+
+import os
+import hashlib
+import threading
+from pathlib import Path
+from typing import Tuple, Union, Iterator, Optional
+
+from gsuid_core.logger import logger
+
+from .resource.RESOURCE_PATH import PLAYER_PATH
+
+# 全部平铺目录搬迁完成后写入, 之后 player_dir 不再回查旧路径
+SHARDED_FLAG = PLAYER_PATH / ".sharded"
+
+_HEX = frozenset("0123456789abcdef")
+_all_sharded = SHARDED_FLAG.exists()
+
+# 手动命令与定时任务都会在线程中搬迁, 同一时间只允许一个搬迁在跑
+_MIGRATE_LOCK = threading.Lock()
+
+
+def _is_shard_name(name: str) -> bool:
+    return len(name) == 2 and all(c in _HEX for c in name)
+
+
+def shard_dir(uid: Union[str, int], root: Path = PLAYER_PATH) -> Path:
+    uid = str(uid)
+    digest = hashlib.md5(uid.encode("utf-8")).hexdigest()
+    return root / digest[:2] / digest[2:4] / uid
+
+
+def player_dir(uid: Union[str, int]) -> Path:
+    """uid 的数据目录。分片目录优先, 未搬迁的旧平铺目录次之, 都不存在时返回分片目录"""
+    uid = str(uid)
+    sharded = shard_dir(uid)
+    if _all_sharded or sharded.exists():
+        return sharded
+    legacy = PLAYER_PATH / uid
+    if legacy.is_dir():
+        return legacy
+    return sharded
+
+
+def iter_player_dirs(root: Path = PLAYER_PATH) -> Iterator[Path]:
+    """遍历两种布局下的全部 uid 目录, 目录名即 uid"""
+    if not root.exists():
+        return
+    with os.scandir(root) as top:
+        for entry in top:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            if not _is_shard_name(entry.name):
+                yield Path(entry.path)
+                continue
+            with os.scandir(entry.path) as mid:
+                for sub in mid:
+                    if not _is_shard_name(sub.name) or not sub.is_dir():
+                        continue
+                    with os.scandir(sub.path) as leaf:
+                        for uid_entry in leaf:
+                            if uid_entry.is_dir():
+                                yield Path(uid_entry.path)
+
+
+def _merge_into(src: Path, dst: Path):
+    """目标已存在时逐项合并: 目标缺失或较旧的文件用 src 覆盖, 之后删除 src"""
+    with os.scandir(src) as it:
+        entries = list(it)
+    for entry in entries:
+        target = dst / entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if target.exists():
+                    _merge_into(Path(entry.path), target)
+                else:
+                    os.replace(entry.path, target)
+            elif not target.exists() or entry.stat().st_mtime > target.stat().st_mtime:
+                os.replace(entry.path, target)
+            else:
+                os.unlink(entry.path)
+        except FileNotFoundError:
+            continue
+    try:
+        src.rmdir()
+    except OSError:
+        pass
+
+
+def migrate_player_dirs_sync(limit: Optional[int] = None, wait: bool = True) -> Tuple[int, int, bool]:
+    """把平铺 uid 目录搬到分片目录, 每次最多 limit 个, 可随时中断后续跑。
+
+    目录整体 rename 是原子的; 搬迁期间被旧路径重新写出的目录在下一轮按 mtime 合并。
+    搬迁由 _MIGRATE_LOCK 串行化; wait=False 时已有搬迁在跑则直接返回 (0, 0, False)。
+    返回 (本次搬迁数, 失败数, 是否已全部完成)。
+    """
+    if not _MIGRATE_LOCK.acquire(blocking=wait):
+        return 0, 0, False
+    try:
+        return _migrate_player_dirs(limit)
+    finally:
+        _MIGRATE_LOCK.release()
+
+
+def _migrate_player_dirs(limit: Optional[int]) -> Tuple[int, int, bool]:
+    global _all_sharded
+
+    moved = fail = 0
+    if not PLAYER_PATH.exists():
+        return moved, fail, True
+    with os.scandir(PLAYER_PATH) as it:
+        for entry in it:
+            if entry.name.startswith(".") or _is_shard_name(entry.name) or not entry.is_dir():
+                continue
+            if limit is not None and moved >= limit:
+                return moved, fail, False
+            src = Path(entry.path)
+            dst = shard_dir(entry.name)
+            try:
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                if dst.exists():
+                    _merge_into(src, dst)
+                else:
+                    os.rename(src, dst)
+                moved += 1
+            except Exception as e:
+                logger.warning(f"[鸣潮·数据目录] 搬迁失败 {src} -> {dst}: {e}")
+                fail += 1
+
+    if fail:
+        return moved, fail, False
+    if not _all_sharded:
+        SHARDED_FLAG.touch()
+        _all_sharded = True
+    return moved, fail, True
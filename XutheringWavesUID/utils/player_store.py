@@ -8,6 +8,8 @@ from typing import Any, Optional, Union
 
 from gsuid_core.logger import logger
 
+from .player_path import iter_player_dirs
+
 _GZIP_NAMES = {
     "rawData.json",
     "rover.json",
@@ -141,11 +143,7 @@ def compress_existing_sync(player_root: PathLike) -> tuple[int, int, int, int]:
     root = Path(player_root)
     done = fail = 0
     before = after = 0
-    if not root.exists():
-        return done, fail, before, after
-    for uid_dir in root.iterdir():
-        if not uid_dir.is_dir():
-            continue
+    for uid_dir in iter_player_dirs(root):
         for name in _GZIP_NAMES:
             plain = uid_dir / name
             gz = uid_dir / (name + ".gz")
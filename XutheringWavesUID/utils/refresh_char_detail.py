@@ -20,7 +20,8 @@ from .queues.const import QUEUE_SCORE_RANK
 from .queues.queues import push_item
 from .expression_ctx import WavesCharRank, get_waves_char_rank, _compute_one_char_rank
 from ..wutheringwaves_config import PREFIX, WutheringWavesConfig
-from .resource.RESOURCE_PATH import PLAYER_PATH, CACHE_PATH
+from .player_path import player_dir
+from .resource.RESOURCE_PATH import CACHE_PATH
 from .char_info_utils import get_all_roleid_detail_info_int
 from .player_store import read_player_json, write_player_json, player_json_exists
 from .char_state import record_refresh_batch
@@ -69,7 +70,7 @@ def schedule_silent_diff_refresh(
 
 async def save_base_info_cache(uid: str, account_info: _AccountBaseInfo):
     """将账户基本信息（世界等级等）缓存到文件"""
-    _dir = PLAYER_PATH / uid
+    _dir = player_dir(uid)
     _dir.mkdir(parents=True, exist_ok=True)
     path = _dir / "baseInfo.json"
     try:
@@ -81,7 +82,7 @@ async def save_base_info_cache(uid: str, account_info: _AccountBaseInfo):
 
 async def load_base_info_cache(uid: str) -> Optional[_AccountBaseInfo]:
     """从缓存文件读取账户基本信息"""
-    path = PLAYER_PATH / uid / "baseInfo.json"
+    path = player_dir(uid) / "baseInfo.json"
     if not path.exists():
         return None
     try:
@@ -239,7 +240,7 @@ async def save_card_info(
 ):
     if len(waves_data) == 0:
         return
-    _dir = PLAYER_PATH / uid
+    _dir = player_dir(uid)
     _dir.mkdir(parents=True, exist_ok=True)
     path = _dir / "rawData.json"
 
@@ -391,7 +392,7 @@ async def save_char_list_cache(uid: str, waves_char_rank: Optional[List[WavesCha
         # 加载现有的角色评分数据
         existing_char_list_data = await load_char_list_data(uid)
         if existing_char_list_data is None:
-            if (PLAYER_PATH / uid / "charListData.json").exists():
+            if (player_dir(uid) / "charListData.json").exists():
                 logger.error(f"[鸣潮·角色状态] charListData 读取失败, 跳过保存防覆盖 uid={uid}")
                 return
             existing_char_list_data = {}
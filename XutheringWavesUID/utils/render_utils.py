@@ -12,6 +12,7 @@ from gsuid_core.logger import logger
 from gsuid_core.config import core_config, CONFIG_DEFAULT
 from gsuid_core.app_life import app as fastapi_app
 from fastapi.staticfiles import StaticFiles
+from .cache_janitor import cache_janitor
 from .resource.RESOURCE_PATH import TEMP_PATH
 from ..wutheringwaves_config.wutheringwaves_config import WutheringWavesConfig
 from ..wutheringwaves_config.config_default import CONFIG_DEFAULT as WW_CONFIG_DEFAULT
@@ -434,7 +435,9 @@ def _bake_image_to_webp(
 
     img.save(bake_path, "WEBP", quality=quality)
     with open(bake_path, "rb") as f:
-        return f.read()
+        data = f.read()
+    cache_janitor.record(bake_path, len(data))
+    return data
 
 
 async def get_image_b64_with_cache(
@@ -482,6 +485,7 @@ async def get_image_b64_with_cache(
 
         # 命中烘焙缓存 — 直接读文件 + base64，跳过 PIL
         if bake_path.exists() and bake_path.stat().st_mtime >= local_path.stat().st_mtime:
+            cache_janitor.touch(bake_path)
             with open(bake_path, "rb") as f:
                 data = f.read()
             return f"data:image/webp;base64,{base64.b64encode(data).decode('utf-8')}"
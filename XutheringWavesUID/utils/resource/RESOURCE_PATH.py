@@ -22,6 +22,8 @@ GACHA_BACKUP_PATH = MAIN_PATH / "backup" / "gacha_backup"
 
 # 储存数据保存路径
 CACHE_PATH = MAIN_PATH / "cache"
+# AI 知识库本地检索索引
+AI_RAG_INDEX_PATH = CACHE_PATH / "ai_rag_index.json"
 
 # 游戏素材
 RESOURCE_PATH = MAIN_PATH / "resource"
@@ -69,6 +71,8 @@ MAP_CHALLENGE_PATH = RESOURCE_PATH / "map" / "detail_json" / "challenge"
 MAP_FORTE_PATH = RESOURCE_PATH / "map" / "detail_json" / "forte"
 MAP_BUILD_PATH = BUILD_ROOT / "map" / "waves_build"
 MAP_BUILD_TEMP = MAIN_PATH / "build" / "map" / "waves_build"
+# 构建文件摘要清单 (路径, 大小, mtime, sha256), 见 download_utils
+BUILD_HASH_MANIFEST = MAIN_PATH / "build" / "hash_manifest.json"
 MAP_ALIAS_PATH = MAP_PATH / "alias"
 LOCALIZATION_PATH = MAP_PATH / "i18n"
 
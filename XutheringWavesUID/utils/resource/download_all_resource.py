@@ -235,35 +235,37 @@ async def download_all_resource(force: bool = False):
 async def reload_all_modules():
     # 强制加载所有 map 数据
     from ..name_convert import ensure_data_loaded as ensure_name_convert_loaded
-    from ..ascension.char import ensure_data_loaded as ensure_char_loaded
-    from ..ascension.echo import ensure_data_loaded as ensure_echo_loaded
-    from ..ascension.sonata import ensure_data_loaded as ensure_sonata_loaded
-    from ..ascension.weapon import ensure_data_loaded as ensure_weapon_loaded
+    from ..ascension.snapshot import load_tables, publish_snapshot
     from ..map.damage.register import reload_all_register
     from ..limit_user_card import load_limit_user_card
     from ..calc import reload_wuwacalc_module
     from ..damage.damage import reload_damage_module
+    from ..localization import init_localization
     from ...wutheringwaves_wiki.char_wiki_render import clear_wiki_cache
 
-    # 在下载完成后强制加载所有数据
-    ensure_name_convert_loaded(force=True)
-    ensure_char_loaded(force=True)
-    ensure_weapon_loaded(force=True)
-    ensure_echo_loaded(force=True)
-    ensure_sonata_loaded(force=True)
-    
+    def _load_data_files():
+        # 别名 / 名称映射与升级数据都是文件读取, 一并放在线程中完成, 不阻塞事件循环
+        ensure_name_convert_loaded(force=True)
+        return load_tables()
+
+    tables = await asyncio.to_thread(_load_data_files)
+
+    # 以下同步执行, 中间没有 await: 处理中的命令只会看到完整的旧数据或完整的新数据。
+    # 升级数据整份快照一次引用替换发布, 版本号递增, 依赖它的 memo 随之失效
+    snapshot = publish_snapshot(tables)
+    logger.debug(f"[鸣潮·资源] 升级数据快照已发布, 版本 {snapshot.version}")
+
     reload_wuwacalc_module()
     reload_damage_module()
     reload_all_register()
     clear_wiki_cache()
+    # 重新加载本地化字典
+    init_localization()
+
     card_list = await load_limit_user_card()
     if card_list:
         logger.info(f"[鸣潮·加载角色极限面板] 数量: {len(card_list)}")
 
-    # 重新加载本地化字典
-    from ..localization import init_localization
-    init_localization()
-
     # 重新注册 AI 知识库（仅 AI 启用时生效）
     from ...wutheringwaves_ai_rag import reload_ai_rag
     await reload_ai_rag()
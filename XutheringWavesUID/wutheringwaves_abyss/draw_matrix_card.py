@@ -20,7 +20,8 @@ from ..utils.char_info_utils import get_all_roleid_detail_info, get_rover_detail
 from ..utils.player_store import write_player_json
 from ..utils.queues.const import QUEUE_MATRIX_RECORD
 from ..utils.queues.queues import push_item
-from ..utils.resource.RESOURCE_PATH import PLAYER_PATH, MATRIX_PATH, waves_templates
+from ..utils.player_path import player_dir
+from ..utils.resource.RESOURCE_PATH import MATRIX_PATH, waves_templates
 from ..utils.image import pil_to_b64, get_waves_bg, get_event_avatar, CHAIN_COLOR, get_skill_branch_emblem_b64
 from ._colors import get_matrix_score_class
 from .period import get_matrix_period_number
@@ -110,7 +111,7 @@ async def save_matrix_record(
 ):
     """保存矩阵记录到本地文件，包含匹配到的角色ID"""
     try:
-        _dir = PLAYER_PATH / uid
+        _dir = player_dir(uid)
         _dir.mkdir(parents=True, exist_ok=True)
         path = _dir / "matrixData.json"
 
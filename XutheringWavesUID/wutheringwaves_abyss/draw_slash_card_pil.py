@@ -43,7 +43,8 @@ from ..utils.fonts.waves_fonts import (
     waves_font_40,
     waves_font_42,
 )
-from ..utils.resource.RESOURCE_PATH import SLASH_PATH, PLAYER_PATH
+from ..utils.player_path import player_dir
+from ..utils.resource.RESOURCE_PATH import SLASH_PATH
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
 
@@ -343,7 +344,7 @@ async def save_slash_record(
 ):
     """保存无尽记录到本地文件"""
     try:
-        _dir = PLAYER_PATH / uid
+        _dir = player_dir(uid)
         _dir.mkdir(parents=True, exist_ok=True)
         path = _dir / "slashData.json"
 
@@ -1,5 +1,8 @@
-import json
 import re
+import json
+import time
+import asyncio
+import hashlib
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -745,11 +748,19 @@ def _register_guides(char_meta: Dict[str, Dict]) -> int:
     return count
 
 
+def _refresh_search_index():
+    """本地 BM25 索引与已注册的 KP 保持一致, 只重新分词内容有变化的条目"""
+    from gsuid_core.ai_core.register import _ENTITIES
+    from .search_index import refresh_kb_index
+    refresh_kb_index(e for e in _ENTITIES if e.get("plugin") == PLUGIN)
+
+
 def register_all():
     # 先清旧实体: 即便资源缺失也得把上一次留下的 KP/Image 清掉, 避免向量库残留过期条目。
     _clear_self_entries()
     if not MAP_DETAIL_PATH.exists():
         logger.warning(f"[鸣潮·AI-RAG] {MAP_DETAIL_PATH} 不存在，跳过 wiki 注册")
+        _refresh_search_index()
         return
     aliases = {
         "char": _load_alias("char_alias.json"),
@@ -778,6 +789,7 @@ def register_all():
     period_count = _register_period_indexes()
     for a in aliases.values():
         _register_aliases(a)
+    _refresh_search_index()
     logger.info(
         f"[鸣潮·AI-RAG] 注册完成: 角色 {len(chars)} | 武器 {len(weapons)} "
         f"| 怪物索引 {len(monsters)} | 攻略图 {guide_count} 张 "
@@ -785,11 +797,62 @@ def register_all():
     )
 
 
-async def reload_ai_rag():
+_source_digest: Optional[str] = None
+_last_full_cost = 0.0
+
+
+async def _compute_source_digest() -> str:
+    from .source_digest import files_fingerprint, runtime_fingerprint
+    files = await asyncio.to_thread(files_fingerprint, HELP_JSON_PATH)
+    return f"{files}:{runtime_fingerprint()}"
+
+
+def _entity_digest(entity: Dict[str, Any]) -> str:
+    raw = json.dumps(entity, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _apply_entity_diff(registry: List[Dict[str, Any]], old: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+    """按 id + 内容摘要比对本插件新旧条目, 未变化的条目换回旧对象, 返回 (新增, 变化, 删除)"""
+    old_by_id = {e.get("id"): (e, _entity_digest(e)) for e in old}
+    added = changed = 0
+    new_ids = set()
+    for i, e in enumerate(registry):
+        if e.get("plugin") != PLUGIN:
+            continue
+        eid = e.get("id")
+        new_ids.add(eid)
+        prev = old_by_id.get(eid)
+        if prev is None:
+            added += 1
+        elif prev[1] == _entity_digest(e):
+            registry[i] = prev[0]
+        else:
+            changed += 1
+    removed = sum(1 for eid in old_by_id if eid not in new_ids)
+    return added, changed, removed
+
+
+async def reload_ai_rag(force: bool = False):
     """资源下载后调用：重新注册 + 推送向量库同步。AI 未启用时自动 no-op。
+    数据源指纹 (文件内容摘要 + 当前期数 + 帮助数据) 未变化时整轮跳过;
+    指纹变化时重注册并失效工具缓存; 只有 KP/Image 确有新增/变化/删除时才推送向量库。
     register_all 中途失败时回滚到旧实体状态, 避免内存里残留半成品。
     sync_knowledge 单独 try/except, 失败不影响 in-memory 已注册的新实体。"""
+    global _source_digest, _last_full_cost
     from gsuid_core.ai_core.register import _ENTITIES, _IMAGE_ENTITIES
+    start = time.perf_counter()
+    try:
+        digest: Optional[str] = await _compute_source_digest()
+    except Exception as e:
+        logger.warning(f"[鸣潮·AI-RAG] 数据源指纹计算失败, 按全量重注册处理: {e}")
+        digest = None
+    if not force and digest is not None and digest == _source_digest:
+        logger.info(
+            f"[鸣潮·AI-RAG] 数据源未变化, 跳过重注册 "
+            f"(指纹耗时 {time.perf_counter() - start:.2f}s, 节省约 {_last_full_cost:.2f}s)"
+        )
+        return
     own_entities_backup = [e for e in _ENTITIES if e.get("plugin") == PLUGIN]
     own_images_backup = [e for e in _IMAGE_ENTITIES if e.get("plugin") == PLUGIN]
     try:
@@ -800,13 +863,30 @@ async def reload_ai_rag():
         _IMAGE_ENTITIES.extend(own_images_backup)
         logger.warning(f"[鸣潮·AI-RAG] register_all 失败, 已回滚到旧实体状态: {e}")
         return
+    _source_digest = digest
+    kp_diff = _apply_entity_diff(_ENTITIES, own_entities_backup)
+    image_diff = _apply_entity_diff(_IMAGE_ENTITIES, own_images_backup)
+    diff_desc = (
+        f"KP 新增 {kp_diff[0]} / 变化 {kp_diff[1]} / 删除 {kp_diff[2]}, "
+        f"图片 新增 {image_diff[0]} / 变化 {image_diff[1]} / 删除 {image_diff[2]}"
+    )
+    # 工具缓存直接读源文件 (别名等不进 _ENTITIES), 指纹变了就必须失效
     try:
         from . import tools as _tools  # noqa: F401
         _tools.invalidate_caches()
+    except Exception as e:
+        logger.warning(f"[鸣潮·AI-RAG] 工具缓存失效失败: {e}")
+    if not any(kp_diff) and not any(image_diff):
+        _last_full_cost = time.perf_counter() - start
+        logger.info(f"[鸣潮·AI-RAG] 重注册后无条目变化, 跳过向量同步 ({diff_desc})")
+        return
+    try:
         from gsuid_core.ai_core.rag.knowledge import sync_knowledge
         await sync_knowledge()
     except Exception as e:
-        logger.warning(f"[鸣潮·AI-RAG] 缓存失效/向量同步失败 (in-memory 已生效): {e}")
+        logger.warning(f"[鸣潮·AI-RAG] 向量同步失败 (in-memory 已生效): {e}")
+    _last_full_cost = time.perf_counter() - start
+    logger.info(f"[鸣潮·AI-RAG] 增量重载完成: {diff_desc}, 耗时 {_last_full_cost:.2f}s")
 
 
 @scheduler.scheduled_job(
@@ -821,7 +901,23 @@ async def waves_rag_periodic_reload():
     await reload_ai_rag()
 
 
-register_all()
+def _initial_register():
+    """启动注册并记下数据源指纹, 随后资源检查触发的 reload_ai_rag 在数据未变时直接跳过。
+    启动时只取文件 stat 签名, 不为算指纹再读一遍 register_all 已读过的文件。"""
+    global _source_digest, _last_full_cost
+    from .source_digest import files_fingerprint, runtime_fingerprint
+    start = time.perf_counter()
+    try:
+        digest: Optional[str] = f"{files_fingerprint(HELP_JSON_PATH, hash_contents=False)}:{runtime_fingerprint()}"
+    except Exception as e:
+        logger.warning(f"[鸣潮·AI-RAG] 数据源指纹计算失败: {e}")
+        digest = None
+    register_all()
+    _source_digest = digest
+    _last_full_cost = time.perf_counter() - start
+
+
+_initial_register()
 
 # 触发 tools.py 里的 @ai_tools 装饰器（必须在 register_all 之后，确保 AI 已就绪）
 from . import tools as _tools_module  # noqa: F401, E402
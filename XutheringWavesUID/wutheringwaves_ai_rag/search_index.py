@@ -0,0 +1,222 @@
+"""本插件 KP 的本地 BM25 检索索引。
+
+- 分词: ASCII 按词, 中日韩连续片段按二元组 (单字片段保留单字), 标题/标签加权
+- 倒排表: term -> {kp_id: tf}; 每条 KP 另存正排词频, 删除/更新时按它撤销倒排
+- 增量: 按 KP 内容摘要对比, 只重新分词新增/变化的条目, 删除已消失的条目
+- 持久化: 正排词频 + 摘要写入 AI_RAG_INDEX_PATH, 启动时读回即可检索, 无需重新分词
+"""
+
+import os
+import re
+import math
+import heapq
+import hashlib
+import tempfile
+from collections import Counter
+from typing import Any, Dict, List, Tuple, Iterable, Optional
+
+from msgspec import json as msgjson
+
+from gsuid_core.logger import logger
+
+from ..utils.resource.RESOURCE_PATH import AI_RAG_INDEX_PATH
+
+INDEX_FORMAT = 1
+TITLE_WEIGHT = 3
+TAG_WEIGHT = 2
+# search_kb 兜底结果至少命中的查询词元比例
+KB_MIN_COVERAGE = 0.6
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+|[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+
+
+def tokenize(text: str) -> List[str]:
+    tokens: List[str] = []
+    for run in _TOKEN_RE.findall(text.lower()):
+        if run.isascii() or len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def kp_digest(kp: Dict[str, Any]) -> str:
+    raw = msgjson.encode([kp.get("title", ""), kp.get("content", ""), list(kp.get("tags") or [])])
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _kp_terms(kp: Dict[str, Any]) -> Dict[str, int]:
+    counter = Counter(tokenize(kp.get("content", "")))
+    for token in tokenize(kp.get("title", "")):
+        counter[token] += TITLE_WEIGHT
+    for tag in kp.get("tags") or []:
+        for token in tokenize(str(tag)):
+            counter[token] += TAG_WEIGHT
+    return dict(counter)
+
+
+class Bm25Index:
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        self.digests: Dict[str, str] = {}
+        self.doc_terms: Dict[str, Dict[str, int]] = {}
+        self.doc_len: Dict[str, int] = {}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def _add(self, doc_id: str, doc: Dict[str, Any], digest: str, terms: Dict[str, int]):
+        self.docs[doc_id] = doc
+        self.digests[doc_id] = digest
+        self.doc_terms[doc_id] = terms
+        length = sum(terms.values())
+        self.doc_len[doc_id] = length
+        self._total_len += length
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+
+    def _remove(self, doc_id: str):
+        terms = self.doc_terms.pop(doc_id, {})
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self.postings[term]
+        self._total_len -= self.doc_len.pop(doc_id, 0)
+        self.docs.pop(doc_id, None)
+        self.digests.pop(doc_id, None)
+
+    def update(self, kps: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """以 kps 为全量更新索引, 返回 (重新分词条数, 删除条数)"""
+        seen = set()
+        indexed = 0
+        for kp in kps:
+            doc_id = kp.get("id")
+            if not doc_id or doc_id in seen:
+                continue
+            seen.add(doc_id)
+            digest = kp_digest(kp)
+            if self.digests.get(doc_id) == digest:
+                continue
+            self._remove(doc_id)
+            doc = {
+                "id": doc_id,
+                "title": kp.get("title", ""),
+                "content": kp.get("content", ""),
+                "tags": list(kp.get("tags") or []),
+            }
+            self._add(doc_id, doc, digest, _kp_terms(doc))
+            indexed += 1
+        stale = [doc_id for doc_id in self.docs if doc_id not in seen]
+        for doc_id in stale:
+            self._remove(doc_id)
+        return indexed, len(stale)
+
+    def search(
+        self, query: str, limit: int = 6, min_coverage: float = 0.0
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """min_coverage: 条目至少要命中查询词元 (去重) 的比例, 只共享个别常见词元的条目不返回"""
+        n = len(self.docs)
+        if not n:
+            return []
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        avgdl = self._total_len / n or 1.0
+        scores: Dict[str, float] = {}
+        matched: Dict[str, int] = {}
+        for term in terms:
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for doc_id, tf in posting.items():
+                norm = self.k1 * (1 - self.b + self.b * self.doc_len[doc_id] / avgdl)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+        need = min_coverage * len(terms)
+        candidates = [(doc_id, score) for doc_id, score in scores.items() if matched[doc_id] >= need]
+        top = heapq.nlargest(limit, candidates, key=lambda x: x[1])
+        return [(score, self.docs[doc_id]) for doc_id, score in top]
+
+    def dump(self) -> bytes:
+        return msgjson.encode({
+            "format": INDEX_FORMAT,
+            "docs": {
+                doc_id: [doc, self.digests[doc_id], self.doc_terms[doc_id]]
+                for doc_id, doc in self.docs.items()
+            },
+        })
+
+    @classmethod
+    def load(cls, raw: bytes) -> "Bm25Index":
+        data = msgjson.decode(raw)
+        index = cls()
+        if data.get("format") != INDEX_FORMAT:
+            return index
+        for doc_id, (doc, digest, terms) in data.get("docs", {}).items():
+            index._add(doc_id, doc, digest, terms)
+        return index
+
+
+_kb_index: Optional[Bm25Index] = None
+
+
+def get_kb_index() -> Bm25Index:
+    """首次访问时读取磁盘上的索引, 读取失败则从空索引开始。
+    register_all 末尾的刷新会先调用这里, 检索路径不会再碰磁盘。"""
+    global _kb_index
+    if _kb_index is None:
+        try:
+            _kb_index = Bm25Index.load(AI_RAG_INDEX_PATH.read_bytes())
+        except FileNotFoundError:
+            _kb_index = Bm25Index()
+        except Exception as e:
+            logger.warning(f"[鸣潮·AI-RAG] 本地检索索引读取失败, 将重建: {e}")
+            _kb_index = Bm25Index()
+    return _kb_index
+
+
+def _save_kb_index(index: Bm25Index):
+    try:
+        AI_RAG_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=AI_RAG_INDEX_PATH.parent, prefix=".tmp_")
+        with os.fdopen(fd, "wb") as f:
+            f.write(index.dump())
+        os.replace(tmp, AI_RAG_INDEX_PATH)
+    except Exception as e:
+        logger.warning(f"[鸣潮·AI-RAG] 本地检索索引写入失败: {e}")
+
+
+def refresh_kb_index(kps: Iterable[Dict[str, Any]]):
+    """用当前注册的全部 KP 增量刷新索引, 有变化时落盘"""
+    index = get_kb_index()
+    indexed, removed = index.update(kps)
+    if indexed or removed:
+        _save_kb_index(index)
+    logger.info(
+        f"[鸣潮·AI-RAG] 本地检索索引: 共 {len(index)} 条, "
+        f"重新分词 {indexed} 条, 删除 {removed} 条"
+    )
+
+
+def search_kb(query: str, limit: int = 6, min_coverage: float = KB_MIN_COVERAGE) -> List[Dict[str, Any]]:
+    """BM25 检索本插件 KP, 返回带 _bm25 分数的条目。
+
+    只查内存索引: 索引尚未由 register_all 加载时返回空列表, 不在事件循环里读盘。
+    """
+    if _kb_index is None:
+        return []
+    hits = []
+    for score, doc in _kb_index.search(query, limit, min_coverage):
+        entry = dict(doc)
+        entry["_bm25"] = round(score, 4)
+        hits.append(entry)
+    return hits
@@ -0,0 +1,94 @@
+"""AI-RAG 数据源指纹, 供 reload_ai_rag 判断本轮是否需要重新注册。
+
+指纹覆盖 register_all 的全部输入: detail_json / 别名 / help.json 的文件内容,
+攻略图路径, 当前深塔/海墟/矩阵期数 (影响「本期/上期」标签) 以及帮助数据里按配置拼接的部分。
+文件内容摘要按 (size, mtime_ns) 缓存, 未变化的文件只 stat 不重读;
+启动时只记录 stat 签名 (register_all 本身已读过全部文件, 不再重复读一遍算摘要),
+之后 reload 时仅对 stat 有变化的文件读取内容计算摘要。
+"""
+
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Tuple, Iterable
+
+from msgspec import json as msgjson
+
+from gsuid_core.logger import logger
+
+from ..utils.resource.RESOURCE_PATH import GUIDE_PATH, MAP_PATH, MAP_DETAIL_PATH
+
+_file_digests: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _file_digest(path: Path, hash_contents: bool) -> str:
+    try:
+        st = path.stat()
+    except OSError:
+        return ""
+    key = str(path)
+    cached = _file_digests.get(key)
+    if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached[2]
+    if not hash_contents:
+        digest = f"stat:{st.st_size}:{st.st_mtime_ns}"
+        _file_digests[key] = (st.st_size, st.st_mtime_ns, digest)
+        return digest
+    try:
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+    _file_digests[key] = (st.st_size, st.st_mtime_ns, digest)
+    return digest
+
+
+def _iter_files(root: Path, pattern: str) -> Iterable[Path]:
+    if not root.exists():
+        return []
+    return sorted(p for p in root.rglob(pattern) if p.is_file())
+
+
+def files_fingerprint(help_json_path: Path, hash_contents: bool = True) -> str:
+    """数据文件部分的指纹, 只做文件 IO, 可放在线程中执行。
+
+    hash_contents 为 False 时未缓存的文件只取 stat 签名, 不读内容。
+    """
+    h = hashlib.sha1()
+    seen = set()
+    for root, pattern in (
+        (MAP_DETAIL_PATH, "*.json"),
+        (MAP_PATH / "alias", "*.json"),
+    ):
+        for p in _iter_files(root, pattern):
+            seen.add(str(p))
+            h.update(f"{p.relative_to(root)}\0{_file_digest(p, hash_contents)}\n".encode())
+    seen.add(str(help_json_path))
+    h.update(f"help\0{_file_digest(help_json_path, hash_contents)}\n".encode())
+    # 攻略图只登记路径, 内容不进 KP, 按文件名即可
+    for p in _iter_files(GUIDE_PATH, "*"):
+        h.update(f"guide\0{p.relative_to(GUIDE_PATH)}\n".encode())
+    for key in [k for k in _file_digests if k not in seen]:
+        del _file_digests[key]
+    return h.hexdigest()
+
+
+def runtime_fingerprint() -> str:
+    """期数与帮助数据部分的指纹 (依赖当前时间与配置)"""
+    from ..wutheringwaves_abyss.period import (
+        get_slash_period_number,
+        get_tower_period_number,
+        get_matrix_period_number,
+    )
+
+    parts: Dict[str, Any] = {
+        "tower": get_tower_period_number(),
+        "slash": get_slash_period_number(),
+        "matrix": get_matrix_period_number(),
+    }
+    try:
+        from ..wutheringwaves_help.get_help import get_help_data
+
+        parts["help"] = json.dumps(get_help_data(), sort_keys=True, ensure_ascii=False, default=str)
+    except Exception as e:
+        logger.debug(f"[鸣潮·AI-RAG] 帮助数据指纹计算失败, 仅按 help.json 文件判断: {e}")
+    return hashlib.sha1(msgjson.encode(parts)).hexdigest()
@@ -4,12 +4,14 @@
 """
 
 import json
+from collections import Counter
 from typing import Any, Dict, List, Optional, Set
 
 from gsuid_core.logger import logger
 
 from ...utils.resource.RESOURCE_PATH import MAP_DETAIL_PATH, MAP_CHALLENGE_PATH, MAP_PATH
 from ...utils.resource.constant import ATTRIBUTE_ID_MAP, WEAPON_TYPE_ID_MAP
+from ..search_index import Bm25Index
 
 ATTR_MAP = ATTRIBUTE_ID_MAP
 WEAPON_TYPE_MAP = WEAPON_TYPE_ID_MAP
@@ -23,6 +25,10 @@ _echoes_cache: Optional[List[Dict[str, Any]]] = None
 _monster_resist_cache: Optional[Dict[str, Set[str]]] = None
 _weapon_alias_cache: Optional[Dict[str, List[str]]] = None
 _char_id_to_name_cache: Optional[Dict[str, str]] = None
+_monster_name_index: Optional[Bm25Index] = None
+
+# BM25 兜底候选需达到的字符 Dice 相似度; 只共享一个二元组的无关怪物会被拒掉
+MONSTER_NAME_MIN_SIMILARITY = 0.7
 
 
 def _read_json(p) -> Any:
@@ -146,6 +152,33 @@ def load_monster_resist() -> Dict[str, Set[str]]:
     return out
 
 
+def _name_similarity(a: str, b: str) -> float:
+    common = sum((Counter(a) & Counter(b)).values())
+    return 2 * common / (len(a) + len(b)) if a and b else 0.0
+
+
+def find_monster_names(monster_name: str, limit: int = 5) -> List[str]:
+    """怪物名匹配: 精确 → 子串 → 二元组 BM25 兜底 (多字/少字/错一字也能命中)
+
+    兜底候选须与查询名的字符相似度达到 MONSTER_NAME_MIN_SIMILARITY, 都不达标时返回空列表。
+    """
+    global _monster_name_index
+    table = load_monster_resist()
+    if monster_name in table:
+        return [monster_name]
+    matches = [n for n in table if monster_name in n or n in monster_name]
+    if matches:
+        return matches
+    if _monster_name_index is None:
+        _monster_name_index = Bm25Index()
+        _monster_name_index.update({"id": n, "title": n} for n in table)
+    hits = _monster_name_index.search(monster_name, max(limit, 10))
+    return [
+        doc["id"] for _, doc in hits
+        if _name_similarity(monster_name, doc["id"]) >= MONSTER_NAME_MIN_SIMILARITY
+    ][:limit]
+
+
 def load_weapon_alias() -> Dict[str, List[str]]:
     global _weapon_alias_cache
     if _weapon_alias_cache is not None:
@@ -169,9 +202,11 @@ def invalidate_caches():
     """resource reload 后清缓存，下次访问重建。"""
     global _chars_cache, _weapons_cache, _echoes_cache
     global _monster_resist_cache, _weapon_alias_cache, _char_id_to_name_cache
+    global _monster_name_index
     _chars_cache = None
     _weapons_cache = None
     _echoes_cache = None
     _monster_resist_cache = None
     _weapon_alias_cache = None
     _char_id_to_name_cache = None
+    _monster_name_index = None
@@ -36,15 +36,23 @@ async def search_wuwa_kb(
         score_threshold: 相似度过滤阈值，低于此值的结果丢弃。默认 0.45。
 
     Returns:
-        命中 KP 列表的 str (含 title / content / tags / _score)；没结果时返回提示。
+        命中 KP 列表的 str (含 title / content / tags / _score)；向量结果不足 limit 时
+        用本地关键词索引补充 (带 _bm25 分数)。没结果时返回提示。
     """
     logger.info(
         f"[鸣潮·知识库搜索] query={query!r} limit={limit} "
         f"score_threshold={score_threshold}"
     )
+    # 本地 BM25 索引按关键词命中 (期数/ID/专有名词), 补足向量检索召回不稳定的部分;
+    # search_kb 只返回命中足够比例查询词元的条目, 只沾一个常见词的 KP 不会混进来
+    from ..search_index import search_kb
+    local_hits = search_kb(query, limit)
+
     try:
         from gsuid_core.ai_core.rag import query_knowledge
     except ImportError:
+        if local_hits:
+            return str(local_hits)
         return "AI 知识库模块不可用（AI 未启用）"
 
     plugin_filter = ["XutheringWavesUID"]
@@ -56,9 +64,12 @@ async def search_wuwa_kb(
         )
     except Exception as e:
         logger.exception("[鸣潮·知识库搜索] query_knowledge 失败")
-        return f"KB 检索失败: {e}"
+        if not local_hits:
+            return f"KB 检索失败: {e}"
+        points = []
 
     items = []
+    seen = set()
     for p in points:
         if p.payload is None:
             continue
@@ -67,10 +78,19 @@ async def search_wuwa_kb(
         entry = dict(p.payload)
         entry["_score"] = round(p.score, 4)
         items.append(entry)
+        seen.add(entry.get("id") or entry.get("title"))
+
+    vector_count = len(items)
+    for hit in local_hits:
+        if len(items) >= limit:
+            break
+        if hit["id"] in seen or hit["title"] in seen:
+            continue
+        items.append(hit)
 
     logger.info(
-        f"[鸣潮·知识库搜索] 命中 {len(items)} 条（raw {len(points)} 条，"
-        f"score_threshold={score_threshold}）"
+        f"[鸣潮·知识库搜索] 命中 {len(items)} 条（向量 {vector_count} 条 / raw {len(points)} 条，"
+        f"本地补充 {len(items) - vector_count} 条，score_threshold={score_threshold}）"
     )
     if not items:
         return (
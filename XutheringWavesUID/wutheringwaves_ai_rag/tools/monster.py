@@ -7,7 +7,7 @@ from pydantic_ai import RunContext
 from gsuid_core.ai_core.models import ToolContext
 from gsuid_core.ai_core.register import ai_tools
 
-from ._cache import ALL_ATTRS, load_chars, load_monster_resist
+from ._cache import ALL_ATTRS, load_chars, find_monster_names, load_monster_resist
 
 
 @ai_tools(category="self")
@@ -19,7 +19,7 @@ async def get_monster_resistance_wuwa(
 
     用于回答「云闪之鳞抗什么」「矩阵奇藏抗性」「伤痕怕什么」等。
     数据来自逆境深塔 Element 字段 + 全息矩阵 Tags 字段交叉聚合。
-    支持模糊匹配（子串）。
+    支持模糊匹配（子串, 再不中按字词相似度）。
 
     Args:
         monster_name: 怪物中文名。
@@ -30,13 +30,7 @@ async def get_monster_resistance_wuwa(
     table = load_monster_resist()
     if not monster_name:
         return "请提供怪物名"
-    matches: List[str] = []
-    if monster_name in table:
-        matches = [monster_name]
-    else:
-        for n in table:
-            if monster_name in n or n in monster_name:
-                matches.append(n)
+    matches = find_monster_names(monster_name)
     if not matches:
         return f"未在本地数据找到怪物「{monster_name}」（数据来源仅含深塔/矩阵收录的敌人）"
     lines = []
@@ -69,14 +63,8 @@ async def recommend_against_monster_wuwa(
     if not monster_name:
         return "请提供怪物名"
     table = load_monster_resist()
-    target = None
-    if monster_name in table:
-        target = monster_name
-    else:
-        for n in table:
-            if monster_name in n or n in monster_name:
-                target = n
-                break
+    matches = find_monster_names(monster_name, limit=1)
+    target = matches[0] if matches else None
     if not target:
         return f"未在本地数据找到怪物「{monster_name}」"
     resists = sorted(table[target])
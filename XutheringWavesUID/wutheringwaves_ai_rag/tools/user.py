@@ -2,7 +2,7 @@
 
 数据源：
 - DB: `WavesBind` (`get_uid_list_by_game(game_name=None)` = 鸣潮 uid 列；与战双 pgr_uid 区分)
-- 磁盘: `PLAYER_PATH/<uid>/rawData.json` (角色展柜) / `charListData.json` (评分缓存) / `baseInfo.json` (账号总览)
+- 磁盘: `player_dir(uid)/rawData.json` (角色展柜) / `charListData.json` (评分缓存) / `baseInfo.json` (账号总览)
 """
 
 from typing import Any, List, Optional
@@ -15,7 +15,7 @@ from gsuid_core.ai_core.register import ai_tools
 
 from ...utils.database.models import WavesBind
 from ...utils.char_info_utils import get_all_role_detail_info
-from ...utils.resource.RESOURCE_PATH import PLAYER_PATH
+from ...utils.player_path import player_dir
 from ._cache import load_char_id_to_name
 
 
@@ -57,7 +57,7 @@ async def _read_player_json(uid, filename: str) -> Optional[Any]:
     if not _validate_uid(uid):
         return None
     from ...utils.player_store import read_player_json
-    return await read_player_json(PLAYER_PATH / str(uid) / filename)
+    return await read_player_json(player_dir(uid) / filename)
 
 
 def _score_rating(score: float) -> str:
@@ -127,7 +127,7 @@ async def get_user_wuwa_char_list(
     )
     """查询某 UID 的鸣潮角色列表（已在展柜或绑定 cookie 拉取过），含等级/共鸣链/武器/谐振。
 
-    数据来自 PLAYER_PATH/<uid>/rawData.json（XW 缓存）。
+    数据来自 player_dir(uid)/rawData.json（XW 缓存）。
     用于回答「我有哪些角色 / 我练到哪几个了 / 列出我的角色」。
 
     Args:
@@ -275,7 +275,7 @@ async def get_user_wuwa_char_scores(
     )
     """查询某 UID 的练度评分排行（来自 charListData.json，XW 评分缓存）。
 
-    数据来源 `PLAYER_PATH/<uid>/charListData.json`，格式 `{roleId: score}`。
+    数据来源 `player_dir(uid)/charListData.json`，格式 `{roleId: score}`。
     用户练度统计图 `练度统计` 命令计算后会落盘到这里，AI 用同一份数据。
     用于回答「我练度最高的角色是谁 / 我前 N 强角色」。
 
@@ -334,7 +334,7 @@ async def get_user_wuwa_baseinfo(
     logger.info(f"[鸣潮·AI工具] get_user_wuwa_baseinfo 入口 uid={uid!r}")
     """查询某 UID 的鸣潮账号基本信息（漂泊者等级 / 世界等级 / 活跃天数 / 成就 / 角色数 / 奇藏箱数 / 周本进度等）。
 
-    数据源 `PLAYER_PATH/<uid>/baseInfo.json`，由 `卡片` 命令拉取后落盘。
+    数据源 `player_dir(uid)/baseInfo.json`，由 `卡片` 命令拉取后落盘。
     用于回答「我账号怎样 / 我等级多少 / 多少天了 / 多少成就」。
 
     Args:
@@ -1,18 +1,22 @@
 import os
 import time
 import asyncio
+from typing import Optional
 from pathlib import Path
 
 from gsuid_core.sv import SV
 from gsuid_core.aps import scheduler
 from gsuid_core.bot import Bot
+from gsuid_core.pool import to_thread
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.server import on_core_start
 from gsuid_core.subscribe import gs_subscribe
 
 from .ann_card import ann_list_card, ann_detail_card
+from .ann_push import ann_push_scheduler, get_unfinished_ann_ids
 from .anniv_report import anniv_report
+from ..utils.cache_janitor import cache_janitor
 from ..utils.single_flight import SingleFlightLock
 from ..utils.waves_api import waves_api
 from ..utils.limit_request import check_request_rate_limit
@@ -24,7 +28,7 @@ from ..utils.database.models import WavesBind, WavesUser
 from ..utils.database.waves_user_sdk import WavesUserSdk
 from ..wutheringwaves_config import WutheringWavesConfig
 from ..wutheringwaves_config.ann_config import get_ann_new_ids, set_ann_new_ids
-from ..utils.resource.RESOURCE_PATH import ANN_CARD_PATH, BAKE_PATH, CALENDAR_PATH, WIKI_CACHE_PATH
+from ..utils.resource.RESOURCE_PATH import WIKI_CACHE_PATH
 from ..wutheringwaves_resource.panel_editor.storage import PANEL_EDIT_TMP
 from ..utils.database.waves_subscribe import WavesSubscribe
 
@@ -37,69 +41,17 @@ task_name_ann = "订阅鸣潮公告"
 ann_minute_check: int = WutheringWavesConfig.get_config("AnnMinuteCheck").data
 ann_push_tasks: set[asyncio.Task] = set()
 _ann_poll_lock = asyncio.Lock()
-ANN_PUSH_CONCURRENCY = 1
+
+# 分片清理间隔与单次最多删除文件数
+CACHE_SLICE_MINUTES = 30
+CACHE_SLICE_LIMIT = 200
 
 # 周年报告触发锁
 anniv_report_lock = SingleFlightLock()
 
 
-async def _send_ann_to_one_subscribe(subscribe, img, ann_id, semaphore: asyncio.Semaphore) -> bool:
-    async with semaphore:
-        try:
-            await asyncio.sleep(3)
-            await subscribe.send(img)  # type: ignore
-            return True
-        except Exception as e:
-            target_id = subscribe.group_id or subscribe.user_id
-            logger.exception(
-                f"[鸣潮·公告] 公告 {ann_id} 推送到订阅 {target_id} 失败: {e}"
-            )
-            return False
-
-
-async def _push_new_announcements(new_ann_need_send, datas) -> None:
-    logger.info(
-        f"[鸣潮·公告] 后台推送开始: 公告数={len(new_ann_need_send)}, 订阅数={len(datas)}"
-    )
-    semaphore = asyncio.Semaphore(ANN_PUSH_CONCURRENCY)
-    # 渲染返字符串 (过期 / 未找到) 视为永久失败, 保留在已处理集合;
-    # 渲染异常或订阅全失败视为临时失败, 回退让下次轮询重试。
-    retry_ids: list = []
-
-    for ann_id in new_ann_need_send:
-        try:
-            img = await ann_detail_card(ann_id, is_check_time=True)
-            if isinstance(img, str):
-                logger.info(f"[鸣潮·公告] 公告 {ann_id} 跳过推送: {img}")
-                continue
-
-            results = await asyncio.gather(
-                *[
-                    _send_ann_to_one_subscribe(subscribe, img, ann_id, semaphore)
-                    for subscribe in datas
-                ]
-            )
-            success_count = sum(1 for result in results if result is True)
-            logger.info(
-                f"[鸣潮·公告] 公告 {ann_id} 推送完成: {success_count}/{len(datas)}"
-            )
-            if datas and success_count == 0:
-                retry_ids.append(ann_id)
-        except Exception as e:
-            logger.exception(f"[鸣潮·公告] 公告 {ann_id} 后台推送失败: {e}")
-            retry_ids.append(ann_id)
-
-    if retry_ids:
-        existing = get_ann_new_ids() or []
-        kept = [x for x in existing if x not in retry_ids]
-        set_ann_new_ids(kept)
-        logger.info(f"[鸣潮·公告] {len(retry_ids)} 个公告本轮未成功推送, 下次轮询重试")
-
-    logger.info("[鸣潮·公告] 推送完毕")
-
-
 def _create_ann_push_task(new_ann_need_send, datas) -> None:
-    task = asyncio.create_task(_push_new_announcements(list(new_ann_need_send), list(datas)))
+    task = asyncio.create_task(ann_push_scheduler.push(list(new_ann_need_send), list(datas)))
     ann_push_tasks.add(task)
 
     def _on_done(done_task: asyncio.Task) -> None:
@@ -278,6 +230,21 @@ async def unsub_ann_(bot: Bot, ev: Event):
     return await bot.send("未曾订阅鸣潮公告！")
 
 
+@on_core_start
+async def waves_resume_ann_push():
+    """启动时续推上次未推送完的公告"""
+    unfinished = get_unfinished_ann_ids()
+    if not unfinished:
+        return
+    if not WutheringWavesConfig.get_config("WavesAnnOpen").data:
+        return
+    datas = await gs_subscribe.get_subscribe(task_name_ann)
+    if not datas:
+        return
+    logger.info(f"[鸣潮·公告] 续推上次未完成的公告: {unfinished}")
+    _create_ann_push_task(unfinished, datas)
+
+
 @scheduler.scheduled_job("interval", minutes=ann_minute_check)
 async def waves_check_ann_job():
     if not WutheringWavesConfig.get_config("WavesAnnOpen").data:
@@ -331,40 +298,6 @@ async def _do_ann_poll(datas) -> None:
     logger.info("[鸣潮·公告] 已创建后台推送任务")
 
 
-def clean_old_cache_files(directory: Path, days: int) -> tuple[int, float]:
-    if not directory.exists():
-        logger.debug(f"[鸣潮·缓存清理] 目录不存在: {directory}")
-        return 0, 0.0
-
-    current_time = time.time()
-    cutoff_time = current_time - (days * 86400)  # 转换为秒
-
-    deleted_count = 0
-    freed_space = 0.0
-
-    try:
-        for file_path in directory.iterdir():
-            if not file_path.is_file():
-                continue
-
-            file_ctime = file_path.stat().st_ctime
-
-            if file_ctime < cutoff_time:
-                try:
-                    file_size = file_path.stat().st_size
-                    file_path.unlink()
-                    deleted_count += 1
-                    freed_space += file_size
-                    logger.debug(f"[鸣潮·缓存清理] 删除过期缓存文件: {file_path.name}")
-                except Exception as e:
-                    logger.error(f"[鸣潮·缓存清理] 删除文件失败 {file_path.name}: {e}")
-    except Exception as e:
-        logger.error(f"[鸣潮·缓存清理] 清理目录失败 {directory}: {e}")
-
-    freed_space_mb = freed_space / (1024 * 1024)
-    return deleted_count, freed_space_mb
-
-
 def clean_all_cache_files(directory: Path):
     deleted_count = 0
     freed_space = 0.0
@@ -392,22 +325,31 @@ def clean_all_cache_files(directory: Path):
     return deleted_count, freed_space_mb
 
 
-async def clean_cache_directories(days: int) -> str:
+@to_thread
+def _clean_indexed_cache(days: int, limit: Optional[int] = None, rescan: bool = False):
+    if rescan:
+        cache_janitor.reset_roots()
+    budget_mb = WutheringWavesConfig.get_config("CacheSizeBudgetMB").data
+    return cache_janitor.clean(days, budget_bytes=budget_mb * 1024 * 1024, limit=limit)
+
+
+async def clean_cache_directories(days: int, rescan: bool = False) -> str:
     results = []
     total_count = 0
     total_space = 0.0
 
-    ann_count, ann_space = clean_old_cache_files(ANN_CARD_PATH, days)
-    if ann_count > 0:
-        results.append(f"公告: {ann_count}个文件, {ann_space:.2f}MB")
-        total_count += ann_count
-        total_space += ann_space
+    try:
+        indexed = await _clean_indexed_cache(days, rescan=rescan)
+    except Exception as e:
+        logger.exception(f"[鸣潮·缓存清理] 按索引清理失败: {e}")
+        indexed = {}
 
-    cal_count, cal_space = clean_old_cache_files(CALENDAR_PATH, days)
-    if cal_count > 0:
-        results.append(f"日历: {cal_count}个文件, {cal_space:.2f}MB")
-        total_count += cal_count
-        total_space += cal_space
+    for root, label in (("ann", "公告"), ("calendar", "日历")):
+        count, space = indexed.get(root, (0, 0))
+        if count > 0:
+            results.append(f"{label}: {count}个文件, {space / 1024 / 1024:.2f}MB")
+            total_count += count
+            total_space += space / 1024 / 1024
 
     wiki_count, wiki_space = clean_all_cache_files(WIKI_CACHE_PATH)
     if wiki_count > 0:
@@ -416,18 +358,7 @@ async def clean_cache_directories(days: int) -> str:
         total_space += wiki_space
 
     # 烘焙缓存（含子目录）
-    bake_count, bake_space = 0, 0.0
-    if BAKE_PATH.exists():
-        cutoff = time.time() - (days * 86400)
-        for f in BAKE_PATH.rglob("*"):
-            if f.is_file() and f.stat().st_ctime < cutoff:
-                try:
-                    sz = f.stat().st_size
-                    f.unlink()
-                    bake_count += 1
-                    bake_space += sz
-                except Exception:
-                    pass
+    bake_count, bake_space = indexed.get("bake", (0, 0))
     if bake_count > 0:
         results.append(f"烘焙: {bake_count}个文件, {bake_space / 1024 / 1024:.2f}MB")
         total_count += bake_count
@@ -456,7 +387,7 @@ async def clean_cache_(bot: Bot, ev: Event):
     days = WutheringWavesConfig.get_config("CacheDaysToKeep").data
     logger.info(f"[鸣潮·缓存清理] 手动触发清理，保留{days}天内的文件")
 
-    result = await clean_cache_directories(days)
+    result = await clean_cache_directories(days, rescan=True)
     await bot.send(result)
 
 
@@ -470,6 +401,21 @@ async def waves_auto_clean_cache_daily():
     logger.info(f"[鸣潮·缓存清理] {result}")
 
 
+@scheduler.scheduled_job("interval", minutes=CACHE_SLICE_MINUTES)
+async def waves_clean_cache_slice():
+    """分片清理: 每次最多删除少量过期 / 超预算文件, 把清理摊到全天"""
+    days = WutheringWavesConfig.get_config("CacheDaysToKeep").data
+    try:
+        result = await _clean_indexed_cache(days, limit=CACHE_SLICE_LIMIT)
+    except Exception as e:
+        logger.exception(f"[鸣潮·缓存清理] 分片清理失败: {e}")
+        return
+    if result:
+        count = sum(c for c, _ in result.values())
+        space = sum(s for _, s in result.values()) / 1024 / 1024
+        logger.debug(f"[鸣潮·缓存清理] 分片清理: {count}个文件, {space:.2f}MB")
+
+
 @on_core_start
 async def waves_clean_cache_on_startup():
     """启动时清理一次缓存"""
@@ -0,0 +1,234 @@
+import time
+import asyncio
+from typing import Dict, List, Tuple, Optional
+
+from gsuid_core.logger import logger
+
+from .ann_card import ann_detail_card
+from ..wutheringwaves_config import WutheringWavesConfig
+from ..wutheringwaves_config.ann_config import (
+    get_ann_new_ids,
+    set_ann_new_ids,
+    get_ann_push_state,
+    set_ann_push_state,
+)
+
+# 推送进度落盘间隔: 每送达 N 条或每隔 N 秒写一次, 重启最多重发这一小段
+STATE_FLUSH_COUNT = 20
+STATE_FLUSH_SECONDS = 10
+
+
+class TokenBucket:
+    """令牌桶限速: rate 为每秒补充的令牌数, burst 为桶容量"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(rate, 0.001)
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def subscribe_key(subscribe) -> str:
+    """订阅的唯一标识, 用于持久化送达状态"""
+    target_id = subscribe.group_id or subscribe.user_id
+    return f"{subscribe.bot_id}:{subscribe.bot_self_id}:{target_id}"
+
+
+def _bot_key(subscribe) -> Tuple[str, str]:
+    return str(subscribe.bot_id), str(subscribe.bot_self_id)
+
+
+class _PushState:
+    """推送进度, 批量落盘到公告数据文件。
+
+    进程内只有一份 (见 _get_push_state), 所有推送任务共用, 避免各自持有的旧副本落盘时互相覆盖;
+    active 记录正在推送的公告, 认领与检查都在 lock 内进行, 同一公告不会被两个任务同时推送。
+    落盘在线程中执行, 不阻塞事件循环; flush_lock 保证各次写入按发起顺序落盘。
+    """
+
+    def __init__(self):
+        self.state: Dict[str, List[str]] = get_ann_push_state()
+        self.active: set = set()
+        self.lock = asyncio.Lock()
+        self.flush_lock = asyncio.Lock()
+        self._dirty = 0
+        self._last_flush = time.monotonic()
+
+    def delivered(self, ann_id) -> set:
+        return set(self.state.get(str(ann_id), []))
+
+    async def start(self, ann_id) -> None:
+        self.state.setdefault(str(ann_id), [])
+        await self.flush()
+
+    def _flush_due(self) -> bool:
+        return self._dirty >= STATE_FLUSH_COUNT or time.monotonic() - self._last_flush >= STATE_FLUSH_SECONDS
+
+    async def mark(self, ann_id, key: str) -> None:
+        self.state.setdefault(str(ann_id), []).append(key)
+        self._dirty += 1
+        if self._flush_due():
+            await self.flush(only_if_due=True)
+
+    async def finish(self, ann_id) -> None:
+        # 其它任务正在推送该公告时不清除它的进度
+        if str(ann_id) in self.active:
+            return
+        self.state.pop(str(ann_id), None)
+        await self.flush()
+
+    async def flush(self, only_if_due: bool = False) -> None:
+        async with self.flush_lock:
+            # 并发送达时多个任务同时到达阈值, 排队期间已被前一个写入的不再重复落盘
+            if only_if_due and not self._flush_due():
+                return
+            snapshot = {k: list(v) for k, v in self.state.items()}
+            self._dirty = 0
+            self._last_flush = time.monotonic()
+            await asyncio.to_thread(set_ann_push_state, snapshot)
+
+
+_push_state: Optional[_PushState] = None
+
+
+def _get_push_state() -> _PushState:
+    global _push_state
+    if _push_state is None:
+        _push_state = _PushState()
+    return _push_state
+
+
+class AnnPushScheduler:
+    """公告推送调度: 每条公告只渲染一次, 按 Bot 分组并行推送。
+
+    同一 Bot 内受并发数和令牌桶限速约束, 不同 Bot 互不阻塞;
+    送达记录持久化, 重启后从断点继续而不是整轮重发。
+    """
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+
+    def _get_bucket(self, bot_key: Tuple[str, str]) -> TokenBucket:
+        rate_per_min = WutheringWavesConfig.get_config("AnnPushBotRatePerMin").data
+        concurrency = WutheringWavesConfig.get_config("AnnPushBotConcurrency").data
+        bucket = self._buckets.get(bot_key)
+        if bucket is None or bucket.rate != max(rate_per_min / 60, 0.001) or bucket.burst != max(concurrency, 1):
+            bucket = TokenBucket(rate_per_min / 60, concurrency)
+            self._buckets[bot_key] = bucket
+        return bucket
+
+    async def _send_one(self, subscribe, img, ann_id, bucket: TokenBucket, semaphore: asyncio.Semaphore) -> bool:
+        async with semaphore:
+            await bucket.acquire()
+            try:
+                await subscribe.send(img)  # type: ignore
+                return True
+            except Exception as e:
+                target_id = subscribe.group_id or subscribe.user_id
+                logger.exception(f"[鸣潮·公告] 公告 {ann_id} 推送到订阅 {target_id} 失败: {e}")
+                return False
+
+    async def _push_bot(self, bot_key, subscribes, img, ann_id, state: _PushState) -> int:
+        bucket = self._get_bucket(bot_key)
+        semaphore = asyncio.Semaphore(max(WutheringWavesConfig.get_config("AnnPushBotConcurrency").data, 1))
+
+        async def _one(subscribe) -> bool:
+            ok = await self._send_one(subscribe, img, ann_id, bucket, semaphore)
+            if ok:
+                await state.mark(ann_id, subscribe_key(subscribe))
+            return ok
+
+        results = await asyncio.gather(*[_one(s) for s in subscribes])
+        return sum(1 for r in results if r)
+
+    async def push_one(self, ann_id, datas, state: _PushState) -> Optional[bool]:
+        """推送单条公告; 返回 None 表示无需推送, False 表示应回退重试"""
+        start = time.monotonic()
+        # 先认领再渲染, 重叠的推送任务不会把同一公告再渲染一遍
+        async with state.lock:
+            if str(ann_id) in state.active:
+                logger.info(f"[鸣潮·公告] 公告 {ann_id} 已有推送任务在处理, 跳过")
+                return None
+            state.active.add(str(ann_id))
+
+        try:
+            img = await ann_detail_card(ann_id, is_check_time=True)
+            if isinstance(img, str):
+                logger.info(f"[鸣潮·公告] 公告 {ann_id} 跳过推送: {img}")
+                state.active.discard(str(ann_id))
+                await state.finish(ann_id)
+                return None
+            render_cost = time.monotonic() - start
+
+            delivered = state.delivered(ann_id)
+            pending = [s for s in datas if subscribe_key(s) not in delivered]
+            await state.start(ann_id)
+
+            by_bot: Dict[Tuple[str, str], list] = {}
+            for subscribe in pending:
+                by_bot.setdefault(_bot_key(subscribe), []).append(subscribe)
+
+            counts = await asyncio.gather(
+                *[self._push_bot(bot_key, subs, img, ann_id, state) for bot_key, subs in by_bot.items()]
+            )
+        finally:
+            state.active.discard(str(ann_id))
+        success_count = sum(counts)
+        await state.finish(ann_id)
+
+        logger.info(
+            f"[鸣潮·公告] 公告 {ann_id} 推送完成: {success_count}/{len(pending)}"
+            f" (此前已送达 {len(delivered)}, Bot数 {len(by_bot)}),"
+            f" 渲染 {render_cost:.2f}s, 总耗时 {time.monotonic() - start:.2f}s"
+        )
+        return not (pending and success_count == 0 and not delivered)
+
+    async def push(self, ann_ids: List, datas: List) -> None:
+        logger.info(f"[鸣潮·公告] 后台推送开始: 公告数={len(ann_ids)}, 订阅数={len(datas)}")
+        start = time.monotonic()
+        state = _get_push_state()
+        # 渲染返字符串 (过期 / 未找到) 视为永久失败, 保留在已处理集合;
+        # 渲染异常或订阅全失败视为临时失败, 回退让下次轮询重试。
+        retry_ids: list = []
+
+        for ann_id in ann_ids:
+            try:
+                ok = await self.push_one(ann_id, datas, state)
+                if ok is False:
+                    retry_ids.append(ann_id)
+            except Exception as e:
+                logger.exception(f"[鸣潮·公告] 公告 {ann_id} 后台推送失败: {e}")
+                await state.finish(ann_id)
+                retry_ids.append(ann_id)
+
+        if retry_ids:
+            existing = get_ann_new_ids() or []
+            kept = [x for x in existing if x not in retry_ids]
+            set_ann_new_ids(kept)
+            logger.info(f"[鸣潮·公告] {len(retry_ids)} 个公告本轮未成功推送, 下次轮询重试")
+
+        logger.info(f"[鸣潮·公告] 推送完毕, 耗时 {time.monotonic() - start:.2f}s")
+
+
+ann_push_scheduler = AnnPushScheduler()
+
+
+def get_unfinished_ann_ids() -> List:
+    """上次进程退出时尚未推送完的公告ID"""
+    ids = []
+    source = _push_state.state if _push_state is not None else get_ann_push_state()
+    for ann_id in source:
+        ids.append(int(ann_id) if ann_id.isdigit() else ann_id)
+    return ids
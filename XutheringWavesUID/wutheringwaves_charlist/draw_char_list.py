@@ -26,7 +26,7 @@ from ..utils.image import (
 from ..utils.api.model import WeaponData, RoleDetailData
 from ..utils.waves_api import waves_api
 from ..utils.error_reply import WAVES_CODE_102
-from ..utils.ascension.char import char_id_data, ensure_data_loaded
+from ..utils.ascension.snapshot import current_snapshot
 from ..utils.expression_ctx import WavesCharRank, get_waves_char_rank
 from ..utils.char_info_utils import get_all_roleid_detail_info_int
 from ..wutheringwaves_config import PREFIX, WutheringWavesConfig
@@ -172,7 +172,7 @@ async def draw_char_list_img(
             }
         )
 
-    ensure_data_loaded()
+    char_id_data = current_snapshot().char
     all_up_num = 0
     for char_id, char_data in char_id_data.items():
         if (
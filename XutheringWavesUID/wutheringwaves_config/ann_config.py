@@ -34,20 +34,32 @@ def load_ann_data() -> Dict:
         return {"groups": {}, "new_ids": []}
 
 
-def save_ann_data(data: Dict) -> bool:
-    """保存公告数据 (atomic: tmp + os.replace, 防截断/并发)。"""
+def _write_ann_data(data: Dict) -> bool:
     try:
-        with _ANN_LOCK:
-            tmp = ANN_DATA_PATH.with_suffix(ANN_DATA_PATH.suffix + ".tmp")
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            os.replace(tmp, ANN_DATA_PATH)
+        tmp = ANN_DATA_PATH.with_suffix(ANN_DATA_PATH.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, ANN_DATA_PATH)
         return True
     except Exception as e:
         logger.exception(f"[鸣潮·配置] 保存公告数据失败: {e}")
         return False
 
 
+def save_ann_data(data: Dict) -> bool:
+    """保存公告数据 (atomic: tmp + os.replace, 防截断/并发)。"""
+    with _ANN_LOCK:
+        return _write_ann_data(data)
+
+
+def _set_ann_field(key: str, value) -> bool:
+    """读-改-写整体持锁: 推送进度在线程中落盘时, 不会与其它字段的写入互相覆盖"""
+    with _ANN_LOCK:
+        data = load_ann_data()
+        data[key] = value
+        return _write_ann_data(data)
+
+
 def get_ann_new_ids() -> List:
     """获取新公告ID列表"""
     data = load_ann_data()
@@ -56,6 +68,16 @@ def get_ann_new_ids() -> List:
 
 def set_ann_new_ids(new_ids: List) -> bool:
     """设置新公告ID列表"""
+    return _set_ann_field("new_ids", new_ids)
+
+
+def get_ann_push_state() -> Dict[str, List[str]]:
+    """获取公告推送进度 {公告ID: [已送达的订阅key]}"""
     data = load_ann_data()
-    data["new_ids"] = new_ids
-    return save_ann_data(data)
+    state = data.get("push_state", {})
+    return state if isinstance(state, dict) else {}
+
+
+def set_ann_push_state(state: Dict[str, List[str]]) -> bool:
+    """保存公告推送进度, 推送完成的公告应从中移除"""
+    return _set_ann_field("push_state", state)
@@ -94,6 +94,30 @@ CONFIG_DEFAULT: Dict[str, GSC] = {
         True,
     ),
     "GachaRankMin": GsIntConfig("抽卡排行最小抽数阈值", "抽卡排行中只显示总抽数达到此阈值的玩家", 1000),
+    "GachaFetchConcurrency": GsIntConfig(
+        "抽卡记录卡池并发请求数",
+        "刷新抽卡记录时同一账号同时请求的卡池数",
+        3,
+        13,
+    ),
+    "GachaFetchIntervalMs": GsIntConfig(
+        "抽卡记录请求间隔(毫秒)",
+        "刷新抽卡记录时同一账号相邻两次卡池请求的最小发起间隔",
+        300,
+        5000,
+    ),
+    "DailyInfoCacheSeconds": GsIntConfig(
+        "每日信息缓存时间(秒)",
+        "同一账号在该时间内重复查询每日信息/体力时直接使用上次结果, 0 为不缓存",
+        30,
+        600,
+    ),
+    "DailyInfoConcurrency": GsIntConfig(
+        "每日信息全局并发请求数",
+        "所有用户查询每日信息/体力时同时进行的账号请求数上限",
+        5,
+        50,
+    ),
     "DelInvalidCookie": GsBoolConfig(
         "每天定时删除无效token",
         "每天定时删除无效token",
@@ -105,6 +129,18 @@ CONFIG_DEFAULT: Dict[str, GSC] = {
         ["22", "0"],
     ),
     "AnnMinuteCheck": GsIntConfig("公告推送时间检测（单位min）", "公告推送时间检测（单位min）", 10, 60),
+    "AnnPushBotConcurrency": GsIntConfig(
+        "公告推送单Bot并发数",
+        "每个Bot同时推送公告的群数, 不同Bot之间互不影响",
+        2,
+        20,
+    ),
+    "AnnPushBotRatePerMin": GsIntConfig(
+        "公告推送单Bot每分钟条数",
+        "每个Bot每分钟最多推送的公告条数(令牌桶限速), 过高可能触发平台风控",
+        30,
+        600,
+    ),
     "RefreshInterval": GsIntConfig(
         "刷新全部面板间隔，重载生效（单位秒）",
         "刷新全部面板间隔，重载生效（单位秒）",
@@ -263,6 +299,12 @@ CONFIG_DEFAULT: Dict[str, GSC] = {
         45,
         3650,
     ),
+    "CacheSizeBudgetMB": GsIntConfig(
+        "公告、日历、烘焙缓存总大小上限(MB)",
+        "缓存总大小超过此值时按最近访问时间从旧到新删除，0为不限制",
+        2048,
+        102400,
+    ),
     "RankActiveFilterGroup": GsBoolConfig(
         "群排行仅活跃用户",
         "群排行（角色/练度/抽卡）是否仅统计活跃账号",
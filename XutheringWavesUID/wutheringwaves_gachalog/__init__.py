@@ -1,5 +1,4 @@
 import re
-import json
 import shutil
 import asyncio
 from datetime import datetime
@@ -22,10 +21,12 @@ from .gacha_handler import (
 from .get_gachalogs import (
     save_gachalogs,
     export_gachalogs,
+    export_gachalogs_file,
     import_gachalogs,
     prune_gacha_backups,
 )
 from .draw_gachalogs import draw_card, draw_card_help
+from .gacha_stats import GACHA_AGG_FILE
 from .web_view import (  # 导入即注册路由
     _is_feature_enabled as _gacha_web_enabled,
     feature_disabled_msg,
@@ -35,7 +36,8 @@ from ..utils.waves_api import waves_api
 from ..utils.error_reply import ERROR_CODE, WAVES_CODE_102, WAVES_CODE_103
 from ..utils.database.models import WavesBind
 from ..wutheringwaves_config import PREFIX
-from ..utils.resource.RESOURCE_PATH import GACHA_BACKUP_PATH, PLAYER_PATH
+from ..utils.player_path import player_dir, iter_player_dirs
+from ..utils.resource.RESOURCE_PATH import GACHA_BACKUP_PATH
 from ..utils.player_store import resolve_player_path, resolve_readable_player_path
 from ..wutheringwaves_rank.draw_gacha_rank_card import draw_gacha_rank_card
 
@@ -91,18 +93,15 @@ def _migrate_legacy_gacha_backups():
         except OSError:
             pass
 
-    # 旧路径2: PLAYER_PATH/{uid}/{import|update}_gacha_logs_*.json
-    if PLAYER_PATH.exists():
-        for uid_dir in PLAYER_PATH.iterdir():
-            if not uid_dir.is_dir():
-                continue
-            for type_ in ("import", "update"):
-                moved = False
-                for src in uid_dir.glob(f"{type_}_gacha_logs_*.json"):
-                    _move(src, GACHA_BACKUP_PATH / uid_dir.name, src.name)
-                    moved = True
-                if moved:
-                    prune_gacha_backups(uid_dir.name, type_)
+    # 旧路径2: player_dir(uid)/{import|update}_gacha_logs_*.json
+    for uid_dir in iter_player_dirs():
+        for type_ in ("import", "update"):
+            moved = False
+            for src in uid_dir.glob(f"{type_}_gacha_logs_*.json"):
+                _move(src, GACHA_BACKUP_PATH / uid_dir.name, src.name)
+                moved = True
+            if moved:
+                prune_gacha_backups(uid_dir.name, type_)
 
     # 旧路径3: MAIN_PATH/backup/{uid}/(delete|import|update)_gacha_logs_*.json
     # 新路径加了 gacha_backup 子层避免与其他模块同名 backup 撞目录
@@ -160,11 +159,7 @@ async def _merge_mcgf_gacha(bot: Bot, ev: Event, uid: str, target_uid: str):
         if not latest_data:
             return await bot.send("获取工坊数据失败或数据为空")
 
-        export_res = await export_gachalogs(uid)
-        original_data = {"info": {}, "list": []}
-
-        if export_res["retcode"] == "ok":
-            original_data = export_res["json"]
+        original_data = await export_gachalogs(uid) or {"info": {}, "list": []}
 
         if len(original_data.get("list", [])) == 0:
             return await bot.send(
@@ -177,9 +172,8 @@ async def _merge_mcgf_gacha(bot: Bot, ev: Event, uid: str, target_uid: str):
             merge_gacha_data, original_data, latest_data
         )
 
-        merged_json_str = json.dumps(merged_data, ensure_ascii=False)
         im = await import_gachalogs(
-            ev, merged_json_str, "json", uid, force_overwrite=True
+            ev, merged_data, "data", uid, force_overwrite=True
         )
         if im.startswith("🌱"):
             await bot.send(
@@ -306,11 +300,7 @@ async def get_gacha_log_by_xhh(bot: Bot, ev: Event):
                 f"小黑盒对应的鸣潮UID为{xhh_uid}，与当前绑定UID {uid}不匹配！"
             )
 
-        export_res = await export_gachalogs(uid)
-        original_data = {"info": {}, "list": []}
-
-        if export_res["retcode"] == "ok":
-            original_data = export_res["json"]
+        original_data = await export_gachalogs(uid) or {"info": {}, "list": []}
 
         if len(original_data.get("list", [])) == 0:
             return await bot.send(
@@ -319,9 +309,8 @@ async def get_gacha_log_by_xhh(bot: Bot, ev: Event):
 
         merged_data = await asyncio.to_thread(merge_xhh_data, original_data, xhh_data)
 
-        merged_json_str = json.dumps(merged_data, ensure_ascii=False)
         im = await import_gachalogs(
-            ev, merged_json_str, "json", uid, force_overwrite=True
+            ev, merged_data, "data", uid, force_overwrite=True
         )
         if im.startswith("🌱"):
             await bot.send(
@@ -475,10 +464,9 @@ async def send_export_gacha_info(bot: Bot, ev: Event):
         return await bot.send(ERROR_CODE[WAVES_CODE_102])
 
     # await bot.send("🔜即将为你导出XutheringWavesUID抽卡记录文件，请耐心等待...")
-    export = await export_gachalogs(uid)
-    if export["retcode"] == "ok":
-        file_name = export["name"]
-        file_bytes = json.dumps(export["json"], ensure_ascii=False, indent=4).encode("utf-8")
+    export = await export_gachalogs_file(uid)
+    if export:
+        file_name, file_bytes = export
         await bot.send(MessageSegment.file(file_bytes, file_name))
         await bot.send("✅导出抽卡记录成功！")
     else:
@@ -499,8 +487,8 @@ async def delete_gacha_history(bot: Bot, ev: Event):
     if not gacha_import_lock.acquire(f"{ev.user_id}_{uid}"):
         return await bot.send(f"UID{hide_uid(uid, user_pref)}抽卡导入正在进行，请稍后再试")
     try:
-        player_dir = PLAYER_PATH / uid
-        logical = player_dir / "gacha_logs.json"
+        uid_dir = player_dir(uid)
+        logical = uid_dir / "gacha_logs.json"
         gacha_log_file = resolve_readable_player_path(logical) or resolve_player_path(logical)
         if gacha_log_file is None:
             return await bot.send(f"UID{hide_uid(uid, user_pref)}暂无抽卡记录文件")
@@ -518,9 +506,10 @@ async def delete_gacha_history(bot: Bot, ev: Event):
             logger.exception(f"[鸣潮·抽卡删除] 移动失败 uid={uid}: {e}")
             return await bot.send("移动抽卡记录失败，请稍后重试")
         # 清理同名残留(明文/gz 共存)+ 失效 stats 缓存
-        (player_dir / "gacha_logs.json").unlink(missing_ok=True)
-        (player_dir / "gacha_logs.json.gz").unlink(missing_ok=True)
-        (player_dir / "gachaStats.json").unlink(missing_ok=True)
+        (uid_dir / "gacha_logs.json").unlink(missing_ok=True)
+        (uid_dir / "gacha_logs.json.gz").unlink(missing_ok=True)
+        (uid_dir / "gachaStats.json").unlink(missing_ok=True)
+        (uid_dir / GACHA_AGG_FILE).unlink(missing_ok=True)
         prune_gacha_backups(uid, "delete")
 
         await bot.send(f"UID{hide_uid(uid, user_pref)}抽卡记录已删除！")
@@ -544,21 +533,18 @@ async def delete_import_gacha_files(bot: Bot, ev: Event):
                 except Exception as e:
                     await bot.logger.warning(f"[鸣潮·抽卡] 删除导入记录失败 {file_path}: {e}")
     # 导出产物 + link 源快照可再生, 一并清理
-    if PLAYER_PATH.exists():
-        for uid_dir in PLAYER_PATH.iterdir():
-            if not uid_dir.is_dir():
+    for uid_dir in iter_player_dirs():
+        targets = list(uid_dir.glob("export_*.json"))
+        targets += [uid_dir / "link_gacha_logs.json", uid_dir / "link_gacha_logs.json.gz"]
+        for file_path in targets:
+            if not file_path.exists():
                 continue
-            targets = list(uid_dir.glob("export_*.json"))
-            targets += [uid_dir / "link_gacha_logs.json", uid_dir / "link_gacha_logs.json.gz"]
-            for file_path in targets:
-                if not file_path.exists():
-                    continue
-                try:
-                    freed += file_path.stat().st_size
-                    file_path.unlink()
-                    delete_count += 1
-                except Exception as e:
-                    await bot.logger.warning(f"[鸣潮·抽卡] 删除文件失败 {file_path}: {e}")
+            try:
+                freed += file_path.stat().st_size
+                file_path.unlink()
+                delete_count += 1
+            except Exception as e:
+                await bot.logger.warning(f"[鸣潮·抽卡] 删除文件失败 {file_path}: {e}")
 
     await bot.send(f"删除导入记录 {delete_count} 个, 释放 {freed / 1048576:.1f}MB")
 
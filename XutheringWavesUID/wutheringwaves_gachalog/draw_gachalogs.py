@@ -43,8 +43,13 @@ from ..utils.fonts.waves_fonts import (
     waves_font_32,
     waves_font_40,
 )
-from ..utils.resource.constant import NORMAL_LIST
-from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+from ..utils.player_path import player_dir
+from .gacha_stats import (
+    pool_stats,
+    update_aggregates,
+    load_gacha_aggregates,
+    save_gacha_aggregates,
+)
 from .get_gachalogs import gacha_type_meta_data
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
@@ -169,83 +174,58 @@ async def draw_card_help():
     return msg
 
 
-def _compute_pool_stats(gachalogs: Dict) -> Dict:
-    """对每个卡池计算 total/avg/avg_up/remain/r_num/up_list/rank_s_list/level/time_range."""
-    gachalogs = {
-        **{n: gachalogs[n] for n in gacha_type_meta_data if n in gachalogs},
-        **{n: v for n, v in gachalogs.items() if n not in gacha_type_meta_data},
-    }
+def _pool_level(gacha_name: str, current_data: Dict) -> int:
+    level = 2
+    if current_data["avg_up"] or current_data["avg"]:
+        if gacha_name == "角色精准调谐":
+            if current_data["avg_up"]:
+                level = get_level_from_list(current_data["avg_up"], [68, 81, 93, 99, 114])
+            elif current_data["avg"]:
+                level = get_level_from_list(current_data["avg"], [47, 54, 62, 67, 69])
+        elif gacha_name in [
+            "武器精准调谐",
+            "角色调谐（常驻池）",
+            "武器调谐（常驻池）",
+            "新手自选唤取",
+        ]:
+            if current_data["avg"]:
+                level = get_level_from_list(current_data["avg"], [45, 52, 59, 65, 70])
+        elif gacha_name == "新手调谐":
+            if current_data["avg"]:
+                level = get_level_from_list(current_data["avg"], [10, 20, 30, 40, 45])
+    return level
+
+
+def _aggregates_to_total(aggregates: Dict) -> Dict:
+    """把各卡池聚合转换为 total/avg/avg_up/remain/r_num/up_list/rank_s_list/level/time_range."""
+    pools = aggregates["pools"]
+    ordered = [n for n in gacha_type_meta_data if n in pools] + [n for n in pools if n not in gacha_type_meta_data]
     total_data = {}
-    for gacha_name in gachalogs:
-        total_data[gacha_name] = {
-            "total": 0,
-            "avg": 0,
-            "avg_up": 0,
-            "remain": 0,
-            "time_range": "",
-            "r_num": [],
-            "up_list": [],
-            "rank_s_list": [],
-            "level": 0,
-        }
+    for gacha_name in ordered:
+        current_data = pool_stats(pools[gacha_name])
+        current_data["level"] = _pool_level(gacha_name, current_data)
+        total_data[gacha_name] = current_data
+    return total_data
 
-    for gacha_name in gachalogs:
-        num = 1
-        gacha_data = gachalogs[gacha_name]
-        current_data = total_data[gacha_name]
-
-        for index, data in enumerate(gacha_data[::-1]):
-            if index == 0:
-                current_data["time_range"] = data["time"]
-            if index == len(gacha_data) - 1:
-                current_data["time_range"] += "~" + data["time"]
-
-            if data["qualityLevel"] == 5:
-                data["gacha_num"] = num
-                data["is_up"] = data["name"] not in NORMAL_LIST
-
-                current_data["r_num"].append(num)
-                current_data["rank_s_list"].append(data)
-                if data["is_up"]:
-                    current_data["up_list"].append(data)
-                num = 1
-            else:
-                num += 1
-            current_data["total"] += 1
-
-        current_data["remain"] = num - 1
-        if current_data["rank_s_list"]:
-            _d = sum(current_data["r_num"]) / len(current_data["r_num"])
-            current_data["avg"] = float("{:.2f}".format(_d))
-        if current_data["up_list"]:
-            _u = sum(current_data["r_num"]) / len(current_data["up_list"])
-            current_data["avg_up"] = float("{:.2f}".format(_u))
-
-        current_data["level"] = 2
-        if current_data["avg_up"] or current_data["avg"]:
-            if gacha_name == "角色精准调谐":
-                if current_data["avg_up"]:
-                    current_data["level"] = get_level_from_list(current_data["avg_up"], [68, 81, 93, 99, 114])
-                elif current_data["avg"]:
-                    current_data["level"] = get_level_from_list(current_data["avg"], [47, 54, 62, 67, 69])
-            elif gacha_name in [
-                "武器精准调谐",
-                "角色调谐（常驻池）",
-                "武器调谐（常驻池）",
-                "新手自选唤取",
-            ]:
-                if current_data["avg"]:
-                    current_data["level"] = get_level_from_list(current_data["avg"], [45, 52, 59, 65, 70])
-            elif gacha_name == "新手调谐":
-                if current_data["avg"]:
-                    current_data["level"] = get_level_from_list(current_data["avg"], [10, 20, 30, 40, 45])
 
+async def refresh_pool_stats(uid: str, gachalogs: Dict, rewrite_stats: bool = False) -> Dict:
+    """增量计算卡池统计: 只累加水位之后新增的记录, 历史被改写时整池重建
+
+    统计有变化、gachaStats.json 不存在或 rewrite_stats 为真时写一次 gachaStats.json
+    """
+    cached = await load_gacha_aggregates(uid)
+    aggregates, changed = update_aggregates(cached, gachalogs)
+    total_data = _aggregates_to_total(aggregates)
+    if changed:
+        await save_gacha_aggregates(uid, aggregates)
+    if changed or rewrite_stats or not (player_dir(uid) / "gachaStats.json").exists():
+        await save_gacha_stats(uid, total_data)
     return total_data
 
 
 async def get_gacha_stats(uid: str) -> Dict:
     """获取抽卡统计信息，优先从缓存读取，否则从原始数据计算"""
-    _dir = PLAYER_PATH / str(uid)
+    _dir = player_dir(uid)
     _dir.mkdir(parents=True, exist_ok=True)
 
     gacha_log_path = _dir / "gacha_logs.json"
@@ -269,10 +249,9 @@ async def get_gacha_stats(uid: str) -> Dict:
         return {}
 
     try:
-        total_data = _compute_pool_stats(raw_data.get("data", {}))
-        stats_data = _total_to_stats(total_data)
-        await save_gacha_stats(uid, total_data)
-        return stats_data
+        # 走到这里说明缓存缺失或格式不对, 由 refresh_pool_stats 重写一次
+        total_data = await refresh_pool_stats(uid, raw_data.get("data", {}), rewrite_stats=True)
+        return _total_to_stats(total_data)
     except Exception:
         return {}
 
@@ -300,7 +279,7 @@ def _total_to_stats(total_data: Dict) -> Dict:
 async def save_gacha_stats(uid: str, total_data: Dict):
     """保存抽卡统计信息到本地文件"""
     try:
-        _dir = PLAYER_PATH / str(uid)
+        _dir = player_dir(uid)
         _dir.mkdir(parents=True, exist_ok=True)
         path = _dir / "gachaStats.json"
         stats_data = _total_to_stats(total_data)
@@ -312,7 +291,7 @@ async def save_gacha_stats(uid: str, total_data: Dict):
 
 async def draw_card(uid: str, ev: Event):
     # 获取数据
-    gacha_log_path = PLAYER_PATH / str(uid) / "gacha_logs.json"
+    gacha_log_path = player_dir(uid) / "gacha_logs.json"
     raw_data = await read_player_json(gacha_log_path)
     if raw_data is None:
         return f"[鸣潮] 你还没有抽卡记录噢!\n 请查看 {PREFIX}抽卡帮助 中的提示导入!"
@@ -320,10 +299,7 @@ async def draw_card(uid: str, ev: Event):
     gachalogs = raw_data["data"]
     title_num = len([1 for i in gachalogs.keys() if "新手" not in i])
 
-    total_data = _compute_pool_stats(gachalogs)
-    stats_path = PLAYER_PATH / str(uid) / "gachaStats.json"
-    if not stats_path.exists():
-        await save_gacha_stats(uid, total_data)
+    total_data = await refresh_pool_stats(uid, gachalogs)
 
     # 预加载所有抽卡物品的图标
     item_icon_cache: Dict[str, Image.Image] = {}
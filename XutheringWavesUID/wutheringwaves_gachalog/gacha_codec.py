@@ -0,0 +1,134 @@
+from typing import Dict, List, Tuple, Union, Iterator, Optional
+
+import msgspec
+
+from ..utils.api.model import GachaLog
+from .model_for_waves_plugin import turn_kuro_gacha_type
+
+WWUID_EXPORT_APPS = ("XutheringWavesUID", "WutheringWavesUID")
+WAVES_PLUGIN_EXPORT_APP = "Waves-Plugin"
+
+
+class _WWUIDInfo(msgspec.Struct):
+    export_time: str
+    export_app: str
+    export_app_version: str
+    export_timestamp: int
+    version: str
+    uid: str
+
+
+class _WWUIDItem(msgspec.Struct):
+    cardPoolType: str
+    resourceId: int
+    qualityLevel: int
+    resourceType: str
+    name: str
+    count: int
+    time: str
+
+
+class _WWUIDDoc(msgspec.Struct):
+    info: _WWUIDInfo
+    list: List[_WWUIDItem]
+
+
+class _PluginInfo(msgspec.Struct):
+    lang: str
+    region_time_zone: int
+    export_timestamp: int
+    export_app: str
+    export_app_version: str
+    wwgf_version: str
+    uid: str
+
+
+class _PluginItem(msgspec.Struct):
+    gacha_id: str
+    gacha_type: str
+    item_id: str
+    count: str
+    time: str
+    name: str
+    item_type: str
+    rank_type: str
+    id: str
+
+
+class _PluginDoc(msgspec.Struct):
+    info: _PluginInfo
+    list: List[_PluginItem]
+
+
+_JSON_DECODER = msgspec.json.Decoder()
+_ENCODER = msgspec.json.Encoder()
+_WWUID_FIELDS = _WWUIDItem.__struct_fields__
+
+
+def _iter_wwuid(items: List[_WWUIDItem], raw_items: List[Dict]) -> Iterator[GachaLog]:
+    # 字段类型已由 msgspec 校验, 直接构造跳过 pydantic 二次校验;
+    # 与 GachaLog(extra="allow") 一致, 记录里的额外字段原样保留
+    for item, raw in zip(items, raw_items):
+        values = dict(raw)
+        for field in _WWUID_FIELDS:
+            values[field] = getattr(item, field)
+        yield GachaLog.model_construct(**values)
+
+
+def _iter_plugin(items: List[_PluginItem]) -> Iterator[GachaLog]:
+    for item in items:
+        yield GachaLog.model_construct(
+            cardPoolType=turn_kuro_gacha_type.get(item.gacha_type, item.gacha_type),
+            resourceId=int(item.item_id),
+            qualityLevel=int(item.rank_type),
+            resourceType=item.item_type,
+            name=item.name,
+            count=int(item.count),
+            time=item.time,
+        )
+
+
+def decode_gacha_import(data: Union[bytes, str, Dict]) -> Optional[Tuple[str, Iterator[GachaLog]]]:
+    """解码导入文件, 返回 (uid, 逐条产出的抽卡记录); 不支持的格式返回 None。
+
+    data 可以是原始 json 字节 / 字符串, 也可以是已合并好的 dict。
+    json 只解析一次, 按 info.export_app 选定格式后在内存对象上做类型校验。
+    格式或字段类型错误时抛出 msgspec.ValidationError / msgspec.DecodeError。
+    """
+    doc = data if isinstance(data, dict) else _JSON_DECODER.decode(data)
+    info = doc.get("info") if isinstance(doc, dict) else None
+    export_app = info.get("export_app", "") if isinstance(info, dict) else ""
+    if export_app == WAVES_PLUGIN_EXPORT_APP:
+        plugin_doc = msgspec.convert(doc, _PluginDoc, strict=False)
+        return plugin_doc.info.uid, _iter_plugin(plugin_doc.list)
+    if export_app in WWUID_EXPORT_APPS:
+        wwuid_doc = msgspec.convert(doc, _WWUIDDoc, strict=False)
+        return wwuid_doc.info.uid, _iter_wwuid(wwuid_doc.list, doc["list"])
+    return None
+
+
+def build_gacha_export(info: Dict, gachalogs_history: Dict[str, List[Dict]]) -> Dict:
+    """导出结构 {"info", "list"}, 供合并导入等需要 dict 的场景使用"""
+    return {
+        "info": info,
+        "list": [log for logs in gachalogs_history.values() for log in logs],
+    }
+
+
+def encode_gacha_export(info: Dict, gachalogs_history: Dict[str, List[Dict]]) -> bytes:
+    """导出文件内容: 逐条编码进同一个缓冲区, 再整体缩进排版。
+
+    与此前 json.dumps(indent=4, ensure_ascii=False) 的输出一致, 落盘记录的全部字段原样导出。
+    """
+    buf = bytearray(b'{"info":')
+    _ENCODER.encode_into(info, buf, -1)
+    buf += b',"list":['
+    first = True
+    for logs in gachalogs_history.values():
+        for log in logs:
+            if not first:
+                buf += b","
+            first = False
+            _ENCODER.encode_into(log, buf, -1)
+    buf += b"]}"
+    return msgspec.json.format(buf, indent=4)
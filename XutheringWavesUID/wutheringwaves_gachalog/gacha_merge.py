@@ -0,0 +1,123 @@
+"""抽卡记录合并: 按最长公共子串把本地记录与新拉取的记录拼接。
+
+最长公共子串用二分长度 + 滚动哈希求解, 结果 (含平手时的取法) 与原 O(n*m) DP 一致。
+"""
+
+from datetime import datetime
+from collections import Counter
+from typing import Dict, List, Tuple, Optional
+
+from ..utils.api.model import GachaLog
+
+
+# 滚动哈希参数, 命中后逐项比对确认, 哈希冲突不影响结果
+_HASH_MOD = (1 << 61) - 1
+_HASH_BASE = 1_000_003
+
+
+def _encode_match_keys(a: List[GachaLog], b: List[GachaLog]) -> Tuple[List[int], List[int]]:
+    """把 match_key() 映射为整数, 两侧共用同一张编码表"""
+    codes: Dict[tuple, int] = {}
+    a_ids = [codes.setdefault(log.match_key(), len(codes) + 1) for log in a]
+    b_ids = [codes.setdefault(log.match_key(), len(codes) + 1) for log in b]
+    return a_ids, b_ids
+
+
+def _prefix_hashes(ids: List[int]) -> List[int]:
+    h = [0] * (len(ids) + 1)
+    for i, x in enumerate(ids):
+        h[i + 1] = (h[i] * _HASH_BASE + x) % _HASH_MOD
+    return h
+
+
+def _find_common_window(
+    a_ids: List[int],
+    b_ids: List[int],
+    ha: List[int],
+    hb: List[int],
+    power: int,
+    length: int,
+) -> Optional[Tuple[int, int]]:
+    """找长度为 length 的公共子串, 返回起点 (i, j), 取 i 最大、其次 j 最大的一组"""
+    positions: Dict[int, List[int]] = {}
+    for j in range(len(b_ids) - length + 1):
+        key = (hb[j + length] - hb[j] * power) % _HASH_MOD
+        positions.setdefault(key, []).append(j)
+
+    for i in range(len(a_ids) - length, -1, -1):
+        key = (ha[i + length] - ha[i] * power) % _HASH_MOD
+        candidates = positions.get(key)
+        if not candidates:
+            continue
+        window = a_ids[i : i + length]
+        for j in reversed(candidates):
+            if b_ids[j : j + length] == window:
+                return i, j
+    return None
+
+
+def _longest_common_window(a_ids: List[int], b_ids: List[int]) -> Optional[Tuple[int, int, int]]:
+    """二分长度 + 滚动哈希求最长公共子串, 返回 (i, j, length)。
+
+    平手时与原 DP 倒序遍历的取法一致: a 中起点最大, 其次 b 中起点最大。
+    """
+    ha, hb = _prefix_hashes(a_ids), _prefix_hashes(b_ids)
+    lo, hi = 0, min(len(a_ids), len(b_ids))
+    best = None
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        found = _find_common_window(a_ids, b_ids, ha, hb, pow(_HASH_BASE, mid, _HASH_MOD), mid)
+        if found:
+            lo, best = mid, found
+        else:
+            hi = mid - 1
+    if best is None:
+        return None
+    return best[0], best[1], lo
+
+
+# 找到两个数组中最长公共子串的下标（忽略resourceType字段差异）
+def find_longest_common_subarray_indices(
+    a: List[GachaLog], b: List[GachaLog]
+) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    found = _longest_common_window(*_encode_match_keys(a, b))
+    if found is None:
+        return None
+    i, j, length = found
+    return (i, i + length - 1), (j, j + length - 1)
+
+
+def _merge_by_common_window(
+    a: List[GachaLog], a_ids: List[int], b: List[GachaLog], b_ids: List[int]
+) -> List[GachaLog]:
+    found = _longest_common_window(a_ids, b_ids)
+    if found is None:
+        # 无公共子串：保留单侧内部的重复抽数，只合并两侧之间的重叠记录。
+        target_counts = Counter(a_ids) | Counter(b_ids)
+        used_counts = Counter()
+        merged = []
+        for log, key in zip(a + b, a_ids + b_ids):
+            if used_counts[key] >= target_counts[key]:
+                continue
+            used_counts[key] += 1
+            merged.append(log)
+        return sorted(
+            merged,
+            key=lambda log: datetime.strptime(log.time, "%Y-%m-%d %H:%M:%S"),
+            reverse=True,
+        )
+
+    i, j, length = found
+    prefix = _merge_by_common_window(a[:i], a_ids[:i], b[:j], b_ids[:j])
+    common_subarray = a[i : i + length]
+    suffix = _merge_by_common_window(
+        a[i + length :], a_ids[i + length :], b[j + length :], b_ids[j + length :]
+    )
+
+    return prefix + common_subarray + suffix
+
+
+# 根据最长公共子串递归合并两个GachaLog列表，按time排序
+def merge_gacha_logs_by_common_subarray(a: List[GachaLog], b: List[GachaLog]) -> List[GachaLog]:
+    a_ids, b_ids = _encode_match_keys(a, b)
+    return _merge_by_common_window(a, a_ids, b, b_ids)
@@ -0,0 +1,132 @@
+from typing import Dict, List, Tuple, Optional
+
+from ..utils.resource.constant import NORMAL_LIST
+from ..utils.player_path import player_dir
+from ..utils.player_store import read_player_json, write_player_json
+
+GACHA_AGG_FILE = "gachaAgg.json"
+GACHA_AGG_VERSION = 1
+
+_KEY_FIELDS = ("cardPoolType", "resourceId", "qualityLevel", "name", "count", "time")
+
+
+def _record_key(data: Dict) -> List:
+    """与 GachaLog.match_key() 一致的比较键, 用 list 以便直接存进 json"""
+    return [data.get(k) for k in _KEY_FIELDS]
+
+
+def _empty_pool() -> Dict:
+    return {
+        "count": 0,
+        "head": None,
+        "tail": None,
+        "first_time": "",
+        "last_time": "",
+        "remain": 0,
+        "r_num": [],
+        "rank_s_list": [],
+    }
+
+
+def fold_pool(agg: Dict, records: List[Dict]) -> Dict:
+    """把按时间正序 (旧 → 新) 的新记录累加进卡池聚合"""
+    for data in records:
+        if not agg["first_time"]:
+            agg["first_time"] = data["time"]
+        agg["last_time"] = data["time"]
+        if data["qualityLevel"] == 5:
+            item = dict(data)
+            item["gacha_num"] = agg["remain"] + 1
+            agg["r_num"].append(item["gacha_num"])
+            agg["rank_s_list"].append(item)
+            agg["remain"] = 0
+        else:
+            agg["remain"] += 1
+    agg["count"] += len(records)
+    return agg
+
+
+def update_pool(agg: Optional[Dict], gacha_data: List[Dict]) -> Tuple[Dict, bool]:
+    """按水位增量更新卡池聚合, 返回 (聚合, 是否有变化)。
+
+    新记录总是追加在列表头部: 旧水位记录的头尾应恰好落在
+    gacha_data[n - count] 与 gacha_data[-1], 否则视为历史被改写, 整池重建。
+    """
+    n = len(gacha_data)
+    if agg is not None:
+        count = agg["count"]
+        if count == n == 0:
+            return agg, False
+        if (
+            0 < count <= n
+            and _record_key(gacha_data[n - count]) == agg["head"]
+            and _record_key(gacha_data[-1]) == agg["tail"]
+        ):
+            if count == n:
+                return agg, False
+            fold_pool(agg, gacha_data[: n - count][::-1])
+            agg["head"] = _record_key(gacha_data[0])
+            return agg, True
+
+    agg = fold_pool(_empty_pool(), gacha_data[::-1])
+    if gacha_data:
+        agg["head"] = _record_key(gacha_data[0])
+        agg["tail"] = _record_key(gacha_data[-1])
+    return agg, True
+
+
+def update_aggregates(aggregates: Optional[Dict], gachalogs: Dict) -> Tuple[Dict, bool]:
+    """增量更新全部卡池, 卡池被删除时同步移除"""
+    if not aggregates or aggregates.get("version") != GACHA_AGG_VERSION:
+        aggregates = {"version": GACHA_AGG_VERSION, "pools": {}}
+    pools = aggregates["pools"]
+    changed = False
+    for gacha_name in list(pools):
+        if gacha_name not in gachalogs:
+            del pools[gacha_name]
+            changed = True
+    for gacha_name, gacha_data in gachalogs.items():
+        pools[gacha_name], pool_changed = update_pool(pools.get(gacha_name), gacha_data)
+        changed = changed or pool_changed
+    return aggregates, changed
+
+
+def pool_stats(agg: Dict) -> Dict:
+    """由聚合得出 total/avg/avg_up/remain/r_num/up_list/rank_s_list/time_range (不含 level)"""
+    rank_s_list = []
+    up_list = []
+    for item in agg["rank_s_list"]:
+        item = dict(item)
+        item["is_up"] = item["name"] not in NORMAL_LIST
+        rank_s_list.append(item)
+        if item["is_up"]:
+            up_list.append(item)
+
+    r_num = list(agg["r_num"])
+    avg = float("{:.2f}".format(sum(r_num) / len(r_num))) if rank_s_list else 0
+    avg_up = float("{:.2f}".format(sum(r_num) / len(up_list))) if up_list else 0
+    return {
+        "total": agg["count"],
+        "avg": avg,
+        "avg_up": avg_up,
+        "remain": agg["remain"],
+        "time_range": f"{agg['first_time']}~{agg['last_time']}" if agg["count"] else "",
+        "r_num": r_num,
+        "up_list": up_list,
+        "rank_s_list": rank_s_list,
+        "level": 0,
+    }
+
+
+async def load_gacha_aggregates(uid: str) -> Optional[Dict]:
+    try:
+        return await read_player_json(player_dir(uid) / GACHA_AGG_FILE)
+    except Exception:
+        return None
+
+
+async def save_gacha_aggregates(uid: str, aggregates: Dict):
+    try:
+        await write_player_json(player_dir(uid) / GACHA_AGG_FILE, aggregates)
+    except Exception:
+        pass
@@ -1,5 +1,5 @@
 import copy
-import json
+import time
 import base64
 import asyncio
 from collections import Counter
@@ -14,13 +14,15 @@ from aiohttp import TCPConnector
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 
-from .model import WWUIDGacha
 from ..version import XutheringWavesUID_version
 from ..utils.api.model import GachaLog
 from ..utils.util import get_hide_uid_pref, hide_uid
 from ..utils.waves_api import waves_api
-from .model_for_waves_plugin import WavesPluginGacha
-from ..utils.resource.RESOURCE_PATH import GACHA_BACKUP_PATH, PLAYER_PATH
+from ..wutheringwaves_config import WutheringWavesConfig
+from .gacha_codec import build_gacha_export, decode_gacha_import, encode_gacha_export
+from .gacha_merge import find_longest_common_subarray_indices, merge_gacha_logs_by_common_subarray
+from ..utils.player_path import player_dir
+from ..utils.resource.RESOURCE_PATH import GACHA_BACKUP_PATH
 from ..utils.player_store import read_player_json, write_player_json, player_json_exists, write_gz_json
 
 GACHA_BACKUP_LIMIT = 10
@@ -62,62 +64,36 @@ gachalogs_history_meta = {
 ERROR_MSG_INVALID_LINK = "当前抽卡链接已经失效，请重新导入抽卡链接"
 
 
-# 找到两个数组中最长公共子串的下标（忽略resourceType字段差异）
-def find_longest_common_subarray_indices(
-    a: List[GachaLog], b: List[GachaLog]
-) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
-    n, m = len(a), len(b)
-    dp = [[0] * (m + 1) for _ in range(n + 1)]
-    length = 0
-    a_end = b_end = 0
-
-    for i in range(n - 1, -1, -1):
-        for j in range(m - 1, -1, -1):
-            # 使用 match_key() 比较，忽略 resourceType 差异
-            if a[i].match_key() == b[j].match_key():
-                dp[i][j] = dp[i + 1][j + 1] + 1
-                if dp[i][j] > length:
-                    length = dp[i][j]
-                    a_end = i + length - 1
-                    b_end = j + length - 1
-            else:
-                dp[i][j] = 0
-
-    if length == 0:
-        return None
-
-    return (a_end - length + 1, a_end), (b_end - length + 1, b_end)
-
-
-# 根据最长公共子串递归合并两个GachaLog列表，按time排序
-def merge_gacha_logs_by_common_subarray(a: List[GachaLog], b: List[GachaLog]) -> List[GachaLog]:
-    common_indices = find_longest_common_subarray_indices(a, b)
-    if not common_indices:
-        # 无公共子串：保留单侧内部的重复抽数，只合并两侧之间的重叠记录。
-        target_counts = Counter(log.match_key() for log in a) | Counter(
-            log.match_key() for log in b
-        )
-        used_counts = Counter()
-        merged = []
-        for log in a + b:
-            key = log.match_key()
-            if used_counts[key] >= target_counts[key]:
-                continue
-            used_counts[key] += 1
-            merged.append(log)
-        return sorted(
-            merged,
-            key=lambda log: datetime.strptime(log.time, "%Y-%m-%d %H:%M:%S"),
-            reverse=True,
-        )
-
-    (a_start, a_end), (b_start, b_end) = common_indices
-
-    prefix = merge_gacha_logs_by_common_subarray(a[:a_start], b[:b_start])
-    common_subarray = a[a_start : a_end + 1]
-    suffix = merge_gacha_logs_by_common_subarray(a[a_end + 1 :], b[b_end + 1 :])
-
-    return prefix + common_subarray + suffix
+class _GachaFetchPacer:
+    """单账号卡池请求节流: 限制并发数, 且相邻请求的发起间隔不小于 interval 秒"""
+
+    def __init__(self, concurrency: int, interval: float):
+        self.semaphore = asyncio.Semaphore(max(concurrency, 1))
+        self._interval = max(interval, 0)
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def _fetch_pool_log(
+    pacer: _GachaFetchPacer, card_pool_type: str, record_id: str, uid: str, invalid: asyncio.Event
+):
+    async with pacer.semaphore:
+        # 链接已失效时不再发起剩余卡池的请求
+        if invalid.is_set():
+            return None
+        await pacer.wait()
+        res = await waves_api.get_gacha_log(card_pool_type, record_id, uid)
+        if (not res.success or not res.data) and res.code == -1:  # type: ignore
+            invalid.set()
+        return res
 
 
 async def get_new_gachalog(
@@ -126,8 +102,24 @@ async def get_new_gachalog(
     new = {}
     new_count = {}
     link_source_data: Dict[str, List[GachaLog]] = {}
-    for gacha_name, card_pool_type in gacha_type_meta_data.items():
-        res = await waves_api.get_gacha_log(card_pool_type, record_id, uid)
+
+    pacer = _GachaFetchPacer(
+        WutheringWavesConfig.get_config("GachaFetchConcurrency").data,
+        WutheringWavesConfig.get_config("GachaFetchIntervalMs").data / 1000,
+    )
+    invalid = asyncio.Event()
+    start = time.monotonic()
+    results = await asyncio.gather(
+        *[
+            _fetch_pool_log(pacer, card_pool_type, record_id, uid, invalid)
+            for card_pool_type in gacha_type_meta_data.values()
+        ]
+    )
+    logger.debug(f"[鸣潮·抽卡导入] uid={uid} 拉取{len(results)}个卡池耗时 {time.monotonic() - start:.2f}s")
+
+    for (gacha_name, card_pool_type), res in zip(gacha_type_meta_data.items(), results):
+        if res is None:
+            return ERROR_MSG_INVALID_LINK, None, None, {}  # type: ignore
         if not res.success or not res.data:
             # 抽卡记录获取失败
             if res.code == -1:  # type: ignore
@@ -151,7 +143,6 @@ async def get_new_gachalog(
             _add = gacha_log[:b_start]
         new[gacha_name] = _add + copy.deepcopy(full_data[gacha_name])
         new_count[gacha_name] = len(_add)
-        await asyncio.sleep(1)
 
     return None, new, new_count, link_source_data
 
@@ -233,7 +224,7 @@ async def backup_gachalogs(uid: str, gachalogs_history: Dict, type: str):
 
 async def save_link_source_gachalogs(uid: str, record_id: str, data: Dict[str, List[GachaLog]]):
     """保存通过链接获取的抽卡原始数据"""
-    path = PLAYER_PATH / str(uid)
+    path = player_dir(uid)
     if not path.exists():
         path.mkdir(parents=True, exist_ok=True)
 
@@ -255,7 +246,7 @@ async def save_gachalogs(
     import_data: Optional[Dict[str, List[GachaLog]]] = None,
     force_overwrite: bool = False,
 ) -> str:
-    path = PLAYER_PATH / str(uid)
+    path = player_dir(uid)
     if not path.exists():
         path.mkdir(parents=True, exist_ok=True)
 
@@ -355,8 +346,14 @@ async def save_gachalogs(
     vo = msgspec.to_builtins(result)
     await write_player_json(gachalogs_path, vo)
 
-    # 失效 stats 缓存：下次抽卡记录/抽卡排行查询时 lazy 重建
-    (path / "gachaStats.json").unlink(missing_ok=True)
+    # 增量刷新 stats：只累加本次新增的记录，历史被改写时整池重建
+    from .draw_gachalogs import refresh_pool_stats
+
+    try:
+        await refresh_pool_stats(uid, vo["data"])
+    except Exception as e:
+        logger.warning(f"[鸣潮·抽卡导入] 刷新抽卡统计失败 uid={uid}: {e}")
+        (path / "gachaStats.json").unlink(missing_ok=True)
 
     # 计算数据
     all_add = sum(gachalogs_count_add.values())
@@ -381,49 +378,49 @@ async def save_gachalogs(
 
 
 
-async def import_gachalogs(ev: Event, history_url: str, type: str, uid: str, force_overwrite=False) -> str:
-    history_data: Dict = {}
-    if type == "json":
-        history_data = json.loads(history_url)
+def _to_utf8(data_bytes: bytes) -> bytes:
+    try:
+        data_bytes.decode("utf-8")
+        return data_bytes
+    except UnicodeDecodeError:
+        return data_bytes.decode("gbk").encode("utf-8")
+
+
+async def import_gachalogs(
+    ev: Event, history_url: Union[str, Dict], type: str, uid: str, force_overwrite=False
+) -> str:
+    """type: json=json字符串, url=下载链接, data=已解析的dict, 其余视为base64文件"""
+    history_data: Union[bytes, str, Dict] = b""
+    if type in ("json", "data"):
+        history_data = history_url
     elif type == "url":
         try:
             async with aiohttp.ClientSession(connector=TCPConnector(ssl=False)) as session:
                 async with session.get(history_url, timeout=30) as response:
                     if response.status != 200:
                         return f"下载文件失败，HTTP状态码: {response.status}"
-                    content_type = response.headers.get("Content-Type", "")
-                    if "application/json" in content_type:
-                        history_data = await response.json()
-                    else:
-                        data_bytes = await response.read()
-                        try:
-                            history_data = json.loads(data_bytes.decode("utf-8"))
-                        except UnicodeDecodeError:
-                            try:
-                                history_data = json.loads(data_bytes.decode("gbk"))
-                            except UnicodeDecodeError:
-                                return "无法解码文件内容，请检查文件编码格式"
+                    data_bytes = await response.read()
+                    try:
+                        history_data = _to_utf8(data_bytes)
+                    except UnicodeDecodeError:
+                        return "无法解码文件内容，请检查文件编码格式"
         except Exception as e:
             return f"下载文件失败: {str(e)}"
     else:
-        data_bytes = base64.b64decode(history_url)
         try:
-            history_data = json.loads(data_bytes.decode())
+            history_data = _to_utf8(base64.b64decode(history_url))
         except UnicodeDecodeError:
-            history_data = json.loads(data_bytes.decode("gbk"))
-        except json.decoder.JSONDecodeError:
             return "请传入正确的JSON格式文件!"
 
-    def turn_wwuid_gacha(data: Dict) -> Optional[WWUIDGacha]:
-        if "info" in data and "export_app" in data["info"]:
-            if "Waves-Plugin" == data["info"]["export_app"]:
-                return WavesPluginGacha.model_validate(data).turn_wwuid_gacha()
-            elif "XutheringWavesUID" == data["info"]["export_app"] or "WutheringWavesUID" == data["info"]["export_app"]:
-                return WWUIDGacha.model_validate(data)
-        return None
+    try:
+        decoded = decode_gacha_import(history_data)
+    except msgspec.DecodeError:
+        return "请传入正确的JSON格式文件!"
+    except msgspec.ValidationError as e:
+        logger.warning(f"[鸣潮·抽卡导入] 导入文件字段校验失败: {e}")
+        return f"抽卡记录文件内容有误: {e}"
 
-    wwuid_gacha = turn_wwuid_gacha(history_data)
-    if not wwuid_gacha:
+    if not decoded:
         err_res = [
             "你当前导入的抽卡记录文件不支持, 目前支持的文件类型有:",
             "1.WutheringWavesUID",
@@ -432,11 +429,12 @@ async def import_gachalogs(ev: Event, history_url: str, type: str, uid: str, for
         ]
         return "\n".join(err_res)
 
-    if wwuid_gacha.info.uid != uid:
+    import_uid, records = decoded
+    if import_uid != uid:
         return "你当前导入的抽卡记录文件的UID与当前UID不匹配!"
 
     import_data = copy.deepcopy(gachalogs_history_meta)
-    for item in wwuid_gacha.list:
+    for item in records:
         gacha_name = item.cardPoolType
         if gacha_name in gacha_type_meta_data:
             # 此时cardPoolType是名字 -> 如角色精准调谐
@@ -446,55 +444,40 @@ async def import_gachalogs(ev: Event, history_url: str, type: str, uid: str, for
             gacha_name = gacha_type_meta_data_reverse.get(item.cardPoolType)
             if not gacha_name:
                 continue
-        import_data[gacha_name].append(GachaLog(**item.model_dump()))
+        import_data[gacha_name].append(item)
 
     res = await save_gachalogs(ev, uid, "", import_data=import_data, force_overwrite=force_overwrite)
     return res
 
 
-async def export_gachalogs(uid: str) -> dict:
-    path = PLAYER_PATH / uid
-    if not path.exists():
-        path.mkdir(parents=True, exist_ok=True)
-
-    # 获取当前时间
+def _export_info(uid: str) -> Dict:
     now = datetime.now()
-    current_time = now.strftime("%Y-%m-%d %H:%M:%S")
+    return {
+        "export_time": now.strftime("%Y-%m-%d %H:%M:%S"),
+        "export_app": "XutheringWavesUID",
+        "export_app_version": XutheringWavesUID_version,
+        "export_timestamp": round(now.timestamp()),
+        "version": "v2.0",
+        "uid": uid,
+    }
 
-    # 抽卡记录json路径
-    gachalogs_path = path / "gacha_logs.json"
-    raw_data = await read_player_json(gachalogs_path)
-    if raw_data is not None:
-        result = {
-            "info": {
-                "export_time": current_time,
-                "export_app": "XutheringWavesUID",
-                "export_app_version": XutheringWavesUID_version,
-                "export_timestamp": round(now.timestamp()),
-                "version": "v2.0",
-                "uid": uid,
-            },
-            "list": [],
-        }
-        gachalogs_history = raw_data["data"]
-        for name, gachalogs in gachalogs_history.items():
-            result["list"].extend(gachalogs)
-
-        # async with aiofiles.open(path / f"export_{uid}.json", "w", encoding="UTF-8") as file:
-        #     await file.write(json.dumps(result, ensure_ascii=False, indent=4))
-        logger.success("[鸣潮·导出抽卡记录] 导出成功!")
-        im = {
-            "retcode": "ok",
-            "json": result,
-            "name": f"export_{uid}.json",
-        }
-    else:
+
+async def export_gachalogs(uid: str) -> Optional[Dict]:
+    """导出为 {"info", "list"} 结构 (合并导入用); 没有记录时返回 None"""
+    raw_data = await read_player_json(player_dir(uid) / "gacha_logs.json")
+    if raw_data is None:
+        logger.error("[鸣潮·导出抽卡记录] 没有找到抽卡记录!")
+        return None
+    return build_gacha_export(_export_info(uid), raw_data["data"])
+
+
+async def export_gachalogs_file(uid: str) -> Optional[Tuple[str, bytes]]:
+    """导出为文件: 从落盘数据逐条编码, 返回 (文件名, 内容); 没有记录时返回 None"""
+    raw_data = await read_player_json(player_dir(uid) / "gacha_logs.json")
+    if raw_data is None:
         logger.error("[鸣潮·导出抽卡记录] 没有找到抽卡记录!")
-        im = {
-            "retcode": "error",
-            "data": "你还没有抽卡记录可以导出!",
-            "name": "",
-            "url": "",
-        }
+        return None
 
-    return im
+    file_bytes = await asyncio.to_thread(encode_gacha_export, _export_info(uid), raw_data["data"])
+    logger.success("[鸣潮·导出抽卡记录] 导出成功!")
+    return f"export_{uid}.json", file_bytes
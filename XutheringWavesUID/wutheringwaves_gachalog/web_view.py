@@ -24,10 +24,10 @@ from ..utils.api.model import AccountBaseInfo
 from ..utils.cache import TimedCache
 from ..utils.util import hide_uid
 from ..utils.player_store import read_player_json, player_json_exists
+from ..utils.player_path import player_dir
 from ..utils.resource.RESOURCE_PATH import (
     AVATAR_PATH,
     MAIN_PATH,
-    PLAYER_PATH,
     WEAPON_PATH,
 )
 from ..utils.resource.constant import NORMAL_LIST
@@ -98,7 +98,7 @@ async def make_gacha_web_url(uid: str, ev: Event) -> Tuple[Optional[str], str]:
     if not _is_feature_enabled():
         return None, feature_disabled_msg()
 
-    gacha_path = PLAYER_PATH / str(uid) / "gacha_logs.json"
+    gacha_path = player_dir(uid) / "gacha_logs.json"
     if not player_json_exists(gacha_path):
         return None, f"[鸣潮] 你还没有抽卡记录噢!\n 请查看 {PREFIX}抽卡帮助 中的提示导入!"
 
@@ -402,7 +402,7 @@ def _build_pool_view(name: str, logs: List[Dict]) -> Dict:
 
 
 async def _load_gacha_data(uid: str) -> Dict:
-    path = PLAYER_PATH / str(uid) / "gacha_logs.json"
+    path = player_dir(uid) / "gacha_logs.json"
     return await read_player_json(path) or {}
 
 
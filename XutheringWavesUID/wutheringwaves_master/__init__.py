@@ -1,6 +1,7 @@
 import asyncio
 
 from gsuid_core.sv import SV
+from gsuid_core.aps import scheduler
 from gsuid_core.bot import Bot
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
@@ -9,11 +10,18 @@ from gsuid_core.subscribe import gs_subscribe
 from ..utils.database.waves_subscribe import WavesSubscribe
 from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
 from ..utils.player_store import compress_existing_sync
+from ..utils.player_path import migrate_player_dirs_sync
 
 sv_master = SV("联系主人", pm=0)
 master_name_ann = "联系主人"
 
 sv_waves_compress = SV("waves压缩数据", pm=0)
+sv_waves_shard = SV("waves迁移数据目录", pm=0)
+
+# 后台分批把平铺的 uid 目录搬进分片目录, 每轮只搬少量避免长时间占用磁盘
+PLAYER_SHARD_MINUTES = 10
+PLAYER_SHARD_LIMIT = 2000
+_shard_done = False
 
 
 def _fmt_size(n: float) -> str:
@@ -39,6 +47,26 @@ async def compress_player_data(bot: Bot, ev: Event):
     )
 
 
+@sv_waves_shard.on_fullmatch("迁移数据目录")
+async def migrate_player_data_dirs(bot: Bot, ev: Event):
+    global _shard_done
+    await bot.send("[鸣潮] 开始迁移逐用户数据目录")
+    moved, fail, _shard_done = await asyncio.to_thread(migrate_player_dirs_sync)
+    fail_txt = f"（失败 {fail}）" if fail else ""
+    await bot.send(f"[鸣潮] 迁移数据目录完成, 本次迁移 {moved} 个{fail_txt}")
+
+
+@scheduler.scheduled_job("interval", minutes=PLAYER_SHARD_MINUTES, id="waves_player_dir_shard")
+async def waves_player_dir_shard_slice():
+    global _shard_done
+    if _shard_done:
+        return
+    # 手动迁移正在进行时跳过本轮, 不占着线程等锁
+    moved, fail, _shard_done = await asyncio.to_thread(migrate_player_dirs_sync, PLAYER_SHARD_LIMIT, False)
+    if moved or fail:
+        logger.info(f"[鸣潮·数据目录] 分片迁移: 本轮 {moved} 个, 失败 {fail} 个")
+
+
 @sv_master.on_regex(("^(联系|取消联系)主人$"))
 async def rover_sign_result(bot: Bot, ev: Event):
 
@@ -1,6 +1,7 @@
 import time
 import asyncio
-from typing import List, Union, Optional
+from functools import partial
+from typing import Dict, List, Union, Optional
 from pathlib import Path
 
 from PIL import Image, ImageDraw
@@ -9,6 +10,7 @@ from pydantic import BaseModel
 from gsuid_core.bot import Bot
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
+from gsuid_core.pool import to_thread
 from gsuid_core.utils.image.convert import convert_img
 from gsuid_core.utils.image.image_tools import crop_center_img
 
@@ -29,6 +31,8 @@ from ..utils.image import (
     get_sonata_label,
     get_custom_waves_bg,
     get_role_pile_default,
+    prefetch_images,
+    square_placeholder,
     get_sonata_effect_image,
 )
 from ..utils.api.model import WeaponData, RoleDetailData
@@ -250,7 +254,6 @@ async def get_all_rank_info(
     return rankInfoList
 
 
-# TODO: PIL 卸到线程池 (loop body 多处 await get_attribute / get_square_weapon / get_attribute_effect, 重构成本大)
 async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union[str, bytes]:
     char_id = char_name_to_char_id(char)
     if not char_id:
@@ -353,6 +356,66 @@ async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union
         rankInfoList.append(rankInfo)
 
     totalNum = len(rankInfoList)
+
+    tasks = [
+        get_avatar(rank.qid, getattr(rank, "sender_avatar", ""), char_id=rank.roleDetail.role.roleId)
+        for rank in rankInfoList
+    ]
+    results = await asyncio.gather(*tasks)
+
+    _mask_uid = await build_uid_masker([(r.uid, r.qid) for r in rankInfoList], ev.bot_id)
+
+    # 预取贴图 (去重), 合成阶段不再 await
+    attr_names = {r.roleDetail.role.attributeName or "导电" for r in rankInfoList}
+    weapon_ids = {r.roleDetail.weaponData.weapon.weaponId for r in rankInfoList}
+    sonata_names = {r.sonata_name for r in rankInfoList if r.sonata_name}
+    attr_map = await prefetch_images(attr_names, partial(get_attribute, is_simple=True))
+    weapon_map = await prefetch_images(weapon_ids, get_square_weapon)
+    sonata_map = await prefetch_images(sonata_names, partial(get_sonata_effect_image, size=50))
+    pile, _ = await get_role_pile_default(char_id, custom=True)
+
+    if char_id in SPECIAL_CHAR_NAME:
+        char_name = SPECIAL_CHAR_NAME[char_id]
+
+    card_img = await _compose_rank_card(
+        rankInfoList,
+        results,
+        attr_map,
+        weapon_map,
+        sonata_map,
+        pile,
+        rankId,
+        totalNum,
+        damage_title,
+        f"{char_name}{rank_type}群排行",
+        rank_type,
+        tokenLimitFlag,
+        WutheringWavesConfig.get_config("RankActiveFilterGroup").data,
+        _mask_uid,
+    )
+    card_img = await convert_img(card_img)
+
+    logger.info(f"[鸣潮·练度排行] get_rank_info_for_user end: {time.time() - start_time}")
+    return card_img
+
+
+@to_thread
+def _compose_rank_card(
+    rankInfoList: List[RankInfo],
+    avatars: List[Image.Image],
+    attr_map: Dict[str, Image.Image],
+    weapon_map: Dict[int, Image.Image],
+    sonata_map: Dict[str, Image.Image],
+    pile: Image.Image,
+    rankId: Optional[int],
+    totalNum: int,
+    damage_title: str,
+    title_name: str,
+    rank_type: str,
+    tokenLimitFlag: bool,
+    active_filter: bool,
+    mask_uid,
+) -> Image.Image:
     title_h = 500
     bar_star_h = 110
     h = title_h + totalNum * bar_star_h + 80
@@ -363,15 +426,7 @@ async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union
     total_score = 0
     total_damage = 0
 
-    tasks = [
-        get_avatar(rank.qid, getattr(rank, "sender_avatar", ""), char_id=rank.roleDetail.role.roleId)
-        for rank in rankInfoList
-    ]
-    results = await asyncio.gather(*tasks)
-
-    _mask_uid = await build_uid_masker([(r.uid, r.qid) for r in rankInfoList], ev.bot_id)
-
-    for index, temp in enumerate(zip(rankInfoList, results)):
+    for index, temp in enumerate(zip(rankInfoList, avatars)):
         rank, role_avatar = temp
         rank: RankInfo
         rank_role_detail: RoleDetailData = rank.roleDetail
@@ -379,9 +434,10 @@ async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union
         bar_star_draw = ImageDraw.Draw(bar_bg)
         bar_bg.paste(role_avatar, (100, 0), role_avatar)
 
-        role_attribute = await get_attribute(rank_role_detail.role.attributeName or "导电", is_simple=True)
-        role_attribute = role_attribute.resize((40, 40)).convert("RGBA")
-        bar_bg.alpha_composite(role_attribute, (300, 20))
+        role_attribute = attr_map.get(rank_role_detail.role.attributeName or "导电")
+        if role_attribute is not None:
+            role_attribute = role_attribute.resize((40, 40)).convert("RGBA")
+            bar_bg.alpha_composite(role_attribute, (300, 20))
 
         # 命座
         info_block = Image.new("RGBA", (46, 20), color=(255, 255, 255, 0))
@@ -413,8 +469,9 @@ async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union
 
         # 合鸣效果
         if rank.sonata_name:
-            effect_image = await get_sonata_effect_image(rank.sonata_name, 50)
-            bar_bg.alpha_composite(effect_image, (533, 15))
+            effect_image = sonata_map.get(rank.sonata_name)
+            if effect_image is not None:
+                bar_bg.alpha_composite(effect_image, (533, 15))
             sonata_name = get_sonata_label(rank.sonata_name)
         else:
             sonata_name = "合鸣效果"
@@ -428,7 +485,7 @@ async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union
         weapon_bg_temp = Image.new("RGBA", (600, 300))
 
         weaponData: WeaponData = rank_role_detail.weaponData
-        weapon_icon = await get_square_weapon(weaponData.weapon.weaponId)
+        weapon_icon = weapon_map.get(weaponData.weapon.weaponId) or square_placeholder()
         weapon_icon = crop_center_img(weapon_icon, 110, 110)
         weapon_icon_bg = get_weapon_icon_bg(weaponData.weapon.weaponStarLevel)
         weapon_icon_bg.paste(weapon_icon, (10, 20), weapon_icon)
@@ -470,7 +527,7 @@ async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union
         uid_color = "white"
         if rankId is not None and rankId == rank_id:
             uid_color = RED
-        bar_star_draw.text((210, 75), f"{_mask_uid(rank.uid, rank.qid)}", uid_color, waves_font_20, "lm")
+        bar_star_draw.text((210, 75), f"{mask_uid(rank.uid, rank.qid)}", uid_color, waves_font_20, "lm")
 
         # 贴到背景
         card_img.paste(bar_bg, (0, title_h + index * bar_star_h), bar_bg)
@@ -491,7 +548,6 @@ async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union
     title.alpha_composite(logo_img.copy(), dest=(50, 65))
 
     # 人物bg
-    pile, _ = await get_role_pile_default(char_id, custom=True)
     title.paste(pile, (450, -120), pile)
     title_draw.text((200, 335), f"{avg_score}", "white", waves_font_44, "mm")
     title_draw.text((200, 375), "平均声骸分数", SPECIAL_GOLD, waves_font_20, "mm")
@@ -502,10 +558,6 @@ async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union
             (390, 375), "平均治疗量" if "治疗" in damage_title else "平均伤害", SPECIAL_GOLD, waves_font_20, "mm"
         )
 
-    if char_id in SPECIAL_CHAR_NAME:
-        char_name = SPECIAL_CHAR_NAME[char_id]
-
-    title_name = f"{char_name}{rank_type}群排行"
     title_draw.text((140, 265), f"{title_name}", "black", waves_font_30, "lm")
     date_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
     title_draw.text((110, 205), date_text, GREY, waves_font_20, "lm")
@@ -516,7 +568,7 @@ async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union
     title_draw.text((20, 420), f"{rank_row_title}", SPECIAL_GOLD, waves_font_16, "lm")
     title_draw.text((90, 420), f"{rank_row}", GREY, waves_font_16, "lm")
     if tokenLimitFlag:
-        rank_row = f"2.使用命令【{PREFIX}登录】登录过，且近期活跃的用户" if WutheringWavesConfig.get_config("RankActiveFilterGroup").data else f"2.使用命令【{PREFIX}登录】登录过的用户"
+        rank_row = f"2.使用命令【{PREFIX}登录】登录过，且近期活跃的用户" if active_filter else f"2.使用命令【{PREFIX}登录】登录过的用户"
         title_draw.text((90, 438), f"{rank_row}", GREY, waves_font_16, "lm")
 
     if rank_type == "伤害":
@@ -528,11 +580,7 @@ async def draw_rank_img(bot: Bot, ev: Event, char: str, rank_type: str) -> Union
     img_temp = Image.new("RGBA", char_mask.size)
     img_temp.paste(title, (0, 0), char_mask.copy())
     card_img.alpha_composite(img_temp, (0, 0))
-    card_img = add_footer(card_img)
-    card_img = await convert_img(card_img)
-
-    logger.info(f"[鸣潮·练度排行] get_rank_info_for_user end: {time.time() - start_time}")
-    return card_img
+    return add_footer(card_img)
 
 
 def get_weapon_icon_bg(star: int = 3) -> Image.Image:
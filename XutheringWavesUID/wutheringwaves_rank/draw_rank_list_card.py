@@ -44,7 +44,7 @@ from ..utils.fonts.waves_fonts import (
     waves_font_34,
     waves_font_58,
 )
-from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+from ..utils.player_path import player_dir
 
 
 def calculate_role_phantom_score(role_detail: RoleDetailData) -> float:
@@ -88,7 +88,7 @@ async def save_char_list_data(uid: str, char_list_data: Dict):
     """
     try:
         from ..utils.player_store import write_player_json
-        await write_player_json(PLAYER_PATH / uid / "charListData.json", char_list_data)
+        await write_player_json(player_dir(uid) / "charListData.json", char_list_data)
     except Exception as e:
         logger.debug(f"[鸣潮·练度排行] 保存 charListData.json 失败 uid={uid}: {e}")
 
@@ -103,7 +103,7 @@ async def load_char_list_data(uid: str) -> Optional[Dict]:
         角色评分字典，格式为 {roleId: score}，如果文件不存在返回None
     """
     from ..utils.player_store import read_player_json
-    return await read_player_json(PLAYER_PATH / uid / "charListData.json")
+    return await read_player_json(player_dir(uid) / "charListData.json")
 
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
@@ -306,36 +306,6 @@ async def draw_rank_list(bot: Bot, ev: Event, threshold: int = 175) -> Union[str
     # 计算所需的总高度
     total_height = header_height + text_bar_height + item_spacing * char_list_len + footer_height
 
-    # 创建带背景的画布
-    card_img = get_custom_waves_bg(width, total_height, "bg9")
-
-    text_bar_img = Image.new("RGBA", (width, 140), color=(0, 0, 0, 0))
-    text_bar_draw = ImageDraw.Draw(text_bar_img)
-    # 绘制深灰色背景
-    bar_bg_color = (36, 36, 41, 230)
-    text_bar_draw.rounded_rectangle([20, 20, width - 40, 120], radius=8, fill=bar_bg_color)
-
-    # 绘制顶部的金色高亮线
-    accent_color = (203, 161, 95)
-    text_bar_draw.rectangle([20, 20, width - 40, 26], fill=accent_color)
-
-    # 左侧标题
-    text_bar_draw.text((40, 60), "排行说明", GREY, waves_font_28, "lm")
-    text_bar_draw.text(
-        (185, 50),
-        "1. 综合所有角色的声骸分数。仅计算本地评分，不考虑套装和共享声骸。",
-        SPECIAL_GOLD,
-        waves_font_20,
-        "lm",
-    )
-    text_bar_draw.text((185, 85), "2. 仅显示近期活跃用户，至多显示声骸分数最高的前8个角色" if WutheringWavesConfig.get_config("RankActiveFilterGroup").data else "2. 至多显示声骸分数最高的前8个角色", SPECIAL_GOLD, waves_font_20, "lm")
-
-    # 备注 - 排行标准，根据阈值动态生成文案
-    temp_notes = f"排行标准：以所有角色声骸分数总和（角色分数>={threshold}（{threshold_label}级））为排序的综合排名"
-    text_bar_draw.text((width - 40, 110), temp_notes, SPECIAL_GOLD, waves_font_16, "rm")
-
-    card_img.alpha_composite(text_bar_img, (0, header_height))
-
     # 导入必要的图片资源
     bar = Image.open(TEXT_PATH / "bar2.png")
 
@@ -358,8 +328,9 @@ async def draw_rank_list(bot: Bot, ev: Event, threshold: int = 175) -> Union[str
         char_avatar_map = dict(zip(all_role_ids, fetched))
 
     card_img = await _compose_rank_list(
-        card_img, bar, rankInfoList_display, display_rank_ids, results, char_avatar_map,
-        self_uid, threshold_label, header_height, item_spacing, width, _mask_uid,
+        total_height, bar, rankInfoList_display, display_rank_ids, results, char_avatar_map,
+        self_uid, threshold, threshold_label, header_height, item_spacing, width, _mask_uid,
+        WutheringWavesConfig.get_config("RankActiveFilterGroup").data,
     )
     card_img = await convert_img(card_img)
 
@@ -367,9 +338,40 @@ async def draw_rank_list(bot: Bot, ev: Event, threshold: int = 175) -> Union[str
 
 
 @to_thread
-def _compose_rank_list(card_img, bar, rankInfoList_display, display_rank_ids, results, char_avatar_map,
-                      self_uid, threshold_label, header_height, item_spacing, width, mask_uid=None):
+def _compose_rank_list(total_height, bar, rankInfoList_display, display_rank_ids, results, char_avatar_map,
+                      self_uid, threshold, threshold_label, header_height, item_spacing, width, mask_uid=None,
+                      active_filter=False):
     from ..utils.calc import WuWaCalc
+    # 创建带背景的画布
+    card_img = get_custom_waves_bg(width, total_height, "bg9")
+
+    text_bar_img = Image.new("RGBA", (width, 140), color=(0, 0, 0, 0))
+    text_bar_draw = ImageDraw.Draw(text_bar_img)
+    # 绘制深灰色背景
+    bar_bg_color = (36, 36, 41, 230)
+    text_bar_draw.rounded_rectangle([20, 20, width - 40, 120], radius=8, fill=bar_bg_color)
+
+    # 绘制顶部的金色高亮线
+    accent_color = (203, 161, 95)
+    text_bar_draw.rectangle([20, 20, width - 40, 26], fill=accent_color)
+
+    # 左侧标题
+    text_bar_draw.text((40, 60), "排行说明", GREY, waves_font_28, "lm")
+    text_bar_draw.text(
+        (185, 50),
+        "1. 综合所有角色的声骸分数。仅计算本地评分，不考虑套装和共享声骸。",
+        SPECIAL_GOLD,
+        waves_font_20,
+        "lm",
+    )
+    text_bar_draw.text((185, 85), "2. 仅显示近期活跃用户，至多显示声骸分数最高的前8个角色" if active_filter else "2. 至多显示声骸分数最高的前8个角色", SPECIAL_GOLD, waves_font_20, "lm")
+
+    # 备注 - 排行标准，根据阈值动态生成文案
+    temp_notes = f"排行标准：以所有角色声骸分数总和（角色分数>={threshold}（{threshold_label}级））为排序的综合排名"
+    text_bar_draw.text((width - 40, 110), temp_notes, SPECIAL_GOLD, waves_font_16, "rm")
+
+    card_img.alpha_composite(text_bar_img, (0, header_height))
+
     for rank_temp_index, temp in enumerate(zip(rankInfoList_display, results)):
         rankInfo = temp[0]
         role_avatar = temp[1]
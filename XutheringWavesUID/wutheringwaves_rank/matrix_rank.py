@@ -12,6 +12,7 @@ from PIL import Image, ImageDraw, ImageFont
 from gsuid_core.bot import Bot
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
+from gsuid_core.pool import to_thread
 from gsuid_core.utils.image.convert import convert_img
 
 from ..utils.util import get_version, hide_uid, build_uid_masker
@@ -23,8 +24,9 @@ from ..utils.image import (
     get_ICON,
     add_footer,
     get_waves_bg,
-    get_square_avatar,
-    pic_download_from_url,
+    prefetch_pics_from_url,
+    prefetch_square_avatars,
+    square_placeholder,
 )
 from .rank_badge import draw_bot_name_badge, draw_rank_badge
 from .slash_rank import is_limited_5star
@@ -95,7 +97,6 @@ async def get_rank(item: MatrixRankItem) -> Optional[MatrixRankRes]:
             logger.exception(f"[鸣潮·矩阵排行] 获取远端排行失败: {e}")
 
 
-# TODO: PIL 卸到线程池 (loop 内 await get_square_avatar / pic_download_from_url 频繁, 需要批量预取重构)
 async def draw_all_matrix_rank_card(bot: Bot, ev: Event):
     waves_id = await WavesBind.get_uid_by_game(ev.user_id, ev.bot_id)
     match = re.search(r"(\d+)", ev.raw_text)
@@ -123,12 +124,65 @@ async def draw_all_matrix_rank_card(bot: Bot, ev: Event):
     if not rankInfoList.data:
         return "获取矩阵排行失败"
 
+    period_label = None
+    if rankInfoList.data.start_date:
+        rank_dt = parse_rank_date(rankInfoList.data.start_date)
+        if rank_dt:
+            period_label = f"第{get_matrix_period_number(rank_dt)}期"
+
+    rank_list = rankInfoList.data.rank_list
+    tasks = [get_avatar(rank.user_id, getattr(rank, "sender_avatar", "")) for rank in rank_list]
+    results = await asyncio.gather(*tasks)
+
+    # 按分数排序取最高和次高, 并预取角色头像 / 图标, 合成阶段不再 await
+    top_teams = [sorted(rank.teams, key=lambda t: t.score, reverse=True)[:2] for rank in rank_list]
+    slot_ids = [
+        [
+            [
+                cid if get_char_model(cid) is not None else None
+                for cid in (randomize_special_char_id(cd.char_id) for cd in team.char_detail)
+            ]
+            for team in teams
+        ]
+        for teams in top_teams
+    ]
+    avatar_map = await prefetch_square_avatars(
+        cid for team_ids in slot_ids for ids in team_ids for cid in ids if cid is not None
+    )
+    pic_map = await prefetch_pics_from_url(
+        MATRIX_PATH,
+        [
+            url
+            for teams in top_teams
+            for team in teams
+            for url in ([] if team.char_detail else team.role_icons) + [team.buff_icon]
+        ],
+    )
+
+    card_img = await _compose_all_matrix_rank(
+        rank_list, results, top_teams, slot_ids, avatar_map, pic_map, period_label, item.waves_id
+    )
+    card_img = await convert_img(card_img)
+    return card_img
+
+
+@to_thread
+def _compose_all_matrix_rank(
+    rank_list: List[MatrixRank],
+    results: List[Image.Image],
+    top_teams: List[list],
+    slot_ids: List[List[List[Optional[int]]]],
+    avatar_map: Dict,
+    pic_map: Dict[str, Image.Image],
+    period_label: Optional[str],
+    self_waves_id: str,
+) -> Image.Image:
     # 设置图像尺寸
     width = 1300
     item_spacing = 120
     header_height = 510
     footer_height = 50
-    char_list_len = len(rankInfoList.data.rank_list)
+    char_list_len = len(rank_list)
 
     total_height = header_height + item_spacing * char_list_len + footer_height
 
@@ -155,11 +209,6 @@ async def draw_all_matrix_rank_card(bot: Bot, ev: Event):
     title_bg_draw = ImageDraw.Draw(title_bg)
     title_bg_draw.text((220, 290), title_text, "white", waves_font_58, "lm")
 
-    period_label = None
-    if rankInfoList.data and rankInfoList.data.start_date:
-        rank_dt = parse_rank_date(rankInfoList.data.start_date)
-        if rank_dt:
-            period_label = f"第{get_matrix_period_number(rank_dt)}期"
     date_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
     if period_label:
         period_pos = (225, 360)
@@ -185,10 +234,6 @@ async def draw_all_matrix_rank_card(bot: Bot, ev: Event):
 
     card_img.paste(char_mask_temp, (0, 0), char_mask_temp)
 
-    rank_list = rankInfoList.data.rank_list
-    tasks = [get_avatar(rank.user_id, getattr(rank, "sender_avatar", "")) for rank in rank_list]
-    results = await asyncio.gather(*tasks)
-
     for rank_temp_index, temp in enumerate(zip(rank_list, results)):
         rank_temp: MatrixRank = temp[0]
         role_avatar: Image.Image = temp[1]
@@ -205,7 +250,7 @@ async def draw_all_matrix_rank_card(bot: Bot, ev: Event):
 
         # 特征码 — 移到名字上方，不带 "特征码:" 前缀
         uid_color = "white"
-        if rank_temp.waves_id == item.waves_id:
+        if rank_temp.waves_id == self_waves_id:
             uid_color = RED
         role_bg_draw.text((210, 40), f"{hide_uid(rank_temp.waves_id, user_pref='on' if rank_temp.hide_uid else '')}", uid_color, waves_font_20, "lm")
 
@@ -236,20 +281,15 @@ async def draw_all_matrix_rank_card(bot: Bot, ev: Event):
         team_base_x = 550
         team_spacing = 250
 
-        # 按分数排序取最高和次高
-        sorted_teams = sorted(rank_temp.teams, key=lambda t: t.score, reverse=True)
-
-        for team_index, matrix_team in enumerate(sorted_teams[:2]):
+        for team_index, matrix_team in enumerate(top_teams[rank_temp_index]):
             # 角色头像
             for role_index, char_detail in enumerate(matrix_team.char_detail):
-                char_id = char_detail.char_id
+                char_id = slot_ids[rank_temp_index][team_index][role_index]
                 char_chain = char_detail.chain
 
-                char_id = randomize_special_char_id(char_id)
-                char_model = get_char_model(char_id)
-                if char_model is None:
+                if char_id is None:
                     continue
-                char_avatar = await get_square_avatar(char_id)
+                char_avatar = avatar_map.get(char_id) or square_placeholder()
                 char_avatar = char_avatar.resize((45, 45))
 
                 if char_chain != -1:
@@ -271,7 +311,7 @@ async def draw_all_matrix_rank_card(bot: Bot, ev: Event):
             if not matrix_team.char_detail and matrix_team.role_icons:
                 for role_index, icon_url in enumerate(matrix_team.role_icons):
                     try:
-                        role_pic = await pic_download_from_url(MATRIX_PATH, icon_url)
+                        role_pic = pic_map[icon_url]
                         role_pic = role_pic.resize((45, 45))
                         circle_mask = Image.new("L", (45, 45), 0)
                         circle_draw = ImageDraw.Draw(circle_mask)
@@ -302,7 +342,7 @@ async def draw_all_matrix_rank_card(bot: Bot, ev: Event):
                         radius=5,
                         fill=(0, 0, 0, int(0.8 * 255)),
                     )
-                    buff_pic = await pic_download_from_url(MATRIX_PATH, matrix_team.buff_icon)
+                    buff_pic = pic_map[matrix_team.buff_icon]
                     buff_pic = buff_pic.resize((50, 50))
                     buff_bg.paste(buff_pic, (0, 0), buff_pic)
                     # 角色头像最多3个(150px)，buff放在角色后面
@@ -324,9 +364,7 @@ async def draw_all_matrix_rank_card(bot: Bot, ev: Event):
 
         card_img.paste(role_bg, (0, 510 + rank_temp_index * item_spacing), role_bg)
 
-    card_img = add_footer(card_img)
-    card_img = await convert_img(card_img)
-    return card_img
+    return add_footer(card_img)
 
 
 class MatrixTeamInfo:
@@ -387,7 +425,7 @@ async def get_all_matrix_rank_info(
     wavesTokenUsersMap: Optional[Dict[Tuple[str, str], str]] = None,
 ) -> List[MatrixRankListInfo]:
     """从本地获取所有用户的矩阵排行信息"""
-    from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+    from ..utils.player_path import player_dir
 
     rankInfoList = []
 
@@ -400,7 +438,7 @@ async def get_all_matrix_rank_info(
                 if (user.user_id, uid) not in wavesTokenUsersMap:
                     continue
             try:
-                matrix_data_path = PLAYER_PATH / uid / "matrixData.json"
+                matrix_data_path = player_dir(uid) / "matrixData.json"
                 matrix_raw = await read_player_json(matrix_data_path)
                 if matrix_raw is None:
                     continue
@@ -458,7 +496,7 @@ async def get_matrix_rank_token_condition(ev) -> Tuple[bool, Dict[Tuple[str, str
 
 async def get_role_chain_count(uid: str, role_id: int) -> int:
     """获取角色共鸣链数量, 漂泊者走 rover.json"""
-    from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+    from ..utils.player_path import player_dir
     from ..utils.resource.constant import SPECIAL_CHAR, SPECIAL_CHAR_RANK_MAP
     from ..utils.char_info_utils import get_rover_detail_map
 
@@ -467,7 +505,7 @@ async def get_role_chain_count(uid: str, role_id: int) -> int:
             temp = (await get_rover_detail_map(uid)).get(SPECIAL_CHAR_RANK_MAP[str(role_id)])
             return temp.get_chain_num() if temp else -1
 
-        raw_data = await read_player_json(PLAYER_PATH / str(uid) / "rawData.json")
+        raw_data = await read_player_json(player_dir(uid) / "rawData.json")
         if raw_data is None:
             return -1
         if isinstance(raw_data, list):
@@ -480,7 +518,6 @@ async def get_role_chain_count(uid: str, role_id: int) -> int:
         return -1
 
 
-# TODO: PIL 卸到线程池 (loop 内 await get_role_chain_count / pic_download_from_url 频繁, 需要批量预取重构)
 async def draw_matrix_rank_list(bot: Bot, ev: Event):
     """绘制矩阵群排行 (PIL)"""
     start_time = time.time()
@@ -538,6 +575,44 @@ async def draw_matrix_rank_list(bot: Bot, ev: Event):
 
     _mask_uid = await build_uid_masker([(ri.uid, ri.user_id) for ri in rankInfoList_display], ev.bot_id)
 
+    # 获取头像
+    tasks = [get_avatar(rank.user_id, getattr(rank, "sender_avatar", "")) for rank in rankInfoList_display]
+    results = await asyncio.gather(*tasks)
+
+    # 预取共鸣链 / 角色图标 / buff 图标, 合成阶段不再 await
+    chain_keys = list(
+        dict.fromkeys(
+            (ri.uid, cid)
+            for ri in rankInfoList_display
+            for cid in list(ri.all_char_ids) + [c for t in ri.top_teams for c in t.char_ids]
+            if cid
+        )
+    )
+    chain_counts = await asyncio.gather(*[get_role_chain_count(uid, cid) for uid, cid in chain_keys])
+    chain_map = dict(zip(chain_keys, chain_counts))
+    pic_map = await prefetch_pics_from_url(
+        MATRIX_PATH,
+        [url for ri in rankInfoList_display for t in ri.top_teams for url in list(t.role_icons) + [t.buff_icon]],
+    )
+
+    card_img = await _compose_matrix_rank_list(
+        rankInfoList_display, results, chain_map, pic_map, self_uid, _mask_uid
+    )
+    card_img = await convert_img(card_img)
+
+    logger.info(f"[鸣潮·矩阵排行] 群排行 end: {time.time() - start_time}")
+    return card_img
+
+
+@to_thread
+def _compose_matrix_rank_list(
+    rankInfoList_display: List[MatrixRankListInfo],
+    results: List[Image.Image],
+    chain_map: Dict[Tuple[str, int], int],
+    pic_map: Dict[str, Image.Image],
+    self_uid: Optional[str],
+    mask_uid,
+) -> Image.Image:
     # 设置图像尺寸
     width = 1000
     item_spacing = 120
@@ -589,10 +664,6 @@ async def draw_matrix_rank_list(bot: Bot, ev: Event):
 
     card_img.paste(char_mask_temp, (0, 0), char_mask_temp)
 
-    # 获取头像
-    tasks = [get_avatar(rank.user_id, getattr(rank, "sender_avatar", "")) for rank in rankInfoList_display]
-    results = await asyncio.gather(*tasks)
-
     # 绘制排行条目
     bar = Image.open(TEXT_PATH / "bar2.png")
 
@@ -615,7 +686,7 @@ async def draw_matrix_rank_list(bot: Bot, ev: Event):
             seen_ids.add(role_id)
             if not is_limited_5star(role_id):
                 continue
-            chain_count = await get_role_chain_count(rankInfo.uid, role_id)
+            chain_count = chain_map[(rankInfo.uid, role_id)]
             if chain_count >= 0:
                 char_gold_total += chain_count + 1
 
@@ -625,7 +696,7 @@ async def draw_matrix_rank_list(bot: Bot, ev: Event):
         uid_color = "white"
         if rankInfo.uid == self_uid:
             uid_color = RED
-        role_bg_draw.text((210, 70), f"{_mask_uid(rankInfo.uid, rankInfo.user_id)}", uid_color, waves_font_20, "lm")
+        role_bg_draw.text((210, 70), f"{mask_uid(rankInfo.uid, rankInfo.user_id)}", uid_color, waves_font_20, "lm")
 
         # 总分数 (右侧，左移25px)
         total_color = get_local_score_color(rankInfo.score)
@@ -647,13 +718,13 @@ async def draw_matrix_rank_list(bot: Bot, ev: Event):
             # 角色头像 (从URL下载, 方形) + 共鸣链
             for role_index, icon_url in enumerate(team_info.role_icons):
                 try:
-                    role_pic = await pic_download_from_url(MATRIX_PATH, icon_url)
+                    role_pic = pic_map[icon_url]
                     role_pic = role_pic.resize((45, 45))
 
                     # 如果有对应的 char_id，绘制共鸣链
                     if role_index < len(team_info.char_ids) and team_info.char_ids[role_index]:
                         char_id = team_info.char_ids[role_index]
-                        chain_count = await get_role_chain_count(rankInfo.uid, char_id)
+                        chain_count = chain_map[(rankInfo.uid, char_id)]
                         if chain_count != -1:
                             info_block = Image.new("RGBA", (20, 20), color=(255, 255, 255, 0))
                             info_block_draw = ImageDraw.Draw(info_block)
@@ -681,7 +752,7 @@ async def draw_matrix_rank_list(bot: Bot, ev: Event):
                         radius=5,
                         fill=(0, 0, 0, int(0.8 * 255)),
                     )
-                    buff_pic = await pic_download_from_url(MATRIX_PATH, team_info.buff_icon)
+                    buff_pic = pic_map[team_info.buff_icon]
                     buff_pic = buff_pic.resize((50, 50))
                     buff_bg.paste(buff_pic, (0, 0), buff_pic)
                     role_bg.alpha_composite(buff_bg, (base_x + 150, 15))
@@ -703,8 +774,4 @@ async def draw_matrix_rank_list(bot: Bot, ev: Event):
 
         card_img.paste(role_bg, (0, 510 + rank_temp_index * item_spacing), role_bg)
 
-    card_img = add_footer(card_img)
-    card_img = await convert_img(card_img)
-
-    logger.info(f"[鸣潮·矩阵排行] 群排行 end: {time.time() - start_time}")
-    return card_img
+    return add_footer(card_img)
@@ -11,6 +11,7 @@ from PIL import Image, ImageDraw
 from gsuid_core.bot import Bot
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
+from gsuid_core.pool import to_thread
 from gsuid_core.utils.image.convert import convert_img
 
 from ..utils.util import get_version, hide_uid, build_uid_masker
@@ -22,8 +23,9 @@ from ..utils.image import (
     get_ICON,
     add_footer,
     get_waves_bg,
-    get_square_avatar,
-    pic_download_from_url,
+    prefetch_pics_from_url,
+    prefetch_square_avatars,
+    square_placeholder,
 )
 from .rank_badge import draw_bot_name_badge, draw_rank_badge
 from ..utils.api.model import SlashDetail
@@ -120,7 +122,6 @@ def is_limited_5star(char_id: int) -> bool:
     return bool(char_model and char_model.starLevel == 5)
 
 
-# TODO: PIL 卸到线程池 (loop 内 await get_square_avatar / pic_download_from_url 较多, 需要批量预取重构)
 async def draw_all_slash_rank_card(bot: Bot, ev: Event):
     waves_id = await WavesBind.get_uid_by_game(ev.user_id, ev.bot_id)
     match = re.search(r"(\d+)", ev.raw_text)
@@ -148,12 +149,55 @@ async def draw_all_slash_rank_card(bot: Bot, ev: Event):
     if not rankInfoList.data:
         return "获取排行失败"
 
+    period_label = None
+    if rankInfoList.data.start_date:
+        rank_dt = parse_rank_date(rankInfoList.data.start_date)
+        if rank_dt:
+            period_label = f"第{get_slash_period_number(rank_dt)}期"
+
+    rank_list = rankInfoList.data.rank_list
+    tasks = [get_avatar(rank.user_id, getattr(rank, "sender_avatar", "")) for rank in rank_list]
+    results = await asyncio.gather(*tasks)
+
+    # 预取角色头像与 buff 图标, 合成阶段不再 await
+    slot_ids = [
+        [
+            [
+                cid if get_char_model(cid) is not None else None
+                for cid in (randomize_special_char_id(cd.char_id) for cd in sh.char_detail)
+            ]
+            for sh in rank.half_list
+        ]
+        for rank in rank_list
+    ]
+    avatar_map = await prefetch_square_avatars(
+        cid for halves in slot_ids for ids in halves for cid in ids if cid is not None
+    )
+    buff_map = await prefetch_pics_from_url(SLASH_PATH, (sh.buff_icon for rank in rank_list for sh in rank.half_list))
+
+    card_img = await _compose_all_slash_rank(
+        rank_list, results, slot_ids, avatar_map, buff_map, period_label, item.waves_id
+    )
+    card_img = await convert_img(card_img)
+    return card_img
+
+
+@to_thread
+def _compose_all_slash_rank(
+    rank_list: List[SlashRank],
+    results: List[Image.Image],
+    slot_ids: List[List[List[Optional[int]]]],
+    avatar_map: Dict,
+    buff_map: Dict[str, Image.Image],
+    period_label: Optional[str],
+    self_waves_id: str,
+) -> Image.Image:
     # 设置图像尺寸
     width = 1300
     item_spacing = 120
     header_height = 510
     footer_height = 50
-    char_list_len = len(rankInfoList.data.rank_list)
+    char_list_len = len(rank_list)
 
     # 计算所需的总高度
     total_height = header_height + item_spacing * char_list_len + footer_height
@@ -174,11 +218,6 @@ async def draw_all_slash_rank_card(bot: Bot, ev: Event):
     title_text = "#无尽总排行"
     title_bg_draw = ImageDraw.Draw(title_bg)
     title_bg_draw.text((220, 290), title_text, "white", waves_font_58, "lm")
-    period_label = None
-    if rankInfoList.data and rankInfoList.data.start_date:
-        rank_dt = parse_rank_date(rankInfoList.data.start_date)
-        if rank_dt:
-            period_label = f"第{get_slash_period_number(rank_dt)}期"
     date_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
     if period_label:
         period_pos = (225, 360)
@@ -207,10 +246,6 @@ async def draw_all_slash_rank_card(bot: Bot, ev: Event):
 
     card_img.paste(char_mask_temp, (0, 0), char_mask_temp)
 
-    rank_list = rankInfoList.data.rank_list
-    tasks = [get_avatar(rank.user_id, getattr(rank, "sender_avatar", "")) for rank in rank_list]
-    results = await asyncio.gather(*tasks)
-
     for rank_temp_index, temp in enumerate(zip(rank_list, results)):
         rank_temp: SlashRank = temp[0]
         role_avatar: Image.Image = temp[1]
@@ -228,7 +263,7 @@ async def draw_all_slash_rank_card(bot: Bot, ev: Event):
 
         # uid
         uid_color = "white"
-        if rank_temp.waves_id == item.waves_id:
+        if rank_temp.waves_id == self_waves_id:
             uid_color = RED
         role_bg_draw.text((350, 40), f"特征码: {hide_uid(rank_temp.waves_id, user_pref='on' if rank_temp.hide_uid else '')}", uid_color, waves_font_20, "lm")
 
@@ -256,15 +291,13 @@ async def draw_all_slash_rank_card(bot: Bot, ev: Event):
 
         for half_index, slash_half in enumerate(rank_temp.half_list):
             for role_index, char_detail in enumerate(slash_half.char_detail):
-                char_id = char_detail.char_id
+                char_id = slot_ids[rank_temp_index][half_index][role_index]
                 # char_level = char_detail.level
                 char_chain = char_detail.chain
 
-                char_id = randomize_special_char_id(char_id)
-                char_model = get_char_model(char_id)
-                if char_model is None:
+                if char_id is None:
                     continue
-                char_avatar = await get_square_avatar(char_id)
+                char_avatar = avatar_map.get(char_id) or square_placeholder()
                 char_avatar = char_avatar.resize((45, 45))
 
                 if char_chain != -1:
@@ -295,9 +328,10 @@ async def draw_all_slash_rank_card(bot: Bot, ev: Event):
                 [0, 45, 50, 50],
                 fill=buff_color,
             )
-            buff_pic = await pic_download_from_url(SLASH_PATH, slash_half.buff_icon)
-            buff_pic = buff_pic.resize((50, 50))
-            buff_bg.paste(buff_pic, (0, 0), buff_pic)
+            buff_pic = buff_map.get(slash_half.buff_icon)
+            if buff_pic is not None:
+                buff_pic = buff_pic.resize((50, 50))
+                buff_bg.paste(buff_pic, (0, 0), buff_pic)
 
             role_bg.alpha_composite(buff_bg, (720 + half_index * 250, 15))
 
@@ -312,9 +346,7 @@ async def draw_all_slash_rank_card(bot: Bot, ev: Event):
 
         card_img.paste(role_bg, (0, 510 + rank_temp_index * item_spacing), role_bg)
 
-    card_img = add_footer(card_img)
-    card_img = await convert_img(card_img)
-    return card_img
+    return add_footer(card_img)
 
 
 from .rank_avatar import get_avatar
@@ -348,7 +380,7 @@ async def get_all_slash_rank_info(
     wavesTokenUsersMap: Optional[Dict[Tuple[str, str], str]] = None,
 ) -> List[SlashRankListInfo]:
     """从本地获取所有用户的无尽排行信息"""
-    from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+    from ..utils.player_path import player_dir
 
     rankInfoList = []
 
@@ -363,7 +395,7 @@ async def get_all_slash_rank_info(
                     continue
             # 从本地读取该用户的无尽数据
             try:
-                slash_data_path = PLAYER_PATH / uid / "slashData.json"
+                slash_data_path = player_dir(uid) / "slashData.json"
                 slash_raw = await read_player_json(slash_data_path)
                 if slash_raw is None:
                     continue
@@ -398,7 +430,7 @@ async def get_all_slash_rank_info(
 
 async def get_role_chain_count(uid: str, role_id: int) -> int:
     """获取角色共鸣链数量, 漂泊者走 rover.json"""
-    from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+    from ..utils.player_path import player_dir
     from ..utils.resource.constant import SPECIAL_CHAR, SPECIAL_CHAR_RANK_MAP
     from ..utils.char_info_utils import get_rover_detail_map
 
@@ -407,7 +439,7 @@ async def get_role_chain_count(uid: str, role_id: int) -> int:
             temp = (await get_rover_detail_map(uid)).get(SPECIAL_CHAR_RANK_MAP[str(role_id)])
             return temp.get_chain_num() if temp else -1
 
-        raw_data = await read_player_json(PLAYER_PATH / str(uid) / "rawData.json")
+        raw_data = await read_player_json(player_dir(uid) / "rawData.json")
         if raw_data is None:
             return -1
         if isinstance(raw_data, list):
@@ -422,10 +454,10 @@ async def get_role_chain_count(uid: str, role_id: int) -> int:
 
 async def get_five_star_chain_total(uid: str) -> int:
     """计算五星角色的金数（0链=1金，6链=7金，即链数+1）"""
-    from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+    from ..utils.player_path import player_dir
 
     try:
-        raw_data_path = PLAYER_PATH / str(uid) / "rawData.json"
+        raw_data_path = player_dir(uid) / "rawData.json"
         raw_data = await read_player_json(raw_data_path)
         if raw_data is None:
             return 0
@@ -448,7 +480,6 @@ async def get_five_star_chain_total(uid: str) -> int:
         return 0
 
 
-# TODO: PIL 卸到线程池 (loop 内 await get_role_chain_count / get_square_avatar / pic_download_from_url 频繁, 需要批量预取重构)
 async def draw_slash_rank_list(bot: Bot, ev: Event):
     """绘制无尽排行"""
     start_time = time.time()
@@ -506,6 +537,65 @@ async def draw_slash_rank_list(bot: Bot, ev: Event):
 
     _mask_uid = await build_uid_masker([(ri.uid, ri.user_id) for ri in rankInfoList_display], ev.bot_id)
 
+    # 获取头像
+    tasks = [
+        get_avatar(rank.user_id, getattr(rank, "sender_avatar", ""))
+        for rank in rankInfoList_display
+    ]
+    results = await asyncio.gather(*tasks)
+
+    # 预取角色头像 / 共鸣链 / 信物图标, 合成阶段不再 await
+    half_lists = [_get_challenge_12_halves(ri.slash_data) for ri in rankInfoList_display]
+    chain_keys = list(
+        dict.fromkeys(
+            (ri.uid, role.roleId)
+            for ri, halves in zip(rankInfoList_display, half_lists)
+            for half in halves
+            for role in half.roleList
+        )
+    )
+    chain_counts = await asyncio.gather(*[get_role_chain_count(uid, rid) for uid, rid in chain_keys])
+    chain_map = dict(zip(chain_keys, chain_counts))
+    avatar_map = await prefetch_square_avatars(rid for _, rid in chain_keys)
+    buff_map = await prefetch_pics_from_url(
+        SLASH_PATH, (half.buffIcon for halves in half_lists for half in halves)
+    )
+
+    card_img = await _compose_slash_rank_list(
+        rankInfoList_display, results, half_lists, chain_map, avatar_map, buff_map, self_uid, _mask_uid
+    )
+    card_img = await convert_img(card_img)
+
+    logger.info(f"[鸣潮·冥海排行] 群排行 end: {time.time() - start_time}")
+    return card_img
+
+
+def _get_challenge_12_halves(slash_data: Optional[SlashDetail]) -> list:
+    if not slash_data or not slash_data.difficultyList:
+        return []
+    difficulty_12 = next((k for k in slash_data.difficultyList if k.difficulty == 2), None)
+    if not difficulty_12:
+        return []
+    challenge = next(
+        (c for c in difficulty_12.challengeList if c.challengeId == 12),
+        None,
+    )
+    if not challenge or not challenge.halfList:
+        return []
+    return challenge.halfList
+
+
+@to_thread
+def _compose_slash_rank_list(
+    rankInfoList_display: List[SlashRankListInfo],
+    results: List[Image.Image],
+    half_lists: List[list],
+    chain_map: Dict[Tuple[str, int], int],
+    avatar_map: Dict,
+    buff_map: Dict[str, Image.Image],
+    self_uid: Optional[str],
+    mask_uid,
+) -> Image.Image:
     # 设置图像尺寸
     width = 1000
     item_spacing = 120
@@ -550,19 +640,11 @@ async def draw_slash_rank_list(bot: Bot, ev: Event):
 
     card_img.paste(char_mask_temp, (0, 0), char_mask_temp)
 
-    # 获取头像
-    tasks = [
-        get_avatar(rank.user_id, getattr(rank, "sender_avatar", ""))
-        for rank in rankInfoList_display
-    ]
-    results = await asyncio.gather(*tasks)
-
     # 绘制排行条目
     bar = Image.open(TEXT_PATH / "bar2.png")
 
-    for rank_temp_index, temp in enumerate(zip(rankInfoList_display, results)):
-        rankInfo = temp[0]
-        role_avatar = temp[1]
+    for rank_temp_index, temp in enumerate(zip(rankInfoList_display, results, half_lists)):
+        rankInfo, role_avatar, half_list = temp
         role_bg = bar.copy()
         role_bg.paste(role_avatar, (100, 0), role_avatar)
         role_bg_draw = ImageDraw.Draw(role_bg)
@@ -572,21 +654,13 @@ async def draw_slash_rank_list(bot: Bot, ev: Event):
         draw_rank_badge(role_bg, rank_id)
 
         char_gold_total = 0
-        if rankInfo.slash_data and rankInfo.slash_data.difficultyList:
-            difficulty_12 = next((k for k in rankInfo.slash_data.difficultyList if k.difficulty == 2), None)
-            if difficulty_12:
-                challenge = next(
-                    (c for c in difficulty_12.challengeList if c.challengeId == 12),
-                    None,
-                )
-                if challenge and challenge.halfList:
-                    for slash_half in challenge.halfList:
-                        for slash_role in slash_half.roleList:
-                            if not is_limited_5star(slash_role.roleId):
-                                continue
-                            chain_count = await get_role_chain_count(rankInfo.uid, slash_role.roleId)
-                            if chain_count >= 0:
-                                char_gold_total += chain_count + 1
+        for slash_half in half_list:
+            for slash_role in slash_half.roleList:
+                if not is_limited_5star(slash_role.roleId):
+                    continue
+                chain_count = chain_map[(rankInfo.uid, slash_role.roleId)]
+                if chain_count >= 0:
+                    char_gold_total += chain_count + 1
 
         role_bg_draw.text((210, 40), f"角色限定{char_gold_total}金", "white", waves_font_18, "lm")
 
@@ -594,7 +668,7 @@ async def draw_slash_rank_list(bot: Bot, ev: Event):
         uid_color = "white"
         if rankInfo.uid == self_uid:
             uid_color = RED
-        role_bg_draw.text((210, 70), f"{_mask_uid(rankInfo.uid, rankInfo.user_id)}", uid_color, waves_font_20, "lm")
+        role_bg_draw.text((210, 70), f"{mask_uid(rankInfo.uid, rankInfo.user_id)}", uid_color, waves_font_20, "lm")
 
         # 总分数 (左移5px)
         role_bg_draw.text(
@@ -606,78 +680,65 @@ async def draw_slash_rank_list(bot: Bot, ev: Event):
         )
 
         # 绘制角色和信物信息
-        if rankInfo.slash_data and rankInfo.slash_data.difficultyList:
-            # 获取难度12的数据
-            difficulty_12 = next((k for k in rankInfo.slash_data.difficultyList if k.difficulty == 2), None)
-            if difficulty_12:
-                challenge = next(
-                    (c for c in difficulty_12.challengeList if c.challengeId == 12),
-                    None,
-                )
-                if challenge and challenge.halfList:
-                    for half_index, slash_half in enumerate(challenge.halfList):
-                        # 绘制角色信息
-                        for role_index, slash_role in enumerate(slash_half.roleList):
-                            try:
-                                char_avatar = await get_square_avatar(slash_role.roleId)
-                                char_avatar = char_avatar.resize((45, 45))
-
-                                # 获取角色共鸣链
-                                chain_count = await get_role_chain_count(rankInfo.uid, slash_role.roleId)
-                                if chain_count != -1:
-                                    info_block = Image.new("RGBA", (20, 20), color=(255, 255, 255, 0))
-                                    info_block_draw = ImageDraw.Draw(info_block)
-                                    info_block_draw.rectangle([0, 0, 20, 20], fill=CHAIN_COLOR[chain_count] + (int(0.9 * 255),))
-                                    info_block_draw.text(
-                                        (8, 8),
-                                        f"{chain_count}",
-                                        "white",
-                                        waves_font_12,
-                                        "mm",
-                                    )
-                                    char_avatar.paste(info_block, (30, 30), info_block)
-
-                                role_bg.alpha_composite(
-                                    char_avatar,
-                                    (350 + half_index * 235 + role_index * 50, 20),
-                                )
-                            except Exception as e:
-                                logger.debug(f"[鸣潮·冥海排行] 绘制角色 roleId={slash_role.roleId} 失败: {e}")
-
-                        # 绘制信物
-                        try:
-                            buff_bg = Image.new("RGBA", (50, 50), (255, 255, 255, 0))
-                            buff_bg_draw = ImageDraw.Draw(buff_bg)
-                            buff_bg_draw.rounded_rectangle(
-                                [0, 0, 50, 50],
-                                radius=5,
-                                fill=(0, 0, 0, int(0.8 * 255)),
-                            )
-                            buff_color = COLOR_QUALITY[slash_half.buffQuality]
-                            buff_bg_draw.rectangle(
-                                [0, 45, 50, 50],
-                                fill=buff_color,
-                            )
-                            buff_pic = await pic_download_from_url(SLASH_PATH, slash_half.buffIcon)
-                            buff_pic = buff_pic.resize((50, 50))
-                            buff_bg.paste(buff_pic, (0, 0), buff_pic)
-                            role_bg.alpha_composite(buff_bg, (500 + half_index * 235, 15))
-                        except Exception as e:
-                            logger.debug(f"[鸣潮·冥海排行] 绘制信物失败: {e}")
-
-                        # 显示半分数（在信物和角色下方）
-                        role_bg_draw.text(
-                            (450 + half_index * 230, 80),
-                            f"{slash_half.score}",
-                            get_local_score_color(slash_half.score),
-                            waves_font_20,
+        for half_index, slash_half in enumerate(half_list):
+            # 绘制角色信息
+            for role_index, slash_role in enumerate(slash_half.roleList):
+                try:
+                    char_avatar = avatar_map.get(slash_role.roleId) or square_placeholder()
+                    char_avatar = char_avatar.resize((45, 45))
+
+                    # 获取角色共鸣链
+                    chain_count = chain_map[(rankInfo.uid, slash_role.roleId)]
+                    if chain_count != -1:
+                        info_block = Image.new("RGBA", (20, 20), color=(255, 255, 255, 0))
+                        info_block_draw = ImageDraw.Draw(info_block)
+                        info_block_draw.rectangle([0, 0, 20, 20], fill=CHAIN_COLOR[chain_count] + (int(0.9 * 255),))
+                        info_block_draw.text(
+                            (8, 8),
+                            f"{chain_count}",
+                            "white",
+                            waves_font_12,
                             "mm",
                         )
+                        char_avatar.paste(info_block, (30, 30), info_block)
 
-        card_img.paste(role_bg, (0, 510 + rank_temp_index * item_spacing), role_bg)
+                    role_bg.alpha_composite(
+                        char_avatar,
+                        (350 + half_index * 235 + role_index * 50, 20),
+                    )
+                except Exception as e:
+                    logger.debug(f"[鸣潮·冥海排行] 绘制角色 roleId={slash_role.roleId} 失败: {e}")
 
-    card_img = add_footer(card_img)
-    card_img = await convert_img(card_img)
+            # 绘制信物
+            try:
+                buff_bg = Image.new("RGBA", (50, 50), (255, 255, 255, 0))
+                buff_bg_draw = ImageDraw.Draw(buff_bg)
+                buff_bg_draw.rounded_rectangle(
+                    [0, 0, 50, 50],
+                    radius=5,
+                    fill=(0, 0, 0, int(0.8 * 255)),
+                )
+                buff_color = COLOR_QUALITY[slash_half.buffQuality]
+                buff_bg_draw.rectangle(
+                    [0, 45, 50, 50],
+                    fill=buff_color,
+                )
+                buff_pic = buff_map[slash_half.buffIcon]
+                buff_pic = buff_pic.resize((50, 50))
+                buff_bg.paste(buff_pic, (0, 0), buff_pic)
+                role_bg.alpha_composite(buff_bg, (500 + half_index * 235, 15))
+            except Exception as e:
+                logger.debug(f"[鸣潮·冥海排行] 绘制信物失败: {e}")
 
-    logger.info(f"[鸣潮·冥海排行] 群排行 end: {time.time() - start_time}")
-    return card_img
+            # 显示半分数（在信物和角色下方）
+            role_bg_draw.text(
+                (450 + half_index * 230, 80),
+                f"{slash_half.score}",
+                get_local_score_color(slash_half.score),
+                waves_font_20,
+                "mm",
+            )
+
+        card_img.paste(role_bg, (0, 510 + rank_temp_index * item_spacing), role_bg)
+
+    return add_footer(card_img)
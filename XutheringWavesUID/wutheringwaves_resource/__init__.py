@@ -1,5 +1,6 @@
 import random
 import asyncio
+from typing import Tuple, Optional
 
 from gsuid_core.sv import SV
 from gsuid_core.bot import Bot
@@ -7,6 +8,7 @@ from gsuid_core.models import Event
 from gsuid_core.aps import scheduler
 from gsuid_core.logger import logger
 
+from .stages import StageTimer
 from ..wutheringwaves_config import WutheringWavesConfig
 from ..utils.download_utils import copy_build_files, check_file_hash
 from ..utils.resource.download_all_resource import (
@@ -42,12 +44,9 @@ sv_download_config = SV("ww资源下载", pm=1)
 async def send_download_resource_msg(bot: Bot, ev: Event):
     await bot.send("[鸣潮] 正在开始下载~可能需要较久的时间！请勿重复执行！")
     try:
-        await download_all_resource(force="强制" in ev.raw_text)
-
-        if check_file_hash(BUILD_TEMP) or check_file_hash(MAP_BUILD_TEMP):
-            await download_all_resource()
-
-        build_updated, map_updated = copy_build_files(soft=True)
+        build_updated, map_updated = await sync_remote_resource(
+            StageTimer("手动资源同步"), force="强制" in ev.raw_text
+        )
     except Exception as e:
         logger.exception(f"[鸣潮·资源] 手动下载失败: {e}")
         return await bot.send(f"[鸣潮] 资源下载/校验失败: {e}")
@@ -71,24 +70,57 @@ async def send_download_resource_msg(bot: Bot, ev: Event):
         await bot.send("[鸣潮] 下载完成！")
 
 
-async def startup():
-    await reload_all_modules()  # 已有资源，先加载，不然检查资源列表太久了
-    logger.info("[鸣潮·资源] 等待资源下载完成...")
-    await download_all_resource()
+def _verify_build_temp() -> bool:
+    return check_file_hash(BUILD_TEMP) or check_file_hash(MAP_BUILD_TEMP)
 
-    logger.info("[鸣潮·资源] 资源下载完成，开始校验...")
-    if check_file_hash(BUILD_TEMP) or check_file_hash(MAP_BUILD_TEMP):
-        await download_all_resource()
 
-    build_updated, map_updated = copy_build_files(soft=True)
+async def sync_remote_resource(timer: StageTimer, force: bool = False) -> Tuple[bool, bool]:
+    """下载 + 校验 + 构建文件落盘, 返回 (安全工具是否更新, 伤害计算是否更新)。
 
-    if build_updated or map_updated:
-        logger.info("[鸣潮·资源] 构建文件已更新，正在重启...")
-        await notify_master_and_restart()
-    else:
+    哈希校验和文件复制都放到线程中, 期间事件循环照常处理命令。
+    """
+    with timer.phase("下载资源"):
+        await download_all_resource(force=force)
+
+    with timer.phase("校验构建文件"):
+        if await asyncio.to_thread(_verify_build_temp):
+            await download_all_resource()
+
+    with timer.phase("复制构建文件"):
+        return await asyncio.to_thread(copy_build_files, True)
+
+
+_background_sync: Optional[asyncio.Task] = None
+
+
+async def _startup_sync(timer: StageTimer):
+    try:
+        build_updated, map_updated = await sync_remote_resource(timer)
+
+        if build_updated or map_updated:
+            logger.info("[鸣潮·资源] 构建文件已更新，正在重启...")
+            await notify_master_and_restart()
+            return
+
+        with timer.phase("切换新数据"):
+            await reload_all_modules()
+    except Exception as e:
+        logger.exception(f"[鸣潮·资源] 后台资源同步失败, 继续使用本地资源: {e}")
+        return
+    logger.info(f"[鸣潮·资源] 后台资源同步完成！{timer.summary()}")
+
+
+async def startup():
+    """先用本地已有资源完成加载即可开始服务, 远端同步与校验转入后台,
+    完成后整体替换为新数据。"""
+    global _background_sync
+
+    timer = StageTimer("启动")
+    with timer.phase("加载本地资源"):
         await reload_all_modules()
+    logger.info("[鸣潮·资源] 本地资源已加载，后台开始同步远端资源...")
 
-    logger.info("[鸣潮·资源] 资源下载完成！完成启动！")
+    _background_sync = asyncio.create_task(_startup_sync(timer))
 
 
 async def auto_download_resource():
@@ -96,18 +128,15 @@ async def auto_download_resource():
     if delay_seconds:
         await asyncio.sleep(delay_seconds)
     logger.info("[鸣潮·资源] 定时任务: 开始下载全部资源...")
-    await download_all_resource()
-
-    if check_file_hash(BUILD_TEMP) or check_file_hash(MAP_BUILD_TEMP):    
-        await download_all_resource()
-
-    build_updated, map_updated = copy_build_files(soft=True)
+    timer = StageTimer("定时资源同步")
+    build_updated, map_updated = await sync_remote_resource(timer)
     if build_updated or map_updated:
         logger.info("[鸣潮·资源] 定时任务: 构建文件已更新，正在重启...")
         await notify_master_and_restart("定时任务: 构建文件已更新，正在重启...")
     else:
-        await reload_all_modules()
-    logger.info("[鸣潮·资源] 定时任务: 资源下载完成")
+        with timer.phase("切换新数据"):
+            await reload_all_modules()
+    logger.info(f"[鸣潮·资源] 定时任务: 资源下载完成 {timer.summary()}")
 
 if 0 <= RESOURCE_DOWNLOAD_HOUR < 24 and 0 <= RESOURCE_DOWNLOAD_MINUTE < 60:
     scheduler.add_job(
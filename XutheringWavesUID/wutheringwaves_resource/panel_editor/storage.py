@@ -15,6 +15,7 @@ from PIL import Image
 from gsuid_core.logger import logger
 
 from ...utils import name_convert
+from ...utils.cache_janitor import cache_janitor
 from ...utils.name_convert import easy_id_to_name
 from ...utils.resource.RESOURCE_PATH import (
     BAKE_PATH,
@@ -245,6 +246,7 @@ def get_or_make_thumb(target: Path, max_size: int = 360, t: Optional[str] = None
     cache = thumb_path_for(target, max_size, t)
     try:
         if cache.exists() and cache.stat().st_mtime >= target.stat().st_mtime:
+            cache_janitor.touch(cache)
             return cache
     except OSError:
         pass
@@ -258,6 +260,7 @@ def get_or_make_thumb(target: Path, max_size: int = 360, t: Optional[str] = None
             im.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
             cache.parent.mkdir(parents=True, exist_ok=True)
             im.save(cache, "WEBP", quality=82, method=4)
+        cache_janitor.record(cache)
         return cache
     except Exception as e:
         logger.warning(f"[鸣潮·面板编辑] 生成缩略图失败 {target}: {e}")
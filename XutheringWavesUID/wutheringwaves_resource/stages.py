@@ -0,0 +1,29 @@
+"""启动/资源同步的分阶段计时"""
+
+import time
+from typing import Dict
+from contextlib import contextmanager
+
+from gsuid_core.logger import logger
+
+
+class StageTimer:
+    def __init__(self, name: str):
+        self.name = name
+        self.timings: Dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, phase_name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cost = time.perf_counter() - start
+            self.timings[phase_name] = cost
+            logger.info(f"[鸣潮·{self.name}] {phase_name} 耗时 {cost:.2f}s")
+
+    def summary(self) -> str:
+        parts = [f"{k} {v:.2f}s" for k, v in self.timings.items()]
+        total = time.perf_counter() - self._start
+        return f"总计 {total:.2f}s ({', '.join(parts)})"
@@ -25,6 +25,7 @@ from ..utils.render_utils import (
     get_footer_b64,
     get_image_b64_with_cache,
 )
+from ..utils.cache_janitor import cache_janitor
 from ..utils.resource.RESOURCE_PATH import BAKE_PATH, waves_templates
 from ..utils.image import (
     pil_to_b64,
@@ -55,6 +56,7 @@ def _normalize_b64(img: Image.Image, cache_key: str) -> str:
     bake_path = BAKE_PATH / f"skinnorm_{cache_key}_h{NORM_H}.webp"
     if bake_path.exists():
         data = bake_path.read_bytes()
+        cache_janitor.touch(bake_path)
     else:
         ic = img.convert("RGBA")
         bb = ic.getchannel("A").getbbox()
@@ -68,6 +70,7 @@ def _normalize_b64(img: Image.Image, cache_key: str) -> str:
         data = buf.getvalue()
         try:
             bake_path.write_bytes(data)
+            cache_janitor.record(bake_path, len(data))
         except Exception:
             pass
     return f"data:image/webp;base64,{base64.b64encode(data).decode()}"
@@ -0,0 +1,101 @@
+"""每日信息查询服务
+
+同一 (user_id, bot_id, uid) 的并发查询合并为一次请求, 成功结果短时缓存,
+所有查询共用一个全局并发上限; 体力记录先收集, 每批一次事务写入。
+"""
+
+import time
+import asyncio
+from typing import Any, Dict, List, Tuple, Callable, Optional, Awaitable
+
+from gsuid_core.logger import logger
+
+from ..utils.database.models import WavesStaminaRecord
+from ..wutheringwaves_config import WutheringWavesConfig
+
+DailyKey = Tuple[str, str, str]
+
+# 缓存条目超过该数量时顺带清理过期项
+_PRUNE_THRESHOLD = 1024
+
+
+def get_daily_cache_seconds() -> int:
+    return WutheringWavesConfig.get_config("DailyInfoCacheSeconds").data or 0
+
+
+def get_daily_concurrency() -> int:
+    return WutheringWavesConfig.get_config("DailyInfoConcurrency").data or 1
+
+
+class DailyInfoService:
+    def __init__(self):
+        self._inflight: Dict[DailyKey, asyncio.Future] = {}
+        self._cache: Dict[DailyKey, Tuple[float, Dict]] = {}
+        self._limit = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        limit = get_daily_concurrency()
+        if self._semaphore is None or limit != self._limit:
+            self._semaphore = asyncio.Semaphore(limit)
+            self._limit = limit
+        return self._semaphore
+
+    def _put_cache(self, key: DailyKey, result: Dict, ttl: int):
+        now = time.monotonic()
+        if len(self._cache) >= _PRUNE_THRESHOLD:
+            for k, (ts, _) in list(self._cache.items()):
+                if now - ts >= ttl:
+                    del self._cache[k]
+        self._cache[key] = (now, result)
+
+    async def fetch(self, key: DailyKey, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """命中缓存直接返回; 同 key 已在请求中则等待其结果; 否则限流后调用 loader。
+
+        只有 dict (查询成功) 会进入缓存, 错误消息和 None 每次都重新查询。
+        """
+        ttl = get_daily_cache_seconds()
+        hit = self._cache.get(key)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            async with self._get_semaphore():
+                result = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 无人等待时不再报 "exception was never retrieved"
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(result)
+        if isinstance(result, dict) and ttl > 0:
+            self._put_cache(key, result, ttl)
+        return result
+
+
+daily_info_service = DailyInfoService()
+
+
+async def save_stamina_records(records: List[Dict[str, Any]]):
+    """同一 (user_id, bot_id, uid) 只保留最后一条, 整批一次事务写入"""
+    if not records:
+        return
+    merged: Dict[DailyKey, Dict[str, Any]] = {}
+    for record in records:
+        key = (record["user_id"], record["bot_id"], record["uid"])
+        merged.setdefault(key, {}).update(record)
+    try:
+        await WavesStaminaRecord.bulk_upsert_records(list(merged.values()))
+    except Exception:
+        logger.exception("[鸣潮·每日信息] 体力记录批量写入失败")
@@ -1,7 +1,7 @@
 import time
 import random
 import asyncio
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -40,7 +40,6 @@ from ..utils.name_convert import char_name_to_char_id
 from ..utils.database.models import (
     WavesBind,
     WavesUser,
-    WavesStaminaRecord,
     WavesLangSettings,
 )
 from ..utils.localization import t
@@ -59,6 +58,7 @@ from ..utils.resource.constant import SPECIAL_CHAR
 from ..wutheringwaves_charinfo import card_hash_index
 from ..wutheringwaves_charinfo.card_hash_index import compute_hash as _compute_pile_hash, detect_type as _detect_pile_type
 from ..wutheringwaves_config.wutheringwaves_config import ShowConfig, WutheringWavesConfig
+from .daily_service import daily_info_service, save_stamina_records
 import io
 import base64
 from ..utils.render_utils import render_html, PLAYWRIGHT_AVAILABLE
@@ -83,25 +83,30 @@ async def seconds2hours(seconds: int) -> str:
     return "%02d小时%02d分" % (h, m)
 
 
-async def process_uid(uid, ev):
+async def process_uid(uid, ev, records: List[Dict]):
+    """经 daily_info_service 合并同 uid 并发查询并短时缓存; 体力记录写入追加到 records"""
+    key = (ruser_id(ev), ev.bot_id, uid)
+    return await daily_info_service.fetch(key, lambda: _load_daily_info(uid, ev, records))
+
+
+async def _load_daily_info(uid, ev, records: List[Dict]):
     if waves_api.is_net(uid):
-        return await _process_uid_launcher(uid, ev)
+        return await _process_uid_launcher(uid, ev, records)
 
     ck, err = await waves_api.check_self_login(uid, ruser_id(ev), ev.bot_id)
     if not ck:
         # 仅未绑定 cookie (err=None) 时同步 stamina 推送状态;
         # 维护/网络异常不能断言 ck 失效; cookie 真失效已由 check_self_login 内部 mark
         if err is None:
-            try:
-                await WavesStaminaRecord.update_ck_valid(
-                    user_id=ruser_id(ev),
-                    bot_id=ev.bot_id,
-                    bot_self_id=ev.bot_self_id or "",
-                    uid=uid,
-                    is_ck_valid=False,
-                )
-            except Exception:
-                logger.exception("[鸣潮·每日信息] 体力记录CK有效状态更新失败")
+            records.append(
+                {
+                    "user_id": ruser_id(ev),
+                    "bot_id": ev.bot_id,
+                    "bot_self_id": ev.bot_self_id or "",
+                    "uid": uid,
+                    "is_ck_valid": False,
+                }
+            )
         return err  # 失效/维护/网络 → 透传; 未绑定 → None 由上层报 102
 
     # 并行请求所有相关 API
@@ -127,19 +132,17 @@ async def process_uid(uid, ev):
     daily_info = DailyData.model_validate(daily_info_res.data)
     account_info = AccountBaseInfo.model_validate(account_info_res.data)
 
-    try:
-        mr_value = daily_info.energyData.cur if daily_info.energyData else None
-        await WavesStaminaRecord.upsert_stamina_query(
-            user_id=ruser_id(ev),
-            bot_id=ev.bot_id,
-            bot_self_id=ev.bot_self_id or "",
-            uid=uid,
-            mr_query_time=int(time.time()),
-            mr_value=mr_value,
-            is_ck_valid=True,
-        )
-    except Exception:
-        logger.exception("[鸣潮·每日信息] 体力查询记录写入失败")
+    records.append(
+        {
+            "user_id": ruser_id(ev),
+            "bot_id": ev.bot_id,
+            "bot_self_id": ev.bot_self_id or "",
+            "uid": uid,
+            "mr_query_time": int(time.time()),
+            "mr_value": daily_info.energyData.cur if daily_info.energyData else None,
+            "is_ck_valid": True,
+        }
+    )
 
     return {
         "daily_info": daily_info,
@@ -147,7 +150,7 @@ async def process_uid(uid, ev):
     }
 
 
-async def _process_uid_launcher(uid, ev):
+async def _process_uid_launcher(uid, ev, records: List[Dict]):
     user_id = ruser_id(ev)
     bot_id = ev.bot_id
 
@@ -156,16 +159,15 @@ async def _process_uid_launcher(uid, ev):
         logger.info(
             f"[鸣潮·每日信息] 国际服账号失效，无法拉取面板 uid={uid} user_id={user_id} bot_id={bot_id}"
         )
-        try:
-            await WavesStaminaRecord.update_ck_valid(
-                user_id=user_id,
-                bot_id=bot_id,
-                bot_self_id=ev.bot_self_id or "",
-                uid=uid,
-                is_ck_valid=False,
-            )
-        except Exception:
-            logger.exception("[鸣潮·每日信息] launcher CK 状态更新失败")
+        records.append(
+            {
+                "user_id": user_id,
+                "bot_id": bot_id,
+                "bot_self_id": ev.bot_self_id or "",
+                "uid": uid,
+                "is_ck_valid": False,
+            }
+        )
         return None
 
     base = panel.base
@@ -182,18 +184,17 @@ async def _process_uid_launcher(uid, ev):
         battlePassData=[panel.battlePass],
     )
 
-    try:
-        await WavesStaminaRecord.upsert_stamina_query(
-            user_id=user_id,
-            bot_id=bot_id,
-            bot_self_id=ev.bot_self_id or "",
-            uid=uid,
-            mr_query_time=int(time.time()),
-            mr_value=panel.energy.cur if panel.energy else None,
-            is_ck_valid=True,
-        )
-    except Exception:
-        logger.exception("[鸣潮·每日信息] launcher 体力记录写入失败")
+    records.append(
+        {
+            "user_id": user_id,
+            "bot_id": bot_id,
+            "bot_self_id": ev.bot_self_id or "",
+            "uid": uid,
+            "mr_query_time": int(time.time()),
+            "mr_value": panel.energy.cur if panel.energy else None,
+            "is_ck_valid": True,
+        }
+    )
 
     return {
         "daily_info": daily_info,
@@ -213,8 +214,10 @@ async def draw_stamina_img(bot: Bot, ev: Event):
         locale = await WavesLangSettings.get_lang(ruser_id(ev))
 
         # 进行校验UID是否绑定CK
-        tasks = [process_uid(uid, ev) for uid in uid_list]
+        records: List[Dict] = []
+        tasks = [process_uid(uid, ev, records) for uid in uid_list]
         results = await asyncio.gather(*tasks)
+        await save_stamina_records(records)
 
         # dict = 数据成功; str = 错误透传消息; None = 未绑定
         valid_daily_list = [res for res in results if isinstance(res, dict)]
@@ -14,4 +14,4 @@ async def all_start():
         logger.error("[鸣潮·启动] 启动失败 ❌ 部分功能可能不可用，请查看日志排查")
         return
 
-    logger.success("[鸣潮·启动] 启动完成 ✅")
+    logger.success("[鸣潮·启动] 启动完成 ✅ 远端资源在后台同步")
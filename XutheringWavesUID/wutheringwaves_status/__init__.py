@@ -1,25 +1,42 @@
+import time
+from typing import Dict, Tuple, Callable, Awaitable
+
 from gsuid_core.status.plugin_status import register_status
 
 from ..utils.image import get_ICON
 from ..utils.database.models import WavesBind, WavesUser
 from ..wutheringwaves_config import WutheringWavesConfig
 
+# 状态面板会被频繁刷新, 统计结果短暂缓存即可
+STATUS_CACHE_TTL = 60
+_status_cache: Dict[str, Tuple[float, int]] = {}
+
+
+async def _cached_count(key: str, factory: Callable[[], Awaitable[int]]) -> int:
+    now = time.monotonic()
+    hit = _status_cache.get(key)
+    if hit and now - hit[0] < STATUS_CACHE_TTL:
+        return hit[1]
+    count = await factory()
+    _status_cache[key] = (now, count)
+    return count
+
 
 async def get_user_num():
-    datas = await WavesUser.get_waves_all_user()
-    return len(datas)
+    return await _cached_count("user", WavesUser.get_waves_all_user_count)
 
 
 async def get_add_num():
-    datas = await WavesBind.get_all_data()
     # 仅统计鸣潮绑定行 (uid 非空); 战双 pgr 绑定不计入。
-    return sum(1 for d in datas if getattr(d, "uid", None))
+    return await _cached_count("bind", WavesBind.get_uid_bind_count)
 
 
 async def get_active_user_num():
     active_days = WutheringWavesConfig.get_config("ActiveUserDays").data
-    count = await WavesUser.get_active_user_count(active_days)
-    return count
+    return await _cached_count(
+        f"active:{active_days}",
+        lambda: WavesUser.get_active_user_count(active_days),
+    )
 
 
 register_status(
@@ -13,9 +13,9 @@ from ..utils.resource.RESOURCE_PATH import (
 )
 from ..utils.resource.constant import WEAPON_TYPE_ID_MAP
 from ..utils.name_convert import alias_to_weapon_name, alias_to_echo_name, echo_name_to_echo_id
-from ..utils.ascension.weapon import get_weapon_id, get_weapon_model, weapon_id_data, ensure_data_loaded as ensure_weapon_loaded
+from ..utils.ascension.weapon import get_weapon_id, get_weapon_model
 from ..utils.ascension.echo import get_echo_model
-from ..utils.ascension.sonata import sonata_id_data, ensure_data_loaded as ensure_sonata_loaded
+from ..utils.ascension.snapshot import current_snapshot
 from ..utils.ascension.model import WeaponModel, EchoModel
 from ..utils.render_utils import (
     PLAYWRIGHT_AVAILABLE,
@@ -165,7 +165,7 @@ async def draw_weapon_list_render(weapon_type: str = "") -> Optional[bytes]:
     if not PLAYWRIGHT_AVAILABLE or render_html is None or not use_html_render:
         return None
 
-    ensure_weapon_loaded()
+    weapon_id_data = current_snapshot().weapon
     if not weapon_id_data:
         return None
 
@@ -243,7 +243,7 @@ async def draw_sonata_list_render(version: str = "") -> Optional[bytes]:
     if not PLAYWRIGHT_AVAILABLE or render_html is None or not use_html_render:
         return None
 
-    ensure_sonata_loaded()
+    sonata_id_data = current_snapshot().sonata
     if not sonata_id_data:
         return None
 
@@ -0,0 +1,120 @@
+"""测试公共工具。
+
+插件包的 __init__ 会启动整个插件 (注册命令 / 同步资源 / 连数据库), 测试只按需加载单个模块:
+load_module 先为各级父包登记不执行 __init__ 的空包, 再按真实包名 import 目标模块,
+模块内的相对导入照常解析。未安装 gsuid_core 时提供最小替身 (logger / get_res_path),
+资源目录指向临时目录; 数据库模型测试另用 install_database_stub 提供 base_models 替身。
+"""
+
+import sys
+import types
+import logging
+import tempfile
+import importlib
+from pathlib import Path
+from typing import Optional, Union
+
+ROOT = Path(__file__).resolve().parent.parent
+PLUGIN = "XutheringWavesUID"
+PLUGIN_PATH = ROOT / PLUGIN
+RES_DIR = Path(tempfile.mkdtemp(prefix="ww_test_res_"))
+
+
+def _get_res_path(_path: Optional[Union[str, list]] = None) -> Path:
+    if _path is None:
+        path = RES_DIR
+    elif isinstance(_path, list):
+        path = RES_DIR.joinpath(*_path)
+    else:
+        path = RES_DIR / _path
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def install_gsuid_core_stub() -> None:
+    try:
+        import gsuid_core  # noqa: F401
+
+        return
+    except ImportError:
+        pass
+    core = types.ModuleType("gsuid_core")
+    core.__path__ = []
+    log_mod = types.ModuleType("gsuid_core.logger")
+    log_mod.logger = logging.getLogger("gsuid_core")  # type: ignore[attr-defined]
+    store_mod = types.ModuleType("gsuid_core.data_store")
+    store_mod.get_res_path = _get_res_path  # type: ignore[attr-defined]
+    sys.modules.update({
+        "gsuid_core": core,
+        "gsuid_core.logger": log_mod,
+        "gsuid_core.data_store": store_mod,
+    })
+
+
+class _SessionHolder:
+    """with_session 替身使用的 session 工厂, 由测试设置为指向内存数据库的 async_sessionmaker"""
+
+    factory = None
+
+
+DB_SESSION = _SessionHolder()
+
+
+def install_database_stub() -> bool:
+    """gsuid_core.utils.database.base_models 的最小替身 (BaseIDModel / BaseBotIDModel / with_session)。
+
+    已安装真实 gsuid_core 时不替换, 返回 False。
+    """
+    if getattr(sys.modules.get("gsuid_core"), "__file__", None):
+        return False
+    if "gsuid_core.utils.database.base_models" in sys.modules:
+        return True
+    from functools import wraps
+
+    from sqlmodel import Field, SQLModel
+
+    class BaseIDModel(SQLModel):
+        id: Optional[int] = Field(default=None, primary_key=True, title="序号")
+
+    class BaseBotIDModel(BaseIDModel):
+        bot_id: str = Field(title="平台")
+
+    def with_session(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            async with DB_SESSION.factory() as session:
+                try:
+                    result = await func(self, session, *args, **kwargs)
+                    await session.commit()
+                    return result
+                except Exception:
+                    await session.rollback()
+                    raise
+
+        return wrapper
+
+    utils_mod = sys.modules.setdefault("gsuid_core.utils", types.ModuleType("gsuid_core.utils"))
+    utils_mod.__path__ = []  # type: ignore[attr-defined]
+    db_mod = types.ModuleType("gsuid_core.utils.database")
+    db_mod.__path__ = []  # type: ignore[attr-defined]
+    base_mod = types.ModuleType("gsuid_core.utils.database.base_models")
+    base_mod.BaseIDModel = BaseIDModel  # type: ignore[attr-defined]
+    base_mod.BaseBotIDModel = BaseBotIDModel  # type: ignore[attr-defined]
+    base_mod.with_session = with_session  # type: ignore[attr-defined]
+    sys.modules.update({
+        "gsuid_core.utils.database": db_mod,
+        "gsuid_core.utils.database.base_models": base_mod,
+    })
+    return True
+
+
+def load_module(name: str):
+    """按 "utils.fuzzy_match" 这样的插件内路径加载模块, 不执行各级父包的 __init__"""
+    parts = [PLUGIN, *name.split(".")]
+    for i in range(1, len(parts)):
+        pkg = ".".join(parts[:i])
+        if pkg not in sys.modules:
+            module = types.ModuleType(pkg)
+            module.__path__ = [str(ROOT.joinpath(*parts[:i]))]
+            sys.modules[pkg] = module
+    return importlib.import_module(".".join(parts))
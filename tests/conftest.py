@@ -0,0 +1,3 @@
+from _support import install_gsuid_core_stub
+
+install_gsuid_core_stub()
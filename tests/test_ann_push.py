@@ -0,0 +1,112 @@
+"""公告推送: 重叠的推送任务只渲染一次, 进度在线程中落盘。"""
+
+import sys
+import types
+import asyncio
+import threading
+
+import pytest
+
+from _support import PLUGIN, PLUGIN_PATH, load_module
+
+CONFIG_VALUES = {"AnnPushBotRatePerMin": 6000, "AnnPushBotConcurrency": 4}
+
+
+def _install_fakes():
+    # 配置包的 __init__ 会加载全部配置项, 这里只给出推送用到的两项; ann_config 用真实模块
+    name = f"{PLUGIN}.wutheringwaves_config"
+    config_pkg = sys.modules.get(name)
+    if config_pkg is None:
+        config_pkg = sys.modules[name] = types.ModuleType(name)
+        config_pkg.__path__ = [str(PLUGIN_PATH / "wutheringwaves_config")]
+    if not hasattr(config_pkg, "WutheringWavesConfig"):
+        config_pkg.WutheringWavesConfig = types.SimpleNamespace(
+            get_config=lambda key: types.SimpleNamespace(data=CONFIG_VALUES[key])
+        )
+
+    renders = []
+
+    async def ann_detail_card(ann_id, is_check_time=False):
+        renders.append((ann_id, threading.get_ident()))
+        await asyncio.sleep(0.05)
+        return b"img"
+
+    card = types.ModuleType(f"{PLUGIN}.wutheringwaves_ann.ann_card")
+    card.ann_detail_card = ann_detail_card
+    sys.modules.setdefault(card.__name__, card)
+    return renders
+
+
+RENDERS = _install_fakes()
+ann_push = load_module("wutheringwaves_ann.ann_push")
+ann_config = load_module("wutheringwaves_config.ann_config")
+
+
+class _Subscribe:
+    def __init__(self, i):
+        self.bot_id, self.bot_self_id = "qq", f"bot{i % 2}"
+        self.group_id, self.user_id = f"g{i}", None
+        self.sent = 0
+
+    async def send(self, img):
+        self.sent += 1
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    RENDERS.clear()
+    ann_config.ANN_DATA_PATH.unlink(missing_ok=True)
+    ann_push._push_state = None
+
+
+def test_overlapping_runs_render_once():
+    subs = [_Subscribe(i) for i in range(30)]
+
+    async def run():
+        state = ann_push._get_push_state()
+        scheduler = ann_push.AnnPushScheduler()
+        return await asyncio.gather(
+            scheduler.push_one(1, subs, state),
+            scheduler.push_one(1, subs, state),
+        )
+
+    results = asyncio.run(run())
+    assert len(RENDERS) == 1
+    assert sorted(results, key=str) == [None, True]
+    assert all(s.sent == 1 for s in subs)
+    assert ann_config.get_ann_push_state() == {}
+
+
+def test_progress_is_flushed_off_the_loop(monkeypatch):
+    writers = []
+    original = ann_push.set_ann_push_state
+
+    def record(state):
+        writers.append(threading.get_ident())
+        return original(state)
+
+    monkeypatch.setattr(ann_push, "set_ann_push_state", record)
+    monkeypatch.setattr(ann_push, "STATE_FLUSH_COUNT", 5)
+    subs = [_Subscribe(i) for i in range(30)]
+
+    async def run():
+        loop_thread = threading.get_ident()
+        await ann_push.AnnPushScheduler().push_one(2, subs, ann_push._get_push_state())
+        return loop_thread
+
+    loop_thread = asyncio.run(run())
+    assert writers and loop_thread not in writers
+    assert ann_config.get_ann_push_state() == {}
+
+
+def test_new_ids_survive_concurrent_progress_writes():
+    ann_config.set_ann_new_ids([1, 2, 3])
+    threads = [
+        threading.Thread(target=ann_config.set_ann_push_state, args=({str(i): ["k"]},)) for i in range(20)
+    ]
+    for t in threads:
+        t.start()
+    ann_config.set_ann_new_ids([4])
+    for t in threads:
+        t.join()
+    assert ann_config.get_ann_new_ids() == [4]
@@ -0,0 +1,56 @@
+"""升级数据快照: 发布线程与多个读线程并发时, 读者不应看到新旧混合的表。"""
+
+import threading
+
+from _support import load_module
+
+snapshot = load_module("utils.ascension.snapshot")
+
+TABLES = ("char", "weapon", "echo", "sonata", "sonata_name_to_id")
+
+
+def _tables(gen: int):
+    return {name: {"gen": gen, "name": name} for name in TABLES}
+
+
+def test_readers_never_see_mixed_versions():
+    snapshot.publish_snapshot(_tables(0))
+    stop = threading.Event()
+    errors = []
+
+    def reader():
+        last_version = 0
+        while not stop.is_set():
+            snap = snapshot.current_snapshot()
+            gens = {getattr(snap, name)["gen"] for name in TABLES}
+            if len(gens) != 1:
+                errors.append(f"mixed generations {gens} in version {snap.version}")
+            if snap.version < last_version:
+                errors.append(f"version went back {last_version} -> {snap.version}")
+            last_version = snap.version
+
+    def publisher():
+        for gen in range(1, 3001):
+            snapshot.publish_snapshot(_tables(gen))
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    publishers = [threading.Thread(target=publisher) for _ in range(2)]
+    for t in readers + publishers:
+        t.start()
+    for t in publishers:
+        t.join()
+    stop.set()
+    for t in readers:
+        t.join()
+
+    assert not errors, errors[:5]
+
+
+def test_missing_table_keeps_previous_version():
+    first = snapshot.publish_snapshot(_tables(1))
+    tables = _tables(2)
+    tables["echo"] = None
+    second = snapshot.publish_snapshot(tables)
+    assert second.version == first.version + 1
+    assert second.echo is first.echo
+    assert second.char["gen"] == 2
@@ -0,0 +1,181 @@
+"""热点数据库查询必须走索引 (纯 sqlite3, 不依赖 gsuid_core / sqlalchemy)。
+
+索引与迁移建表语句直接从 models.py 的 exec_list 解析 (ast, 不 import 模块),
+基础表只建出热点查询涉及的列, 查询按各模型方法发出的 SQL 书写 (WHERE 条件一致)。
+EXPLAIN QUERY PLAN 断言不出现整表 SCAN; 另在 20 万行数据上对比有无索引的耗时。
+查询被改写或索引被删掉后若退化为全表扫描, 这里会失败。
+"""
+
+import ast
+import time
+import random
+import sqlite3
+from typing import List, Tuple
+
+import pytest
+
+from _support import PLUGIN_PATH
+
+MODELS_PY = PLUGIN_PATH / "utils" / "database" / "models.py"
+
+BASE_TABLES = [
+    "CREATE TABLE WavesBind (id INTEGER NOT NULL PRIMARY KEY, bot_id VARCHAR NOT NULL, user_id VARCHAR NOT NULL,"
+    " group_id VARCHAR, uid VARCHAR, pgr_uid VARCHAR)",
+    "CREATE TABLE WavesUser (id INTEGER NOT NULL PRIMARY KEY, bot_id VARCHAR NOT NULL, user_id VARCHAR NOT NULL,"
+    " status VARCHAR, cookie VARCHAR NOT NULL, uid VARCHAR, game_id INTEGER DEFAULT 3 NOT NULL,"
+    " created_time INTEGER, last_used_time INTEGER)",
+    "CREATE TABLE WavesStaminaRecord (id INTEGER NOT NULL PRIMARY KEY, bot_id VARCHAR NOT NULL,"
+    " user_id VARCHAR NOT NULL, uid VARCHAR NOT NULL, bot_self_id VARCHAR NOT NULL, mr_query_time INTEGER,"
+    " mr_value INTEGER, is_ck_valid BOOLEAN)",
+    "CREATE TABLE WavesUserActivity (id INTEGER NOT NULL PRIMARY KEY, user_id VARCHAR NOT NULL,"
+    " bot_id VARCHAR NOT NULL, bot_self_id VARCHAR NOT NULL DEFAULT '', last_active_time INTEGER)",
+]
+
+# (模型方法, SQL, 参数): 每条命令几乎都会走到的查询
+HOT_QUERIES: List[Tuple[str, str, tuple]] = [
+    (
+        "WavesStaminaRecord.upsert_stamina_query",
+        "SELECT * FROM WavesStaminaRecord WHERE user_id = ? AND bot_id = ? AND uid = ?",
+        ("u1", "b", "1001"),
+    ),
+    (
+        "WavesStaminaRecord.update_ck_valid",
+        "UPDATE WavesStaminaRecord SET bot_self_id = ?, is_ck_valid = ? WHERE id = ?",
+        ("s", 1, 1),
+    ),
+    (
+        "WavesStaminaRecord.delete_by_uid",
+        "DELETE FROM WavesStaminaRecord WHERE user_id = ? AND bot_id = ? AND uid = ?",
+        ("u1", "b", "1001"),
+    ),
+    (
+        "WavesStaminaRecord.delete_by_user",
+        "DELETE FROM WavesStaminaRecord WHERE user_id = ? AND bot_id = ?",
+        ("u1", "b"),
+    ),
+    (
+        "WavesUser.select_cookie",
+        "SELECT * FROM WavesUser WHERE user_id = ? AND uid = ? AND bot_id = ?",
+        ("u1", "1001", "b"),
+    ),
+    (
+        "WavesUser.select_waves_user",
+        "SELECT * FROM WavesUser WHERE user_id = ? AND uid = ? AND bot_id = ? AND game_id = ?",
+        ("u1", "1001", "b", 3),
+    ),
+    (
+        "WavesUser.select_data_by_cookie",
+        "SELECT * FROM WavesUser WHERE cookie = ?",
+        ("ck1",),
+    ),
+    (
+        "WavesUser.select_data_by_cookie_and_uid",
+        "SELECT * FROM WavesUser WHERE cookie = ? AND uid = ? AND game_id = ?",
+        ("ck1", "1001", 3),
+    ),
+    (
+        "WavesUser.mark_cookie_invalid",
+        "UPDATE WavesUser SET status = ? WHERE uid = ? AND cookie = ?",
+        ("无效", "1001", "ck1"),
+    ),
+    (
+        "WavesBind.get_uid_list_by_game",
+        "SELECT * FROM WavesBind WHERE user_id = ? AND bot_id = ?",
+        ("u1", "b"),
+    ),
+]
+
+SELECT_QUERIES = [q for q in HOT_QUERIES if q[1].startswith("SELECT")]
+
+
+def _migration_ddl() -> List[str]:
+    """models.py 中 exec_list.extend([...]) 里的 CREATE TABLE / CREATE INDEX 语句"""
+    tree = ast.parse(MODELS_PY.read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "extend"
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "exec_list"
+        ):
+            stmts = ast.literal_eval(node.args[0])
+            return [s for s in stmts if s.startswith("CREATE")]
+    raise AssertionError("models.py 中没有找到 exec_list.extend")
+
+
+def _connect(with_indexes: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    for stmt in BASE_TABLES:
+        conn.execute(stmt)
+    for stmt in _migration_ddl():
+        if with_indexes or " INDEX " not in stmt:
+            conn.execute(stmt)
+    return conn
+
+
+def _plan(conn: sqlite3.Connection, sql: str, params: tuple) -> List[str]:
+    return [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def test_migration_ddl_is_found():
+    names = " ".join(_migration_ddl())
+    for index in ("ix_WavesUser_user_bot_uid", "ix_WavesUser_cookie_uid", "ix_WavesStaminaRecord_user_bot_uid"):
+        assert index in names
+
+
+@pytest.mark.parametrize("item", HOT_QUERIES, ids=[q[0] for q in HOT_QUERIES])
+def test_hot_query_uses_index(item):
+    _, sql, params = item
+    details = _plan(_connect(), sql, params)
+    assert details, sql
+    assert not any(d.startswith("SCAN") for d in details), f"全表扫描: {sql}\n{details}"
+    assert any("INDEX" in d or "PRIMARY KEY" in d for d in details), f"未使用索引: {sql}\n{details}"
+
+
+@pytest.mark.parametrize("item", SELECT_QUERIES[:2], ids=[q[0] for q in SELECT_QUERIES[:2]])
+def test_without_migration_indexes_plans_scan(item):
+    # 对照: 去掉迁移索引后同一查询应退化为 SCAN, 保证上面的断言确实有效
+    _, sql, params = item
+    assert any(d.startswith("SCAN") for d in _plan(_connect(with_indexes=False), sql, params))
+
+
+def _fill(conn: sqlite3.Connection, rows: int) -> None:
+    rng = random.Random(0)
+    users = [(f"u{i}", "b", f"{100000 + i}", f"ck{i}") for i in range(rows)]
+    rng.shuffle(users)
+    conn.executemany(
+        "INSERT INTO WavesUser (bot_id, user_id, cookie, uid, game_id) VALUES (?, ?, ?, ?, 3)",
+        [(b, u, ck, uid) for u, b, uid, ck in users],
+    )
+    conn.executemany(
+        "INSERT INTO WavesBind (bot_id, user_id, uid) VALUES (?, ?, ?)",
+        [(b, u, uid) for u, b, uid, _ in users],
+    )
+    conn.executemany(
+        "INSERT INTO WavesStaminaRecord (bot_id, user_id, uid, bot_self_id) VALUES (?, ?, ?, 's')",
+        [(b, u, uid) for u, b, uid, _ in users],
+    )
+    conn.commit()
+
+
+def _per_query(conn: sqlite3.Connection, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _, sql, params in SELECT_QUERIES:
+            conn.execute(sql, params).fetchall()
+    return (time.perf_counter() - start) / (rounds * len(SELECT_QUERIES))
+
+
+def test_benchmark_200k_rows():
+    rows = 200_000
+    indexed = _connect()
+    plain = _connect(with_indexes=False)
+    _fill(indexed, rows)
+    _fill(plain, rows)
+
+    with_index = _per_query(indexed, 200)
+    without_index = _per_query(plain, 3)
+    print(f"\n{rows} 行: 有索引 {with_index * 1e6:.1f}us/次, 无索引 {without_index * 1e3:.2f}ms/次")
+    assert with_index < 0.001
+    assert with_index * 20 < without_index
@@ -0,0 +1,110 @@
+"""fuzzy_suggest 倒排召回 + 打分与全量逐个打分的一致性与延迟。"""
+
+import time
+import random
+from collections import Counter
+
+import pytest
+
+from _support import load_module
+
+fm = load_module("utils.fuzzy_match")
+
+HANZI = "里特白者妮长离今汐椿相要守岸人卡提希娅菲比珂莱塔洛可坎蕾拉赞夏空弗露帕卜灵千咲安维奈秧散华凌阳忌炎鉴心吟霖桃祈渊武丹瑾釉瑚秋水炽霞莫斐"
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _name(rng: random.Random) -> str:
+    return "".join(rng.choice(HANZI) for _ in range(rng.randint(2, 4)))
+
+
+def _table(rng: random.Random, size: int):
+    table = {}
+    while len(table) < size:
+        name = _name(rng)
+        aliases = [_name(rng) for _ in range(rng.randint(0, 3))]
+        if rng.random() < 0.3:
+            aliases.append(fm._to_pinyin(name)[: rng.randint(2, 6)])
+        table[name] = aliases
+    return table
+
+
+def _queries(rng: random.Random, table, count: int):
+    names = list(table)
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.4:
+            yield "".join(rng.choice(LETTERS) for _ in range(rng.randint(2, 8)))
+        elif kind < 0.7:
+            yield _name(rng)
+        else:
+            py = list(fm._to_pinyin(rng.choice(names)))
+            py[rng.randrange(len(py))] = rng.choice(LETTERS)
+            yield "".join(py)
+
+
+def _full_scan(query, table, top_n=3, min_score=0.7):
+    """改造前的行为: 对所有名字逐个打分"""
+    q = query.strip()
+    q_lower, q_py = q.lower(), fm._to_pinyin(q)
+    q_tokens = fm._to_pinyin_tokens(q).split()
+    index = fm._get_index(table)
+    ids = list(range(len(index.owner)))
+    scores = fm._score_shortlist(index, ids, q_lower, q_py, "".join(sorted(q_py)), Counter(q_tokens))
+    best = {}
+    for i, s in zip(ids, scores):
+        c_idx = index.owner[i]
+        cur = best.get(c_idx, 0.0)
+        if cur < 0.99 and s > cur:
+            best[c_idx] = s
+    ranked = {index.canonicals[c]: s for c, s in best.items() if s >= min_score}
+    return sorted(ranked.items(), key=lambda x: -x[1])[:top_n]
+
+
+@pytest.mark.parametrize("seed,min_score", [(1, 0.7), (2, 0.7), (3, 0.9)])
+def test_topk_matches_full_scan(seed, min_score):
+    # 召回按字母重合下界筛选, 理论上与全量打分完全一致; 容差取 0
+    rng = random.Random(seed)
+    table = _table(rng, 300)
+    queries = list(_queries(rng, table, 800))
+    mismatched = [
+        q for q in queries
+        if fm.fuzzy_suggest(q, table, top_n=3, min_score=min_score) != _full_scan(q, table, 3, min_score)
+    ]
+    assert not mismatched, mismatched[:5]
+
+
+def test_scrambled_short_pinyin_is_recalled():
+    # 4 字母、与候选拼音无公共二元组的输入也要能进入打分
+    table = {"里特": [], "白者特妮": [], "长离": ["changli"]}
+    assert fm.fuzzy_suggest("yeun", table, top_n=3) == _full_scan("yeun", table)
+
+
+def test_in_place_mutation_needs_invalidate():
+    table = {"长离": [], "今汐": []}
+    assert fm.fuzzy_suggest("changli", table)
+    del table["长离"]
+    table["椿"] = []
+    fm.invalidate_fuzzy_index()
+    assert [n for n, _ in fm.fuzzy_suggest("chun", table)] == ["椿"]
+    assert fm.fuzzy_suggest("changli", table) == []
+
+
+def test_latency_against_full_scan():
+    rng = random.Random(7)
+    table = _table(rng, 1500)
+    queries = list(_queries(rng, table, 200))
+    fm.fuzzy_suggest(queries[0], table)  # 建索引不计时
+
+    start = time.perf_counter()
+    for q in queries:
+        fm.fuzzy_suggest(q, table, top_n=3)
+    indexed = (time.perf_counter() - start) / len(queries)
+
+    start = time.perf_counter()
+    for q in queries:
+        _full_scan(q, table)
+    full = (time.perf_counter() - start) / len(queries)
+
+    print(f"\nfuzzy_suggest: 索引 {indexed * 1000:.2f}ms/次, 全量 {full * 1000:.2f}ms/次")
+    assert indexed < full
@@ -0,0 +1,124 @@
+"""抽卡记录导入 / 导出编解码与原 pydantic + json 实现的一致性。"""
+
+import json
+import random
+
+import msgspec
+import pytest
+
+from _support import load_module
+
+codec = load_module("wutheringwaves_gachalog.gacha_codec")
+model = load_module("wutheringwaves_gachalog.model")
+plugin_model = load_module("wutheringwaves_gachalog.model_for_waves_plugin")
+GachaLog = load_module("utils.api.model").GachaLog
+
+POOLS = ["角色精准调谐", "武器精准调谐", "角色调谐（常驻池）", "1", "2"]
+
+
+def _wwuid_doc(rng: random.Random, count: int):
+    items = []
+    for i in range(count):
+        item = {
+            "cardPoolType": rng.choice(POOLS),
+            "resourceId": rng.randint(21010000, 21050000),
+            "qualityLevel": rng.choice([3, 4, 5]),
+            "resourceType": rng.choice(["武器", "角色"]),
+            "name": f"名字{i}",
+            "count": 1,
+            "time": f"2025-03-{rng.randint(10, 28)} 10:19:{i % 60:02d}",
+        }
+        if rng.random() < 0.3:
+            item["note"] = f"额外字段{i}"
+        items.append(item)
+    info = {
+        "export_time": "2025-03-30 14:40:55",
+        "export_app": "XutheringWavesUID",
+        "export_app_version": "2.0.1",
+        "export_timestamp": 1743316856,
+        "version": "v1.0",
+        "uid": "101449780",
+    }
+    return {"info": info, "list": items}
+
+
+def _plugin_doc(rng: random.Random, count: int):
+    items = [
+        {
+            "gacha_id": "0001",
+            "gacha_type": rng.choice(list(plugin_model.turn_kuro_gacha_type)),
+            "item_id": str(rng.randint(21010000, 21050000)),
+            "count": "1",
+            "time": f"2025-02-13 10:08:{i % 60:02d}",
+            "name": f"名字{i}",
+            "item_type": "武器",
+            "rank_type": str(rng.choice([3, 4, 5])),
+            "id": str(1739412485000100010 + i),
+        }
+        for i in range(count)
+    ]
+    info = {
+        "lang": "zh-cn",
+        "region_time_zone": 8,
+        "export_timestamp": 1739420277878,
+        "export_app": "Waves-Plugin",
+        "export_app_version": "1.5.17",
+        "wwgf_version": "v0.1b",
+        "uid": "101356589",
+    }
+    return {"info": info, "list": items}
+
+
+def _old_decode(data):
+    """改造前: json.loads + pydantic 校验"""
+    export_app = data["info"]["export_app"]
+    if export_app == "Waves-Plugin":
+        gacha = plugin_model.WavesPluginGacha.model_validate(data).turn_wwuid_gacha()
+    else:
+        gacha = model.WWUIDGacha.model_validate(data)
+    return gacha.info.uid, [GachaLog(**item.model_dump()).model_dump() for item in gacha.list]
+
+
+def _new_decode(data):
+    uid, records = codec.decode_gacha_import(data)
+    return uid, [r.model_dump() for r in records]
+
+
+@pytest.mark.parametrize("make_doc", [_wwuid_doc, _plugin_doc])
+def test_decode_matches_pydantic(make_doc):
+    doc = make_doc(random.Random(1), 300)
+    raw = json.dumps(doc, ensure_ascii=False).encode("utf-8")
+    expected = _old_decode(json.loads(raw))
+    assert _new_decode(raw) == expected
+    assert _new_decode(raw.decode("utf-8")) == expected
+    assert _new_decode(doc) == expected
+
+
+def test_decode_keeps_extra_fields():
+    doc = _wwuid_doc(random.Random(2), 50)
+    _, records = _new_decode(json.dumps(doc, ensure_ascii=False))
+    assert [r.get("note") for r in records] == [item.get("note") for item in doc["list"]]
+
+
+def test_decode_rejects_bad_input():
+    assert codec.decode_gacha_import(b'{"info": {"export_app": "other"}, "list": []}') is None
+    assert codec.decode_gacha_import(b"[]") is None
+    with pytest.raises(msgspec.DecodeError):
+        codec.decode_gacha_import(b"{not json")
+    doc = _wwuid_doc(random.Random(3), 3)
+    doc["list"][1]["resourceId"] = "abc"
+    with pytest.raises(msgspec.ValidationError):
+        codec.decode_gacha_import(json.dumps(doc))
+
+
+def test_export_matches_json_dumps():
+    doc = _wwuid_doc(random.Random(4), 200)
+    history = {}
+    for item in doc["list"]:
+        history.setdefault(item["cardPoolType"], []).append(item)
+    expected_doc = codec.build_gacha_export(doc["info"], history)
+    expected = json.dumps(expected_doc, ensure_ascii=False, indent=4).encode("utf-8")
+    assert codec.encode_gacha_export(doc["info"], history) == expected
+    assert codec.encode_gacha_export(doc["info"], {}) == json.dumps(
+        {"info": doc["info"], "list": []}, ensure_ascii=False, indent=4
+    ).encode("utf-8")
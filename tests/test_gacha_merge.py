@@ -0,0 +1,109 @@
+"""抽卡记录合并: 滚动哈希最长公共子串与原 DP 实现的等价性与耗时。"""
+
+import time
+import random
+from datetime import datetime, timedelta
+from collections import Counter
+
+import pytest
+
+from _support import load_module
+
+gacha_merge = load_module("wutheringwaves_gachalog.gacha_merge")
+GachaLog = load_module("utils.api.model").GachaLog
+
+
+def _old_find(a, b):
+    """改造前的 O(n*m) DP"""
+    n, m = len(a), len(b)
+    dp = [[0] * (m + 1) for _ in range(n + 1)]
+    length = 0
+    a_end = b_end = 0
+    for i in range(n - 1, -1, -1):
+        for j in range(m - 1, -1, -1):
+            if a[i].match_key() == b[j].match_key():
+                dp[i][j] = dp[i + 1][j + 1] + 1
+                if dp[i][j] > length:
+                    length = dp[i][j]
+                    a_end = i + length - 1
+                    b_end = j + length - 1
+            else:
+                dp[i][j] = 0
+    if length == 0:
+        return None
+    return (a_end - length + 1, a_end), (b_end - length + 1, b_end)
+
+
+def _old_merge(a, b):
+    common_indices = _old_find(a, b)
+    if not common_indices:
+        target_counts = Counter(log.match_key() for log in a) | Counter(log.match_key() for log in b)
+        used_counts = Counter()
+        merged = []
+        for log in a + b:
+            key = log.match_key()
+            if used_counts[key] >= target_counts[key]:
+                continue
+            used_counts[key] += 1
+            merged.append(log)
+        return sorted(merged, key=lambda log: datetime.strptime(log.time, "%Y-%m-%d %H:%M:%S"), reverse=True)
+    (a_start, a_end), (b_start, b_end) = common_indices
+    prefix = _old_merge(a[:a_start], b[:b_start])
+    common_subarray = a[a_start : a_end + 1]
+    suffix = _old_merge(a[a_end + 1 :], b[b_end + 1 :])
+    return prefix + common_subarray + suffix
+
+
+def _log(rng: random.Random, base: datetime, alphabet: int) -> GachaLog:
+    # 小字母表 + 粗粒度时间, 制造大量重复记录与等长公共子串的平手情况
+    k = rng.randrange(alphabet)
+    return GachaLog(
+        cardPoolType="1",
+        resourceId=21010000 + k,
+        qualityLevel=3 + k % 3,
+        resourceType=rng.choice(["武器", "角色"]),
+        name=f"名字{k}",
+        count=1,
+        time=(base - timedelta(minutes=rng.randrange(6))).strftime("%Y-%m-%d %H:%M:%S"),
+    )
+
+
+def _pair(rng: random.Random, max_len: int, alphabet: int):
+    base = datetime(2025, 3, 1)
+    history = [_log(rng, base, alphabet) for _ in range(rng.randint(0, max_len))]
+    start = rng.randint(0, len(history))
+    b = history[start : start + rng.randint(0, max_len)]
+    b = [_log(rng, base, alphabet) for _ in range(rng.randint(0, 3))] + b
+    a = history[rng.randint(0, len(history)) :] if rng.random() < 0.5 else history
+    return a, b
+
+
+def _same(x, y) -> bool:
+    return [id(log) for log in x] == [id(log) for log in y]
+
+
+@pytest.mark.parametrize("alphabet", [2, 4, 30])
+def test_matches_old_dp(alphabet):
+    rng = random.Random(alphabet)
+    for _ in range(400):
+        a, b = _pair(rng, 25, alphabet)
+        assert gacha_merge.find_longest_common_subarray_indices(a, b) == _old_find(a, b)
+        assert _same(gacha_merge.merge_gacha_logs_by_common_subarray(a, b), _old_merge(a, b))
+
+
+def test_benchmark_against_old_dp():
+    rng = random.Random(7)
+    base = datetime(2025, 3, 1)
+    history = [_log(rng, base - timedelta(hours=i), 200) for i in range(1500)]
+    a, b = history[:1200], history[300:]
+
+    start = time.perf_counter()
+    new = gacha_merge.merge_gacha_logs_by_common_subarray(a, b)
+    new_cost = time.perf_counter() - start
+    start = time.perf_counter()
+    old = _old_merge(a, b)
+    old_cost = time.perf_counter() - start
+
+    print(f"\n1200x1200 合并: 新 {new_cost * 1000:.1f}ms, 原 DP {old_cost * 1000:.1f}ms")
+    assert _same(new, old)
+    assert new_cost < old_cost
@@ -0,0 +1,51 @@
+"""数据目录分片搬迁: 手动命令与定时任务并发调用时搬迁串行执行, 不重复搬同一目录。"""
+
+import os
+import time
+import threading
+
+from _support import load_module
+
+player_path = load_module("utils.player_path")
+
+
+def _make_flat_dirs(count: int):
+    uids = [str(100000000 + i) for i in range(count)]
+    for uid in uids:
+        path = player_path.PLAYER_PATH / uid
+        path.mkdir(parents=True)
+        (path / "rawData.json").write_text(uid, encoding="utf-8")
+    return uids
+
+
+def test_concurrent_migrations_are_serialized(monkeypatch):
+    uids = _make_flat_dirs(40)
+    rename = os.rename
+
+    def slow_rename(src, dst):
+        # 放大 scandir 与 rename 之间的窗口, 未加锁时两个线程会争抢同一目录
+        time.sleep(0.002)
+        rename(src, dst)
+
+    monkeypatch.setattr(os, "rename", slow_rename)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(player_path.migrate_player_dirs_sync()))
+        for _ in range(2)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(r[0] for r in results) == [0, len(uids)]
+    assert all(r[1] == 0 and r[2] for r in results)
+    for uid in uids:
+        assert (player_path.shard_dir(uid) / "rawData.json").read_text(encoding="utf-8") == uid
+        assert not (player_path.PLAYER_PATH / uid).exists()
+
+
+def test_no_wait_skips_while_migration_running():
+    with player_path._MIGRATE_LOCK:
+        assert player_path.migrate_player_dirs_sync(10, wait=False) == (0, 0, False)
+    assert player_path.migrate_player_dirs_sync(10, wait=False)[2]
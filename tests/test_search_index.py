@@ -0,0 +1,87 @@
+"""AI-RAG 本地 BM25 索引: 用随插件发布的 help.json 构造命令 KP, 测召回 / 延迟 / 增量 / 持久化。"""
+
+import json
+import time
+
+import pytest
+
+from _support import PLUGIN_PATH, load_module
+
+search_index = load_module("wutheringwaves_ai_rag.search_index")
+Bm25Index = search_index.Bm25Index
+
+HELP_JSON = PLUGIN_PATH / "wutheringwaves_help" / "help.json"
+
+
+def _help_kps():
+    """与 _register_help_commands 相同的 title / content / tags 组织方式"""
+    data = json.loads(HELP_JSON.read_text(encoding="utf-8"))
+    kps = []
+    for section, sd in data.items():
+        for item in sd.get("data", []) or []:
+            name = item.get("name") or "?"
+            desc = item.get("desc") or ""
+            eg = item.get("eg") or ""
+            eg_words = [w for w in eg.replace("/", " ").split() if w][:3]
+            kps.append({
+                "id": f"ww_help_{section}_{name}",
+                "title": f"鸣潮命令: {name}",
+                "content": f"**命令**: `{name}`\n**所属分组**: 鸣潮 - {section}\n**说明**: {desc}\n**用法示例**: {eg}",
+                "tags": ["鸣潮命令", "用法", "帮助", section, name, *eg_words],
+                "_name": name,
+            })
+    return kps
+
+
+@pytest.fixture(scope="module")
+def kps():
+    return _help_kps()
+
+
+@pytest.fixture(scope="module")
+def index(kps):
+    idx = Bm25Index()
+    idx.update(kps)
+    return idx
+
+
+def test_recall_by_command_name(index, kps):
+    hit = 0
+    for kp in kps:
+        ids = [doc["id"] for _, doc in index.search(kp["_name"], 5, search_index.KB_MIN_COVERAGE)]
+        hit += kp["id"] in ids
+    recall = hit / len(kps)
+    assert recall >= 0.95, f"recall@5 = {recall:.3f}"
+
+
+def test_search_latency(index, kps):
+    start = time.perf_counter()
+    for kp in kps:
+        index.search(kp["_name"], 6, search_index.KB_MIN_COVERAGE)
+    per_query = (time.perf_counter() - start) / len(kps)
+    assert per_query < 0.005, f"{per_query * 1000:.2f}ms/query"
+
+
+def test_weak_overlap_is_filtered(index):
+    # 只和大量命令共享「查询」「角色」这类常见二元组的问题不应召回任何条目
+    assert index.search("小型机械角色查询哪里刷", 6, search_index.KB_MIN_COVERAGE) == []
+    assert index.search("完全无关的问题", 6, search_index.KB_MIN_COVERAGE) == []
+
+
+def test_incremental_update(kps):
+    idx = Bm25Index()
+    assert idx.update(kps) == (len({kp["id"] for kp in kps}), 0)
+    assert idx.update(kps) == (0, 0)
+
+    changed = [dict(kp) for kp in kps[1:]]
+    changed[0]["content"] += " 新增说明"
+    assert idx.update(changed) == (1, 1)
+    assert kps[0]["id"] not in idx.docs
+
+
+def test_dump_load_roundtrip(index, kps):
+    loaded = Bm25Index.load(index.dump())
+    assert len(loaded) == len(index)
+    query = kps[0]["_name"]
+    assert [d["id"] for _, d in loaded.search(query, 5)] == [d["id"] for _, d in index.search(query, 5)]
+    assert loaded.update(kps) == (0, 0)
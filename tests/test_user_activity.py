@@ -0,0 +1,139 @@
+"""活跃度批量写入: bulk_update_user_activity 与逐条 update_user_activity 的等价性与耗时。
+
+在内存 sqlite (aiosqlite) 上按升级后的线上表结构建表: bot_self_id 由 ALTER TABLE 加列,
+可为 NULL; 唯一索引与迁移语句一致。
+"""
+
+import time
+import random
+import asyncio
+
+import pytest
+
+from _support import DB_SESSION, load_module, install_database_stub
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+if not install_database_stub():
+    pytest.skip("已安装真实 gsuid_core, 不替换其数据库会话", allow_module_level=True)
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker  # noqa: E402
+
+activity = load_module("utils.database.waves_user_activity")
+WavesUserActivity = activity.WavesUserActivity
+
+NOW = 1_700_000_000
+
+DDL = [
+    "CREATE TABLE WavesUserActivity (id INTEGER NOT NULL PRIMARY KEY, bot_id VARCHAR NOT NULL,"
+    " user_id VARCHAR NOT NULL, last_active_time INTEGER, bot_self_id TEXT DEFAULT '')",
+    'CREATE UNIQUE INDEX "ux_WavesUserActivity_user_bot_self" ON "WavesUserActivity" (user_id, bot_id, bot_self_id)',
+]
+
+
+@pytest.fixture(autouse=True)
+def _fixed_time(monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: NOW)
+
+
+async def _engine(rows):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        for stmt in DDL:
+            await conn.execute(text(stmt))
+        if rows:
+            await conn.execute(
+                text(
+                    "INSERT INTO WavesUserActivity (user_id, bot_id, bot_self_id, last_active_time) "
+                    "VALUES (:user_id, :bot_id, :bot_self_id, :t)"
+                ),
+                [dict(user_id=u, bot_id=b, bot_self_id=s, t=t) for u, b, s, t in rows],
+            )
+    DB_SESSION.factory = async_sessionmaker(engine, expire_on_commit=False)
+    return engine
+
+
+async def _dump(engine):
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT user_id, bot_id, IFNULL(bot_self_id, '<null>'), last_active_time FROM WavesUserActivity"
+            )
+        )
+        return sorted(tuple(r) for r in result.fetchall())
+
+
+def _state(rng: random.Random, users: int):
+    """随机初始数据: 新格式记录 + bot_id 里存 bot_self_id 的旧格式记录 (每个 user/self 至多一条)"""
+    rows, seen = [], set()
+    for _ in range(users):
+        u = f"u{rng.randrange(users)}"
+        b, s = rng.choice(["qq", "onebot"]), rng.choice(["s1", "s2"])
+        if rng.random() < 0.5:
+            key = (u, b, s)
+        else:
+            key = (u, s, rng.choice(["", None]))
+            if (u, s) in seen:
+                continue
+            seen.add((u, s))
+        if key in {r[:3] for r in rows}:
+            continue
+        rows.append((*key, rng.randrange(NOW)))
+    entries = [
+        (f"u{rng.randrange(users)}", rng.choice(["qq", "onebot"]), rng.choice(["s1", "s2"]))
+        for _ in range(users)
+    ]
+    return rows, entries
+
+
+async def _run_sequential(rows, entries):
+    engine = await _engine(rows)
+    for entry in entries:
+        await WavesUserActivity.update_user_activity(*entry)
+    state = await _dump(engine)
+    await engine.dispose()
+    return state
+
+
+async def _run_bulk(rows, entries, chunk_size=200):
+    engine = await _engine(rows)
+    await WavesUserActivity.bulk_update_user_activity(entries, chunk_size=chunk_size)
+    state = await _dump(engine)
+    await engine.dispose()
+    return state
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bulk_matches_sequential(seed):
+    rows, entries = _state(random.Random(seed), 60)
+    expected = asyncio.run(_run_sequential(rows, entries))
+    assert asyncio.run(_run_bulk(rows, entries, chunk_size=7)) == expected
+
+
+def test_legacy_rows_with_empty_and_null_self_id():
+    # '' 与 NULL 的旧记录同时存在时只迁移一行, 不违反唯一索引
+    rows = [("u", "s1", "", 1), ("u", "s1", None, 2)]
+    state = asyncio.run(_run_bulk(rows, [("u", "qq", "s1")]))
+    assert state == [("u", "qq", "s1", NOW), ("u", "s1", "<null>", 2)]
+    assert asyncio.run(_run_sequential(rows, [("u", "qq", "s1")])) == state
+
+
+def test_benchmark_10k_entries():
+    rng = random.Random(0)
+    rows = [(f"u{i}", "qq", "s1", 0) for i in range(0, 10_000, 2)]
+    entries = [(f"u{rng.randrange(10_000)}", "qq", "s1") for _ in range(10_000)]
+
+    start = time.perf_counter()
+    bulk_state = asyncio.run(_run_bulk(rows, entries))
+    bulk_cost = time.perf_counter() - start
+
+    sample = entries[:1000]
+    start = time.perf_counter()
+    asyncio.run(_run_sequential(rows, sample))
+    sequential_cost = (time.perf_counter() - start) * len(entries) / len(sample)
+
+    print(f"\n10k 条活跃度: 批量 {bulk_cost * 1000:.0f}ms, 逐条 (按 1k 条外推) {sequential_cost * 1000:.0f}ms")
+    assert len(bulk_state) == len({(u, b, s) for u, b, s, _ in rows} | set(entries))
+    assert bulk_cost * 5 < sequential_cost
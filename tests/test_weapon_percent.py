@@ -0,0 +1,54 @@
+"""武器参数表达式按 (武器 id, 谐振等级) 分表缓存。"""
+
+import sys
+import types
+
+import pytest
+
+from _support import PLUGIN, load_module
+
+damage = load_module("utils.damage.damage")
+
+BUILD = f"{PLUGIN}.utils.waves_build"
+
+
+@pytest.fixture
+def fake_build(monkeypatch):
+    calls = []
+
+    def calc_percent_expression(expression):
+        calls.append(expression)
+        return sum(float(p.rstrip("%")) / 100 for p in expression.split("+"))
+
+    package = types.ModuleType(BUILD)
+    package.__path__ = []
+    module = types.ModuleType(f"{BUILD}.damage")
+    module.calc_percent_expression = calc_percent_expression
+    monkeypatch.setitem(sys.modules, BUILD, package)
+    monkeypatch.setitem(sys.modules, f"{BUILD}.damage", module)
+    yield calls
+    damage._percent_tables.clear()
+
+
+def test_parsed_once_per_weapon_and_reson_level(fake_build):
+    table = damage.percent_table(21010015, 1)
+    assert damage.percent_table("21010015", 1) is table
+    assert damage.percent_table(21010015, 2) is not table
+
+    for _ in range(3):
+        assert damage.calc_weapon_percent(table, "12%+3%") == pytest.approx(0.15)
+    assert fake_build == ["12%+3%"]
+
+
+def test_missing_build_is_not_cached():
+    table = damage.percent_table(21010015, 5)
+    assert damage.calc_weapon_percent(table, "12%") == 0
+    assert "12%" not in table
+
+
+def test_reload_clears_tables(fake_build):
+    table = damage.percent_table(21010015, 1)
+    damage.calc_weapon_percent(table, "12%")
+    damage.reload_damage_module()
+    assert not table
+    assert not damage._percent_tables